@@ -67,6 +67,10 @@ from services.pregame_predictions import get_pregame_predictions
 from services.articles import load_articles, get_article
 from services.articles import get_markdown_page
 from services.postseason import get_postseason_series, build_playoff_bracket
+from services import db_pool
+from services.ttl_cache import cache_stats
+from services.fanout import Fanout
+from services.games_ticker import get_snapshot as get_ticker_snapshot
 from datetime import datetime
 from zoneinfo import ZoneInfo
 import random
@@ -106,21 +110,13 @@ app.json = _SafeJSONProvider(app)
 def inject_global_games_ticker():
     """
     Global top-of-page ticker: ALL games on today's schedule
-    (scheduled + live + final).
+    (scheduled + live + final).  Read from the background-refreshed
+    snapshot so no render waits on the schedule fetch.
     """
-    try:
-        user_tz = "America/Phoenix"
-        today_ymd = datetime.now(ZoneInfo(user_tz)).date().strftime("%Y-%m-%d")
-
-        # IMPORTANT: this returns the full day's slate; do NOT filter by status
-        ticker_games = get_games_for_date(today_ymd, tz_name=user_tz, include_live_context=False)
-    except Exception:
-        ticker_games = []
-        today_ymd = None
-
+    snap = get_ticker_snapshot(wait=False)
     return {
-        "ticker_games": ticker_games,
-        "ticker_date": today_ymd,
+        "ticker_games": snap["games"],
+        "ticker_date": snap["date"],
     }
     
 @app.template_global()
@@ -1030,10 +1026,22 @@ def home_live_games():
     return jsonify(games_list)
 
 
+@app.get("/api/cache-stats")
+def api_cache_stats():
+    """Size and hit/miss/eviction counters for every in-memory service cache."""
+    return jsonify(cache_stats())
+
+
+@app.get("/api/db-pool-stats")
+def api_db_pool_stats():
+    """Postgres pool size, checkout wait times and connection errors."""
+    return jsonify(db_pool.pool_stats())
+
+
 @app.get("/api/home-weekly-leaders")
 def home_weekly_leaders():
     """Weekly top performers pulled from statcast_pitches. Cached 1 hour."""
-    import time, psycopg
+    import time
 
     cache_key = "home_weekly_leaders"
     now = time.time()
@@ -1041,12 +1049,10 @@ def home_weekly_leaders():
     if cached and now - cached[0] < 3600:
         return jsonify(cached[1])
 
-    db_url = os.environ.get("DATABASE_URL") or os.environ.get("DATABASE_URL_PG") or ""
     result = {"top_velos": [], "top_exit_velos": [], "top_hr_dist": [], "top_performers": []}
 
     try:
-        with psycopg.connect(db_url, connect_timeout=8) as conn:
-            conn.execute("SET statement_timeout = '8000'")
+        with db_pool.connection(statement_timeout_ms=8000) as conn:
             with conn.cursor() as cur:
                 # Prefer today's data; fall back to most recent available date
                 from datetime import date as _date, timedelta as _td
@@ -1622,43 +1628,13 @@ from datetime import timedelta
 
 @app.get("/api/ticker.json")
 def ticker_json():
-    """Today's games for the global ticker bar."""
-    user_tz = "America/Phoenix"
-    today_ymd = datetime.now(ZoneInfo(user_tz)).date().strftime("%Y-%m-%d")
-    games_list = get_games_for_date(today_ymd, tz_name=user_tz, include_live_context=False)
-    # Return lightweight cards
-    cards = []
-    for g in games_list:
-        status_lc = (g.get("detailedState") or "").lower()
-        is_final = "final" in status_lc or "completed" in status_lc or "game over" in status_lc
-        cards.append({
-            "gamePk": g.get("gamePk"),
-            "statusPill": g.get("statusPill"),
-            "timeLocal": g.get("timeLocal"),
-            "isLive": g.get("isLive"),
-            "isFinal": is_final,
-            "outs": g.get("outs"),
-            "bases": g.get("bases"),
-            "away": {
-                "abbrev": g.get("away", {}).get("abbrev"),
-                "score": g.get("away", {}).get("score"),
-                "logo": g.get("away", {}).get("logo"),
-            },
-            "home": {
-                "abbrev": g.get("home", {}).get("abbrev"),
-                "score": g.get("home", {}).get("score"),
-                "logo": g.get("home", {}).get("logo"),
-            },
-        })
-    # Sort: live first, then scheduled, then final
-    def _sort_key(c):
-        if c["isLive"]:
-            return 0
-        if c["isFinal"]:
-            return 2
-        return 1
-    cards.sort(key=_sort_key)
-    return jsonify(cards)
+    """Today's games for the global ticker bar (live first, then scheduled, then final)."""
+    snap = get_ticker_snapshot()
+    resp = jsonify(snap["cards"])
+    if snap["etag"]:
+        resp.set_etag(snap["etag"])
+        resp.headers["Cache-Control"] = "no-cache"
+    return resp.make_conditional(request)
 
 @app.get("/games")
 def games():
@@ -2770,16 +2746,37 @@ def player(player_id: int):
 
     bio = get_player(player_id)
     role = get_player_role(bio)
-        # -------------------------
+    team_id = (bio.get("currentTeam") or {}).get("id")
+
+    # -------------------------
+    # Everything below only needs the bio: fetch it all at once.
+    # Season-dependent calls are added once the season is known.
+    # -------------------------
+    from services.mlb_api import get_player_full_by_game_type
+    tasks = Fanout()
+    if team_id:
+        tasks.add("team", get_team, team_id)
+    tasks.add("player_full", get_player_full, player_id)
+    tasks.add("st_full", get_player_full_by_game_type, player_id, "S")
+    tasks.add("ps_full", get_player_full_by_game_type, player_id, "P")
+    if role != "pitching":
+        tasks.add("career_hitting", get_player_career_totals, player_id, "hitting")
+    if role != "hitting":
+        tasks.add("career_pitching", get_player_career_totals, player_id, "pitching")
+    tasks.add("awards", get_player_awards, player_id)
+    tasks.add("transactions", get_player_transactions, player_id)
+    if log_year:
+        tasks.add("game_log", get_player_game_log, player_id, season=log_year)
+
+    # -------------------------
     # Stadium SVG (player current team)
     # Your filenames are nickname-only: angels.svg, blue_jays.svg, etc.
     # So we use team["teamName"] from the team endpoint.
     # -------------------------
     stadium_svg = "generic.svg"
     try:
-        team_id = (bio.get("currentTeam") or {}).get("id")
         if team_id:
-            tdata = get_team(team_id) or {}
+            tdata = tasks.get("team") or {}
             teams = tdata.get("teams") or []
             t0 = teams[0] if teams else {}
             
@@ -2807,7 +2804,7 @@ def player(player_id: int):
     # -------------------------
     # Year-by-year source (single source of truth)
     # -------------------------
-    player_full = get_player_full(player_id)
+    player_full = tasks.get("player_full")
     yby = extract_year_by_year_rows(player_full)
 
     # Build groups (same as random player)
@@ -2827,8 +2824,7 @@ def player(player_id: int):
     ps_hitting_groups = []
     ps_pitching_groups = []
     try:
-        from services.mlb_api import get_player_full_by_game_type
-        st_full = get_player_full_by_game_type(player_id, "S")
+        st_full = tasks.get("st_full")
         st_yby = extract_year_by_year_rows(st_full)
         if role != "pitching":
             st_hitting_groups = group_year_by_year(st_yby, "hitting")
@@ -2837,7 +2833,7 @@ def player(player_id: int):
     except Exception:
         pass
     try:
-        ps_full = get_player_full_by_game_type(player_id, "P")
+        ps_full = tasks.get("ps_full")
         ps_yby = extract_year_by_year_rows(ps_full)
         if role != "pitching":
             ps_hitting_groups = group_year_by_year(ps_yby, "hitting")
@@ -2914,7 +2910,19 @@ def player(player_id: int):
                 snapshot_hitting = hit_stat
                 break
 
-    
+    # -------------------------
+    # Season-dependent fetches (game log, scouting sections)
+    # -------------------------
+    if not log_year:
+        log_year = season_found or current_year
+        tasks.add("game_log", get_player_game_log, player_id, season=log_year)
+
+    season_for_scouting = int(season_found or log_year or 2025)
+    tasks.add("savant_profile", get_player_savant_profile, int(bio["id"]), season_for_scouting, min_pa=1)
+    tasks.add("hitter_pitch_profile", get_hitter_pitch_profile, player_id, season_for_scouting)
+    tasks.add("spray_data", fetch_player_spray, player_id, season_for_scouting, limit=1000)
+    tasks.add("swing_profile", get_swing_profile, player_id, season_for_scouting)
+
     # -------------------------
     # League-relative gradients (qualified pools by league)
     # -------------------------
@@ -2971,7 +2979,9 @@ def player(player_id: int):
         ck = f"{season}:{kind}:{league_short}"
         dists = _dist_cache.get(ck)
         if dists is None:
-            dists = build_stat_distributions(season, kind, league_short)
+            dists = tasks.get(f"dists:{ck}", default=None)
+            if dists is None:
+                dists = build_stat_distributions(season, kind, league_short)
             _dist_cache[ck] = dists
         arr = dists.get(key) or []
         if not arr:
@@ -2982,6 +2992,16 @@ def player(player_id: int):
             p = 1.0 - p
         return pct_to_bg(p)
 
+    # Every (season, kind, league) pool the table needs, fetched in parallel
+    for kind, groups in (("hitting", hitting_groups), ("pitching", pitching_groups)):
+        for g in (groups or []):
+            season = int(g.get("year") or 0)
+            if not season:
+                continue
+            ck = f"{season}:{kind}:{league_for_group(g)}"
+            if f"dists:{ck}" not in tasks:
+                tasks.add(f"dists:{ck}", build_stat_distributions, season, kind, league_for_group(g))
+
     # Build background maps for:
     # - snapshot card (season_found)
     # - year-by-year table rows (total + team splits)
@@ -3062,8 +3082,8 @@ def player(player_id: int):
 # -------------------------
     # Career totals (mini cards)
     # -------------------------
-    career_hitting = get_player_career_totals(player_id, "hitting") if role != "pitching" else None
-    career_pitching = get_player_career_totals(player_id, "pitching") if role != "hitting" else None
+    career_hitting = tasks.get("career_hitting") if role != "pitching" else None
+    career_pitching = tasks.get("career_pitching") if role != "hitting" else None
     
     # -------------------------
     # Awards (for year-by-year pills)
@@ -3072,7 +3092,7 @@ def player(player_id: int):
     accolades = []
     award_year_map = {}
     try:
-        awards = get_player_awards(player_id)
+        awards = tasks.get("awards")
         accolades = build_accolade_pills(awards)
         award_year_map = build_award_year_map(awards)
     except Exception:
@@ -3084,11 +3104,8 @@ def player(player_id: int):
     years = list(range(debut_year, current_year + 1))
     years.reverse()
 
-    if not log_year:
-        log_year = season_found or current_year
-
     try:
-        game_log_blocks = get_player_game_log(player_id, season=log_year)
+        game_log_blocks = tasks.get("game_log")
         game_logs = extract_game_log_rows(game_log_blocks)  # opponent abbreviations enforced in helper
     except Exception:
         game_logs = {"hitting": [], "pitching": []}
@@ -3096,24 +3113,14 @@ def player(player_id: int):
     # -------------------------
     # Transactions
     # -------------------------
-    try:
-        transactions = get_player_transactions(player_id)
-    except Exception:
-        transactions = []
-    savant_profile = {"available": True, "season": 2025, "groups": []}
+    transactions = tasks.get("transactions", default=[])
     print("DEBUG: building savant_profile", "player_id=", int(bio["id"]), "season=", season_found)
-    season_for_scouting = int(season_found or log_year or 2025)
-    player_id = int(bio["id"])  # or int(bio["id"]) depending on your bio object
-    
-    savant_profile = get_player_savant_profile(player_id, season_for_scouting, min_pa=1)
+    savant_profile = tasks.get("savant_profile")
     
     print("DEBUG: savant_profile available =", savant_profile.get("available"), "groups =", len(savant_profile.get("groups", [])))
-    hitter_pitch_profile = get_hitter_pitch_profile(player_id, season_for_scouting)
-    spray_data = fetch_player_spray(player_id, season_for_scouting, limit=1000)
-    try:
-        swing_profile = get_swing_profile(player_id, season_for_scouting)
-    except Exception:
-        swing_profile = {"available": False}
+    hitter_pitch_profile = tasks.get("hitter_pitch_profile")
+    spray_data = tasks.get("spray_data")
+    swing_profile = tasks.get("swing_profile", default={"available": False})
     
     return render_template(
         "player.html",
@@ -3528,20 +3535,15 @@ def playoff_odds():
 
     # Try database first (populated by nightly cron)
     try:
-        import psycopg
-        db_url = os.environ.get("DATABASE_URL") or ""
-        if db_url.startswith("postgres://"):
-            db_url = db_url.replace("postgres://", "postgresql://", 1)
-        if db_url:
-            with psycopg.connect(db_url, connect_timeout=5) as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        "SELECT data FROM season_projection_cache WHERE season = %s",
-                        (season,),
-                    )
-                    row = cur.fetchone()
-                    if row:
-                        raw = row[0] if isinstance(row[0], dict) else _json.loads(row[0])
+        with db_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT data FROM season_projection_cache WHERE season = %s",
+                    (season,),
+                )
+                row = cur.fetchone()
+                if row:
+                    raw = row[0] if isinstance(row[0], dict) else _json.loads(row[0])
     except Exception:
         pass  # fall through to file
 
@@ -3830,28 +3832,21 @@ def simulate_player_info(player_id: int):
         return jsonify({"ok": False, "error": str(e)})
 
 
-@app.post("/api/simulate/start")
-def simulate_start():
-    """Run a full game simulation. Returns game_id + full game data."""
-    from services.game_simulation import simulate_game
-    import uuid as _uuid
-
-    body = request.get_json(force=True) or {}
+def _sim_inputs(body: dict):
+    """Validate a simulator request body; returns (kwargs, error)."""
     away = body.get("away", {})
     home = body.get("home", {})
-    venue = body.get("venue", "NYY")
-    seed = body.get("seed")
 
     # Validate minimum data
     away_lineup = away.get("lineup", [])
     home_lineup = home.get("lineup", [])
     if len(away_lineup) < 9 or len(home_lineup) < 9:
-        return jsonify({"ok": False, "error": "Each team needs 9 batters in the lineup"})
+        return None, "Each team needs 9 batters in the lineup"
 
     away_pitcher = away.get("pitcher")
     home_pitcher = home.get("pitcher")
     if not away_pitcher or not home_pitcher:
-        return jsonify({"ok": False, "error": "Each team needs a starting pitcher"})
+        return None, "Each team needs a starting pitcher"
 
     away_bullpen = away.get("bullpen", [])
     home_bullpen = home.get("bullpen", [])
@@ -3866,20 +3861,33 @@ def simulate_start():
         all_ids.append(p.get("id"))
     all_ids = [x for x in all_ids if x]
     if len(all_ids) != len(set(all_ids)):
-        return jsonify({"ok": False, "error": "Duplicate player detected. Each player can only appear once."})
+        return None, "Duplicate player detected. Each player can only appear once."
+
+    return {
+        "away_lineup": away_lineup,
+        "home_lineup": home_lineup,
+        "away_pitcher": away_pitcher,
+        "home_pitcher": home_pitcher,
+        "away_bullpen": away_bullpen,
+        "home_bullpen": home_bullpen,
+        "venue": body.get("venue", "NYY"),
+        "season": 2026,
+        "seed": body.get("seed"),
+    }, None
+
+
+@app.post("/api/simulate/start")
+def simulate_start():
+    """Run a full game simulation. Returns game_id + full game data."""
+    from services.game_simulation import simulate_game
+
+    body = request.get_json(force=True) or {}
+    sim_kwargs, error = _sim_inputs(body)
+    if error:
+        return jsonify({"ok": False, "error": error})
 
     try:
-        result = simulate_game(
-            away_lineup=away_lineup,
-            home_lineup=home_lineup,
-            away_pitcher=away_pitcher,
-            home_pitcher=home_pitcher,
-            away_bullpen=away_bullpen,
-            home_bullpen=home_bullpen,
-            venue=venue,
-            season=2026,
-            seed=seed,
-        )
+        result = simulate_game(**sim_kwargs)
         game_id = result["game_id"]
         _sim_cache[game_id] = result
 
@@ -3888,7 +3896,32 @@ def simulate_start():
             oldest = list(_sim_cache.keys())[0]
             del _sim_cache[oldest]
 
-        return jsonify({"ok": True, "game": result})
+        # Replay checkpoints stay server-side (used by /state only)
+        game = {k: v for k, v in result.items() if k != "checkpoints"}
+        return jsonify({"ok": True, "game": game})
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return jsonify({"ok": False, "error": str(e)})
+
+
+_SIM_BATCH_MAX_GAMES = 200
+
+
+@app.post("/api/simulate/batch")
+def simulate_batch():
+    """Simulate the same matchup many times. Returns aggregate distributions."""
+    from services.game_simulation import simulate_games
+
+    body = request.get_json(force=True) or {}
+    sim_kwargs, error = _sim_inputs(body)
+    if error:
+        return jsonify({"ok": False, "error": error})
+
+    try:
+        n = max(1, min(int(body.get("n", 100)), _SIM_BATCH_MAX_GAMES))
+        # In-process: the web dyno has one worker and no cores to spare
+        return jsonify(simulate_games(n, **sim_kwargs))
     except Exception as e:
         import traceback
         traceback.print_exc()
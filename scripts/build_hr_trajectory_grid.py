@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Build the precomputed HR trajectory grid used by services/hr_park_calc.py.
+
+Simulates a ball-height-vs-distance curve for every (exit velo, launch
+angle, park air) combination and writes it as a memory-mappable .npy under
+data/.  Physics only, so it needs rebuilding only when the grid axes or the
+trajectory model change (the file name encodes the axes).
+
+Usage:
+  python scripts/build_hr_trajectory_grid.py
+  python scripts/build_hr_trajectory_grid.py --out /tmp/grid.npy
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from services.hr_park_calc import (
+    GRID_DIST, GRID_ENVS, GRID_EV, GRID_LA, build_trajectory_grid, grid_path,
+)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out", default=None, help=f"Output path (default: {grid_path()})")
+    ap.add_argument("--force", action="store_true", help="Rebuild even if the grid already exists.")
+    args = ap.parse_args()
+
+    path = args.out or grid_path()
+    if os.path.exists(path) and not args.force:
+        print(f"Grid already built: {path}")
+        sys.exit(0)
+
+    n = len(GRID_EV) * len(GRID_LA) * len(GRID_ENVS)
+    print(f"Simulating {n:,} trajectories "
+          f"({len(GRID_EV)} EV x {len(GRID_LA)} LA x {len(GRID_ENVS)} park air buckets)...")
+    t0 = time.time()
+    path = build_trajectory_grid(path)
+    print(f"Wrote {path} ({os.path.getsize(path) / 1e6:.1f} MB, "
+          f"{len(GRID_DIST)} distances) in {time.time() - t0:.1f}s")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Prebuild the all-players directory file read by services/mlb_api.py.
+
+Builds the 1990-present directory (per-season lists from data/players_cache
+or statsapi), normalizes, sorts and indexes it for autocomplete, and writes
+it to data/players_directory.bin so web workers map it instead of rebuilding
+it on every cold start.  Workers rebuild and rewrite the file themselves once
+it is older than the directory cache TTL.
+
+Usage:
+  python scripts/build_player_directory.py
+  python scripts/build_player_directory.py --out /tmp/players_directory.bin
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, ROOT)
+from services.mlb_api import build_all_players_directory, save_all_players_directory
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out", default=None, help="Output path (default: data/players_directory.bin)")
+    args = ap.parse_args()
+
+    try:
+        with open(os.path.join(ROOT, "active_players.json")) as f:
+            active_ids = json.load(f)
+    except Exception as e:
+        print(f"Warning: Could not load active_players.json: {e}")
+        active_ids = []
+
+    t0 = time.time()
+    players = build_all_players_directory(active_ids)
+    if not players:
+        print("No players fetched; leaving the existing directory file alone.")
+        sys.exit(0)
+    path = save_all_players_directory(players, path=args.out)
+    print(f"Wrote {len(players):,} players to {path} "
+          f"({os.path.getsize(path) / 1e6:.1f} MB) in {time.time() - t0:.1f}s")
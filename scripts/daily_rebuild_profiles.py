@@ -7,10 +7,14 @@ reflect yesterday's games. The web service loads these at startup,
 and Render's max-requests setting causes periodic worker restarts
 that pick up the fresh files.
 
+Also maintains the materialized rolling-form table behind
+services/recent_form.py (incremental unless --full-recent-form).
+
 Usage:
-  python scripts/daily_rebuild_profiles.py
+  python scripts/daily_rebuild_profiles.py [--full-recent-form]
 """
 
+import argparse
 import os
 import sys
 import time
@@ -24,10 +28,19 @@ STEPS = [
     ("Batter Profiles", "build_batter_profiles", "build_batter_profiles"),
     ("Pitcher Arsenal", "build_pitcher_arsenal", "build_pitcher_arsenal"),
     ("Batter Pitch-Type Profiles", "build_batter_pitch_type_profiles", "build_batter_pitch_type_profiles"),
+    ("Recent Form Table", "build_recent_form_table", "build_recent_form_table"),
 ]
 
 
 def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--full-recent-form", action="store_true",
+                    help="Rebuild the rolling-form table from scratch instead of incrementally.")
+    args = ap.parse_args()
+    step_kwargs = {
+        "build_recent_form_table": {"incremental": not args.full_recent_form},
+    }
+
     total_start = time.time()
     results = {}
 
@@ -40,7 +53,7 @@ def main():
         try:
             module = __import__(module_name)
             func = getattr(module, func_name)
-            func()
+            func(**step_kwargs.get(module_name, {}))
             elapsed = time.time() - start
             print(f"  Completed in {elapsed:.1f}s")
             results[step_name] = "success"
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Maintain the materialized rolling-form tables read by services/recent_form.py.
+
+Two tables, both built server-side from statcast_pitches:
+
+  player_form_daily    one row of raw counts per (role, player, game_date)
+  player_recent_form   14-day sums of those rows per (role, as_of_date, player),
+                       covering game_date in [as_of - 14, as_of - 1]
+
+Request-time form lookups then read one indexed row per player instead of
+aggregating raw pitches under a statement timeout.
+
+Incremental mode (the nightly default) only re-aggregates the dates the
+statcast update may have (re)ingested, i.e. only players who appeared on
+those dates.  The rolling rows are then re-summed from the small daily table,
+which also drops games that aged out of each window.
+
+Usage:
+  python scripts/game_prediction/build_recent_form_table.py            # incremental
+  python scripts/game_prediction/build_recent_form_table.py --full
+"""
+
+import argparse
+import os
+import sys
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(__file__))
+from db_utils import get_conn
+
+DAILY_TABLE = "player_form_daily"
+FORM_TABLE = "player_recent_form"
+BUILDS_TABLE = "player_recent_form_builds"
+
+WINDOW_DAYS = 14
+# The statcast cron re-pulls its last 2 days, so re-aggregate those too
+REINGEST_DAYS = 2
+# Daily rows kept (and rebuilt by --full); comfortably covers every window
+DAILY_HISTORY_DAYS = 45
+# Materialized as_of dates kept for late readers
+KEEP_AS_OF_DAYS = 7
+
+_COUNT_COLS = ["pitches", "pa", "ks", "bbs", "swings", "whiffs",
+               "chase_opps", "chases", "xwoba_sum", "xwoba_n", "barrels", "bip"]
+
+# Same definitions as the request-time queries in services/recent_form.py
+_DAILY_AGG = """
+        COUNT(*) AS pitches,
+        COUNT(*) FILTER (WHERE events IS NOT NULL AND events != '') AS pa,
+        SUM(CASE WHEN events IN ('strikeout','strikeout_double_play') THEN 1 ELSE 0 END) AS ks,
+        SUM(CASE WHEN events = 'walk' THEN 1 ELSE 0 END) AS bbs,
+        SUM(CASE WHEN description IN (
+            'swinging_strike','swinging_strike_blocked','foul_tip','missed_bunt',
+            'foul','foul_bunt','hit_into_play'
+        ) THEN 1 ELSE 0 END) AS swings,
+        SUM(CASE WHEN description IN (
+            'swinging_strike','swinging_strike_blocked','foul_tip','missed_bunt'
+        ) THEN 1 ELSE 0 END) AS whiffs,
+        SUM(CASE WHEN zone IN (11,12,13,14) THEN 1 ELSE 0 END) AS chase_opps,
+        SUM(CASE WHEN zone IN (11,12,13,14) AND description IN (
+            'swinging_strike','swinging_strike_blocked','foul_tip','missed_bunt',
+            'foul','foul_bunt','hit_into_play'
+        ) THEN 1 ELSE 0 END) AS chases,
+        COALESCE(SUM(estimated_woba_using_speedangle), 0) AS xwoba_sum,
+        COUNT(estimated_woba_using_speedangle) AS xwoba_n,
+        SUM(CASE WHEN launch_speed >= 98 AND launch_angle BETWEEN 26 AND 30 THEN 1 ELSE 0 END) AS barrels,
+        SUM(CASE WHEN events IN (
+            'single','double','triple','home_run','field_out',
+            'grounded_into_double_play','double_play','fielders_choice',
+            'fielders_choice_out','force_out','field_error','sac_fly'
+        ) THEN 1 ELSE 0 END) AS bip
+"""
+
+
+def ensure_tables(cur):
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS {DAILY_TABLE} (
+            role TEXT NOT NULL,
+            player_id INTEGER NOT NULL,
+            game_date DATE NOT NULL,
+            pitches INTEGER, pa INTEGER, ks INTEGER, bbs INTEGER,
+            swings INTEGER, whiffs INTEGER, chase_opps INTEGER, chases INTEGER,
+            xwoba_sum DOUBLE PRECISION, xwoba_n INTEGER,
+            barrels INTEGER, bip INTEGER,
+            PRIMARY KEY (role, player_id, game_date)
+        )
+    """)
+    cur.execute(f"CREATE INDEX IF NOT EXISTS {DAILY_TABLE}_date_idx ON {DAILY_TABLE} (game_date)")
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS {FORM_TABLE} (
+            role TEXT NOT NULL,
+            as_of_date DATE NOT NULL,
+            window_days INTEGER NOT NULL,
+            player_id INTEGER NOT NULL,
+            pitches INTEGER, pa INTEGER, ks INTEGER, bbs INTEGER,
+            swings INTEGER, whiffs INTEGER, chase_opps INTEGER, chases INTEGER,
+            xwoba DOUBLE PRECISION,
+            barrels INTEGER, bip INTEGER,
+            PRIMARY KEY (role, as_of_date, window_days, player_id)
+        )
+    """)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS {BUILDS_TABLE} (
+            as_of_date DATE NOT NULL,
+            window_days INTEGER NOT NULL,
+            players INTEGER,
+            built_at TIMESTAMPTZ DEFAULT now(),
+            PRIMARY KEY (as_of_date, window_days)
+        )
+    """)
+
+
+def refresh_daily(cur, start, end):
+    """Re-aggregate [start, end] into the daily table; returns players touched."""
+    cur.execute(f"DELETE FROM {DAILY_TABLE} WHERE game_date BETWEEN %s AND %s", (start, end))
+    cols = ", ".join(_COUNT_COLS)
+    for role in ("batter", "pitcher"):
+        cur.execute(f"""
+            INSERT INTO {DAILY_TABLE} (role, player_id, game_date, {cols})
+            SELECT %s, {role}, game_date, {_DAILY_AGG}
+            FROM statcast_pitches
+            WHERE game_date BETWEEN %s AND %s
+              AND game_type = 'R'
+              AND {role} IS NOT NULL
+            GROUP BY {role}, game_date
+        """, (role, start, end))
+    cur.execute(f"""
+        SELECT COUNT(DISTINCT (role, player_id)) FROM {DAILY_TABLE}
+        WHERE game_date BETWEEN %s AND %s
+    """, (start, end))
+    return cur.fetchone()[0]
+
+
+def refresh_rolling(cur, as_of, window_days=WINDOW_DAYS):
+    """Rebuild every player's rolling row for `as_of` from the daily table."""
+    end = as_of - timedelta(days=1)
+    start = end - timedelta(days=window_days - 1)
+    cur.execute(f"DELETE FROM {FORM_TABLE} WHERE as_of_date = %s AND window_days = %s",
+                (as_of, window_days))
+    cur.execute(f"""
+        INSERT INTO {FORM_TABLE} (
+            role, as_of_date, window_days, player_id,
+            pitches, pa, ks, bbs, swings, whiffs, chase_opps, chases,
+            xwoba, barrels, bip
+        )
+        SELECT role, %s, %s, player_id,
+               SUM(pitches), SUM(pa), SUM(ks), SUM(bbs), SUM(swings), SUM(whiffs),
+               SUM(chase_opps), SUM(chases),
+               SUM(xwoba_sum) / NULLIF(SUM(xwoba_n), 0),
+               SUM(barrels), SUM(bip)
+        FROM {DAILY_TABLE}
+        WHERE game_date BETWEEN %s AND %s
+        GROUP BY role, player_id
+    """, (as_of, window_days, start, end))
+    players = cur.rowcount
+    cur.execute(f"""
+        INSERT INTO {BUILDS_TABLE} (as_of_date, window_days, players, built_at)
+        VALUES (%s, %s, %s, now())
+        ON CONFLICT (as_of_date, window_days) DO UPDATE SET
+            players = EXCLUDED.players,
+            built_at = now()
+    """, (as_of, window_days, players))
+    return players
+
+
+def build_recent_form_table(incremental=True, today=None):
+    today = today or date.today()
+
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            ensure_tables(cur)
+            conn.commit()
+
+            cur.execute(f"SELECT MAX(game_date) FROM {DAILY_TABLE}")
+            last = cur.fetchone()[0]
+            if incremental and last is not None:
+                start = min(last, today) - timedelta(days=REINGEST_DAYS - 1)
+                print(f"Incremental: re-aggregating {start} .. {today}")
+            else:
+                start = today - timedelta(days=DAILY_HISTORY_DAYS)
+                print(f"Full rebuild: aggregating {start} .. {today}")
+                cur.execute(f"DELETE FROM {DAILY_TABLE}")
+
+            touched = refresh_daily(cur, start, today)
+            print(f"  {touched:,} player-roles appeared in the refreshed dates")
+
+            # Today's as_of serves requests now; tomorrow's serves the hours
+            # after midnight before the next statcast update lands (its window
+            # holds exactly the data that will be in the table until then)
+            for as_of in (today, today + timedelta(days=1)):
+                players = refresh_rolling(cur, as_of)
+                print(f"  {FORM_TABLE} as_of {as_of}: {players:,} rows")
+
+            cutoff = today - timedelta(days=KEEP_AS_OF_DAYS)
+            cur.execute(f"DELETE FROM {FORM_TABLE} WHERE as_of_date < %s", (cutoff,))
+            cur.execute(f"DELETE FROM {BUILDS_TABLE} WHERE as_of_date < %s", (cutoff,))
+            cur.execute(f"DELETE FROM {DAILY_TABLE} WHERE game_date < %s",
+                        (today - timedelta(days=DAILY_HISTORY_DAYS),))
+        conn.commit()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--full", action="store_true",
+                    help=f"Rebuild the last {DAILY_HISTORY_DAYS} days instead of only newly ingested dates.")
+    args = ap.parse_args()
+    build_recent_form_table(incremental=not args.full)
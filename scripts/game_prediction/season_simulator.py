@@ -24,7 +24,6 @@ import requests
 import pandas as pd
 import numpy as np
 from datetime import date, datetime, timedelta
-from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
@@ -198,173 +197,202 @@ def load_team_data(season: int) -> Dict[int, TeamState]:
     return teams
 
 
-def determine_playoff_teams(team_states: Dict[int, TeamState]) -> Dict:
-    """Determine playoff qualifiers from final standings."""
+@dataclass
+class TeamColumns:
+    """Columnar (one array slot per team) view of the TeamStates.
+
+    Built once per run; simulations only ever produce win arrays on top of it.
+    """
+    team_ids: np.ndarray
+    wins: np.ndarray
+    losses: np.ndarray
+    runs_scored_pg: np.ndarray
+    runs_allowed_pg: np.ndarray
+    home_park_run_factor: np.ndarray
+    catcher_framing: np.ndarray
+    index: Dict[int, int]
+    divisions: Dict[str, np.ndarray]  # div name -> team indices, DIVISIONS order
+
+    @classmethod
+    def from_states(cls, team_states: Dict[int, TeamState]) -> "TeamColumns":
+        ids = [tid for team_ids in DIVISIONS.values() for tid in team_ids if tid in team_states]
+        index = {tid: i for i, tid in enumerate(ids)}
+        states = [team_states[tid] for tid in ids]
+        return cls(
+            team_ids=np.array(ids),
+            wins=np.array([ts.wins for ts in states], dtype=np.int64),
+            losses=np.array([ts.losses for ts in states], dtype=np.int64),
+            runs_scored_pg=np.array([ts.runs_scored_pg for ts in states], dtype=np.float64),
+            runs_allowed_pg=np.array([ts.runs_allowed_pg for ts in states], dtype=np.float64),
+            home_park_run_factor=np.array([ts.home_park_run_factor for ts in states], dtype=np.float64),
+            catcher_framing=np.array([ts.catcher_framing for ts in states], dtype=np.float64),
+            index=index,
+            divisions={
+                div_name: np.array([index[tid] for tid in team_ids if tid in index])
+                for div_name, team_ids in DIVISIONS.items()
+            },
+        )
+
+
+# Sims per vectorized batch (bounds the sims x games run matrices)
+BATCH_SIMS = 1000
+
+# Round hierarchy for counting "at least made it to X"
+ROUND_DEPTH = {"wc": 1, "div_winner": 1, "ds": 2, "cs": 3, "ws": 4, "champion": 5}
+
+
+def _rank_desc(wins: np.ndarray) -> np.ndarray:
+    """Column order by wins, most first; ties keep column order (same as a
+    stable sort with reverse=True)."""
+    return np.argsort(-wins, axis=1, kind="stable")
+
+
+def _play_until_decided(home_exp: np.ndarray, away_exp: np.ndarray, rng) -> np.ndarray:
+    """Poisson runs for each game (any shape); True where the home team won.
+
+    Ties go to extra innings: both teams keep adding Poisson(0.5) until
+    someone leads.
+    """
+    home_runs = rng.poisson(home_exp)
+    away_runs = rng.poisson(away_exp)
+    tied = home_runs == away_runs
+    while tied.any():
+        n = int(tied.sum())
+        home_runs[tied] += rng.poisson(0.5, n)
+        away_runs[tied] += rng.poisson(0.5, n)
+        tied = home_runs == away_runs
+    return home_runs > away_runs
+
+
+def determine_playoff_teams(cols: TeamColumns, wins: np.ndarray) -> Dict:
+    """Determine playoff qualifiers from final standings of a batch of sims.
+
+    wins: (n_sims, n_teams).  Returns per-sim team indices:
+    division_winners {div_name: (n_sims,)} and wild_cards {"AL"/"NL": (n_sims, 3)}.
+    """
     results = {
         "division_winners": {},
-        "wild_cards": {"AL": [], "NL": []},
+        "wild_cards": {"AL": None, "NL": None},
     }
 
-    for div_name, team_ids in DIVISIONS.items():
-        league = "AL" if div_name.startswith("AL") else "NL"
-
-        # Sort by wins descending
-        div_teams = [(tid, team_states[tid]) for tid in team_ids]
-        div_teams.sort(key=lambda x: x[1].wins, reverse=True)
-
-        # Division winner
-        winner_id = div_teams[0][0]
-        results["division_winners"][div_name] = winner_id
+    for div_name, members in cols.divisions.items():
+        results["division_winners"][div_name] = members[_rank_desc(wins[:, members])[:, 0]]
 
     # Wild cards: top 3 non-division-winners per league
-    div_winners = set(results["division_winners"].values())
-
     for league_prefix in ["AL", "NL"]:
-        league_teams = []
-        for div_name, team_ids in DIVISIONS.items():
-            if not div_name.startswith(league_prefix):
-                continue
-            for tid in team_ids:
-                if tid not in div_winners:
-                    league_teams.append((tid, team_states[tid]))
-
-        league_teams.sort(key=lambda x: x[1].wins, reverse=True)
-        results["wild_cards"][league_prefix] = [t[0] for t in league_teams[:3]]
+        div_names = [d for d in cols.divisions if d.startswith(league_prefix)]
+        league = np.concatenate([cols.divisions[d] for d in div_names])
+        winners = np.stack([results["division_winners"][d] for d in div_names], axis=1)
+        league_wins = wins[:, league].astype(np.float64)
+        league_wins[(league[None, :, None] == winners[:, None, :]).any(axis=2)] = -np.inf
+        results["wild_cards"][league_prefix] = league[_rank_desc(league_wins)[:, :3]]
 
     return results
 
 
-def simulate_series(team_a_id: int, team_b_id: int, games: int,
-                    team_states: Dict[int, "TeamState"],
-                    league_avg_rpg: float = 4.5) -> int:
-    """Simulate a best-of-N playoff series using runs-based model. Returns winner's team_id."""
+def simulate_series(team_a: np.ndarray, team_b: np.ndarray, games: int,
+                    cols: TeamColumns, league_avg_rpg: float, rng) -> np.ndarray:
+    """Simulate a best-of-N playoff series in every sim of a batch using the
+    runs-based model.  team_a/team_b are team indices; returns winners."""
     wins_needed = (games // 2) + 1
-    a_wins = 0
-    b_wins = 0
-
-    a = team_states[team_a_id]
-    b = team_states[team_b_id]
-
-    game_num = 0
-    while a_wins < wins_needed and b_wins < wins_needed:
-        game_num += 1
+    a_wins = np.zeros(len(team_a), dtype=np.int64)
+    b_wins = np.zeros(len(team_a), dtype=np.int64)
+
+    # Odds-ratio run expectation for each side, home and away
+    a_rs, a_ra = cols.runs_scored_pg[team_a], cols.runs_allowed_pg[team_a]
+    b_rs, b_ra = cols.runs_scored_pg[team_b], cols.runs_allowed_pg[team_b]
+    a_base = a_rs * b_ra / league_avg_rpg
+    b_base = b_rs * a_ra / league_avg_rpg
+
+    for game_num in range(1, games + 1):
+        live = (a_wins < wins_needed) & (b_wins < wins_needed)
+        if not live.any():
+            break
         # Home field pattern: team_a home for games 1,2,5,7
         if games == 3:  # Wild Card round: 1,2 home, 3 away
             a_is_home = game_num <= 2
         else:  # 5-game or 7-game: 1,2 home, 3,4 away, 5,6,7 home
             a_is_home = game_num in (1, 2, 5, 6, 7)
 
-        # Odds-ratio run expectation
-        if a_is_home:
-            a_exp = a.runs_scored_pg * b.runs_allowed_pg / league_avg_rpg + 0.25
-            b_exp = b.runs_scored_pg * a.runs_allowed_pg / league_avg_rpg - 0.25
-        else:
-            b_exp = b.runs_scored_pg * a.runs_allowed_pg / league_avg_rpg + 0.25
-            a_exp = a.runs_scored_pg * b.runs_allowed_pg / league_avg_rpg - 0.25
+        hfa = 0.25 if a_is_home else -0.25
+        a_exp = np.maximum(1.5, a_base[live] + hfa)
+        b_exp = np.maximum(1.5, b_base[live] - hfa)
+        a_won = _play_until_decided(a_exp, b_exp, rng)
+        a_wins[live] += a_won
+        b_wins[live] += ~a_won
 
-        a_exp = max(1.5, a_exp)
-        b_exp = max(1.5, b_exp)
+    return np.where(a_wins >= wins_needed, team_a, team_b)
 
-        a_runs = np.random.poisson(a_exp)
-        b_runs = np.random.poisson(b_exp)
 
-        while a_runs == b_runs:
-            a_runs += np.random.poisson(0.5)
-            b_runs += np.random.poisson(0.5)
-
-        if a_runs > b_runs:
-            a_wins += 1
-        else:
-            b_wins += 1
-
-    return team_a_id if a_wins >= wins_needed else team_b_id
+def simulate_postseason(cols: TeamColumns, wins: np.ndarray, playoffs: Dict,
+                        league_avg_rpg: float, rng) -> np.ndarray:
+    """Simulate the full postseason bracket for a batch of sims.
 
+    Returns (n_sims, n_teams) ROUND_DEPTH of the deepest round each team
+    reached (0 = missed the playoffs).
+    """
+    m = wins.shape[0]
+    rows = np.arange(m)
+    depth = np.zeros(wins.shape, dtype=np.int8)
 
-def simulate_postseason(team_states: Dict[int, "TeamState"],
-                        playoffs: Dict,
-                        league_avg_rpg: float = 4.5) -> Dict[int, str]:
-    """Simulate full postseason bracket. Returns {team_id: deepest_round_reached}.
+    def _reach(team_idx, round_name):
+        depth[rows, team_idx] = np.maximum(depth[rows, team_idx], ROUND_DEPTH[round_name])
 
-    Rounds: 'wc', 'ds', 'cs', 'ws', 'champion'
-    """
-    advancement = {}  # team_id -> deepest round
-    pennant_winners = {}  # "AL"/"NL" -> team_id
+    def _home_first(t1, t2):
+        # Higher seed (more wins) gets home field
+        t1_home = wins[rows, t1] >= wins[rows, t2]
+        return np.where(t1_home, t1, t2), np.where(t1_home, t2, t1)
 
+    pennant_winners = {}
     for league in ["AL", "NL"]:
-        # Get division winners sorted by wins (for seeding)
-        div_winner_ids = []
-        for div_name in sorted(DIVISIONS.keys()):
-            if not div_name.startswith(league):
-                continue
-            winner = playoffs["division_winners"].get(div_name)
-            if winner:
-                div_winner_ids.append(winner)
-
-        div_winner_ids.sort(key=lambda t: team_states[t].wins, reverse=True)
-        wc_ids = playoffs["wild_cards"].get(league, [])
+        # Division winners sorted by wins (for seeding)
+        div_names = [d for d in sorted(cols.divisions) if d.startswith(league)]
+        div_winners = np.stack([playoffs["division_winners"][d] for d in div_names], axis=1)
+        div_winners = np.take_along_axis(div_winners, _rank_desc(wins[rows[:, None], div_winners]), axis=1)
+        wc_ids = playoffs["wild_cards"][league]
 
         # All playoff teams start with at least "made playoffs"
-        for tid in div_winner_ids:
-            advancement[tid] = "div_winner"
-        for tid in wc_ids:
-            advancement[tid] = "wc"
+        for k in range(div_winners.shape[1]):
+            _reach(div_winners[:, k], "div_winner")
+        for k in range(wc_ids.shape[1]):
+            _reach(wc_ids[:, k], "wc")
 
-        if len(div_winner_ids) < 3 or len(wc_ids) < 3:
+        if div_winners.shape[1] < 3 or wc_ids.shape[1] < 3:
             continue
 
         # Seeds: 1=best div winner, 2=2nd, 3=3rd, 4=WC1, 5=WC2, 6=WC3
-        seed1, seed2, seed3 = div_winner_ids[0], div_winner_ids[1], div_winner_ids[2]
-        wc1, wc2, wc3 = wc_ids[0], wc_ids[1], wc_ids[2]
-
-        # --- Wild Card Round (best of 3) ---
-        # Seed 3 vs WC3 (worst WC), Seed 2 vs WC2 (middle WC)
-        # Seed 1 gets bye? No — current MLB format: no byes.
-        # Actual format: #3 vs #6, #4 vs #5, #1 vs #4/5 winner? No.
-        # Current MLB (2024+): WC round = #3 vs #6, #4 vs #5 (best of 3)
-        # DS: #1 vs winner(#4/#5), #2 vs winner(#3/#6) (best of 5)
-        wc_a_winner = simulate_series(seed3, wc3, 3, team_states, league_avg_rpg)  # 3 vs 6
-        wc_b_winner = simulate_series(wc1, wc2, 3, team_states, league_avg_rpg)    # 4 vs 5
-
-        # Losers stay at "wc" round
-        wc_a_loser = wc3 if wc_a_winner == seed3 else seed3
-        wc_b_loser = wc2 if wc_b_winner == wc1 else wc1
-
-        # Winners advance to DS
-        advancement[wc_a_winner] = "ds"
-        advancement[wc_b_winner] = "ds"
+        seed1, seed2, seed3 = div_winners[:, 0], div_winners[:, 1], div_winners[:, 2]
+        wc1, wc2, wc3 = wc_ids[:, 0], wc_ids[:, 1], wc_ids[:, 2]
+
+        # --- Wild Card Round (best of 3) --- #3 vs #6, #4 vs #5
+        wc_a_winner = simulate_series(seed3, wc3, 3, cols, league_avg_rpg, rng)
+        wc_b_winner = simulate_series(wc1, wc2, 3, cols, league_avg_rpg, rng)
+        _reach(wc_a_winner, "ds")
+        _reach(wc_b_winner, "ds")
 
         # --- Division Series (best of 5) ---
         # #1 vs WC_B winner (4/5 bracket), #2 vs WC_A winner (3/6 bracket)
-        ds_a_winner = simulate_series(seed1, wc_b_winner, 5, team_states, league_avg_rpg)
-        ds_b_winner = simulate_series(seed2, wc_a_winner, 5, team_states, league_avg_rpg)
-
-        advancement[ds_a_winner] = "cs"
-        advancement[ds_b_winner] = "cs"
+        ds_a_winner = simulate_series(seed1, wc_b_winner, 5, cols, league_avg_rpg, rng)
+        ds_b_winner = simulate_series(seed2, wc_a_winner, 5, cols, league_avg_rpg, rng)
+        _reach(ds_a_winner, "cs")
+        _reach(ds_b_winner, "cs")
 
         # --- Championship Series (best of 7) ---
-        # Higher seed gets home field
-        if team_states[ds_a_winner].wins >= team_states[ds_b_winner].wins:
-            cs_winner = simulate_series(ds_a_winner, ds_b_winner, 7, team_states, league_avg_rpg)
-        else:
-            cs_winner = simulate_series(ds_b_winner, ds_a_winner, 7, team_states, league_avg_rpg)
-
-        advancement[cs_winner] = "ws"
+        cs_winner = simulate_series(*_home_first(ds_a_winner, ds_b_winner), 7, cols, league_avg_rpg, rng)
+        _reach(cs_winner, "ws")
         pennant_winners[league] = cs_winner
 
     # --- World Series (best of 7) ---
     if "AL" in pennant_winners and "NL" in pennant_winners:
-        al_p, nl_p = pennant_winners["AL"], pennant_winners["NL"]
-        if team_states[al_p].wins >= team_states[nl_p].wins:
-            ws_winner = simulate_series(al_p, nl_p, 7, team_states, league_avg_rpg)
-        else:
-            ws_winner = simulate_series(nl_p, al_p, 7, team_states, league_avg_rpg)
-        advancement[ws_winner] = "champion"
+        ws_winner = simulate_series(*_home_first(pennant_winners["AL"], pennant_winners["NL"]),
+                                    7, cols, league_avg_rpg, rng)
+        _reach(ws_winner, "champion")
 
-    return advancement
+    return depth
 
 
 def simulate_season(season: int, n_sims: int = 1000,
-                    after_date: str = None) -> Dict:
+                    after_date: str = None, seed: Optional[int] = None) -> Dict:
     """Run full season Monte Carlo simulation."""
 
     print(f"Loading schedule for {season}...")
@@ -382,16 +410,9 @@ def simulate_season(season: int, n_sims: int = 1000,
 
     print("Loading team data...")
     base_teams = load_team_data(season)
-
-    # Track results across simulations
-    season_results = defaultdict(lambda: {"wins": [], "losses": [],
-                                            "made_playoffs": 0,
-                                            "won_division": 0,
-                                            "won_wild_card": 0,
-                                            "made_ds": 0,
-                                            "made_cs": 0,
-                                            "made_ws": 0,
-                                            "won_ws": 0})
+    cols = TeamColumns.from_states(base_teams)
+    n_teams = len(cols.team_ids)
+    rng = np.random.default_rng(seed)
 
     # Compute league average R/G for odds-ratio normalization
     all_rs = [ts.runs_scored_pg for ts in base_teams.values()]
@@ -399,109 +420,58 @@ def simulate_season(season: int, n_sims: int = 1000,
     league_avg_rpg = (np.mean(all_rs) + np.mean(all_ra)) / 2
     print(f"  League avg R/G: {league_avg_rpg:.2f}")
 
-    print(f"\nRunning {n_sims} season simulations...")
-
-    for sim_num in range(n_sims):
-        if (sim_num + 1) % 100 == 0:
-            print(f"  Simulation {sim_num + 1}/{n_sims}")
-
-        # Copy team states for this simulation
-        team_states = {}
-        for tid, ts in base_teams.items():
-            team_states[tid] = TeamState(
-                team_id=tid,
-                wins=ts.wins,
-                losses=ts.losses,
-                rotation=ts.rotation[:],
-                lineup=ts.lineup[:],
-                bullpen=[b.copy() for b in ts.bullpen],
-                catcher_framing=ts.catcher_framing,
-                home_park_run_factor=ts.home_park_run_factor,
-                home_park_hr_factor=ts.home_park_hr_factor,
-                runs_scored_pg=ts.runs_scored_pg,
-                runs_allowed_pg=ts.runs_allowed_pg,
-            )
-
-        # Simulate each remaining game using runs-based model
-        # Odds-ratio method: expected runs = (team_offense * opp_pitching) / league_avg
-        # This naturally produces zero-sum results (every game has exactly 1 winner)
-        for game in remaining:
-            home_id = game["home_team_id"]
-            away_id = game["away_team_id"]
-
-            if home_id not in team_states or away_id not in team_states:
-                continue
-
-            home = team_states[home_id]
-            away = team_states[away_id]
-
-            # Odds-ratio run expectation:
-            # Home expected runs = home_RS * away_RA / league_avg_rpg
-            # Away expected runs = away_RS * home_RA / league_avg_rpg
-            home_exp_runs = home.runs_scored_pg * away.runs_allowed_pg / league_avg_rpg
-            away_exp_runs = away.runs_scored_pg * home.runs_allowed_pg / league_avg_rpg
+    # Remaining games as index arrays; expected runs don't change between
+    # sims, so they are computed once for the whole schedule.
+    # Odds-ratio method: expected runs = (team_offense * opp_pitching) / league_avg
+    # This naturally produces zero-sum results (every game has exactly 1 winner)
+    sched = [(cols.index[g["home_team_id"]], cols.index[g["away_team_id"]]) for g in remaining
+             if g["home_team_id"] in cols.index and g["away_team_id"] in cols.index]
+    home = np.array([h for h, _ in sched], dtype=np.int64)
+    away = np.array([a for _, a in sched], dtype=np.int64)
+    park = cols.home_park_run_factor[home]
+    # Home field advantage: +0.25 runs for home, -0.25 for away; floor at 1.5
+    home_exp = np.maximum(1.5, cols.runs_scored_pg[home] * cols.runs_allowed_pg[away] / league_avg_rpg * park + 0.25)
+    away_exp = np.maximum(1.5, cols.runs_scored_pg[away] * cols.runs_allowed_pg[home] / league_avg_rpg * park - 0.25)
 
-            # Home field advantage: +0.25 runs for home, -0.25 for away
-            home_exp_runs += 0.25
-            away_exp_runs -= 0.25
-
-            # Floor at 1.5 runs expected
-            home_exp_runs = max(1.5, home_exp_runs)
-            away_exp_runs = max(1.5, away_exp_runs)
+    # Track results across simulations
+    all_wins = np.empty((n_sims, n_teams), dtype=np.int16)
+    counts = {k: np.zeros(n_teams, dtype=np.int64) for k in (
+        "made_playoffs", "won_division", "won_wild_card", "made_ds", "made_cs", "made_ws", "won_ws")}
 
-            # Sample runs from Poisson distribution
-            home_runs = np.random.poisson(home_exp_runs)
-            away_runs = np.random.poisson(away_exp_runs)
+    print(f"\nRunning {n_sims} season simulations...")
 
-            # Handle ties with extra innings (keep re-rolling until someone wins)
-            while home_runs == away_runs:
-                # Extra innings: each team scores ~0.5 runs per extra inning on avg
-                home_runs += np.random.poisson(0.5)
-                away_runs += np.random.poisson(0.5)
+    for start in range(0, n_sims, BATCH_SIMS):
+        m = min(BATCH_SIMS, n_sims - start)
+        print(f"  Simulations {start + 1}-{start + m}/{n_sims}")
 
-            if home_runs > away_runs:
-                home.wins += 1
-                away.losses += 1
-            else:
-                home.losses += 1
-                away.wins += 1
+        # Every remaining game of every sim in the batch in one step
+        home_won = _play_until_decided(np.broadcast_to(home_exp, (m, len(home))),
+                                       np.broadcast_to(away_exp, (m, len(away))), rng)
+        winner = np.where(home_won, home, away)
+        offsets = (np.arange(m) * n_teams)[:, None]
+        wins = cols.wins + np.bincount((winner + offsets).ravel(),
+                                       minlength=m * n_teams).reshape(m, n_teams)
+        all_wins[start:start + m] = wins
 
         # Determine playoffs and simulate postseason
-        playoffs = determine_playoff_teams(team_states)
-        postseason = simulate_postseason(team_states, playoffs, league_avg_rpg)
-
-        # Record results
-        # Round hierarchy for counting "at least made it to X"
-        ROUND_DEPTH = {"wc": 1, "div_winner": 1, "ds": 2, "cs": 3, "ws": 4, "champion": 5}
-
-        for tid, ts in team_states.items():
-            season_results[tid]["wins"].append(ts.wins)
-            season_results[tid]["losses"].append(ts.losses)
-
-            deepest = postseason.get(tid)
-            if deepest is None:
-                continue  # didn't make playoffs
-
-            depth = ROUND_DEPTH.get(deepest, 0)
-
-            season_results[tid]["made_playoffs"] += 1
-
-            # Division winner vs wild card
-            is_div_winner = tid in playoffs["division_winners"].values()
-            if is_div_winner:
-                season_results[tid]["won_division"] += 1
-            else:
-                season_results[tid]["won_wild_card"] += 1
-
-            # Postseason advancement
-            if depth >= 2:
-                season_results[tid]["made_ds"] += 1
-            if depth >= 3:
-                season_results[tid]["made_cs"] += 1
-            if depth >= 4:
-                season_results[tid]["made_ws"] += 1
-            if depth >= 5:
-                season_results[tid]["won_ws"] += 1
+        playoffs = determine_playoff_teams(cols, wins)
+        depth = simulate_postseason(cols, wins, playoffs, league_avg_rpg, rng)
+
+        is_div_winner = np.zeros(wins.shape, dtype=bool)
+        for div_winner in playoffs["division_winners"].values():
+            is_div_winner[np.arange(m), div_winner] = True
+        made = depth >= 1
+        counts["made_playoffs"] += made.sum(axis=0)
+        counts["won_division"] += (made & is_div_winner).sum(axis=0)
+        counts["won_wild_card"] += (made & ~is_div_winner).sum(axis=0)
+        counts["made_ds"] += (depth >= 2).sum(axis=0)
+        counts["made_cs"] += (depth >= 3).sum(axis=0)
+        counts["made_ws"] += (depth >= 4).sum(axis=0)
+        counts["won_ws"] += (depth >= 5).sum(axis=0)
+
+    # Every remaining game produces one win and one loss
+    games_left = np.bincount(home, minlength=n_teams) + np.bincount(away, minlength=n_teams)
+    all_losses = cols.losses + games_left - (all_wins - cols.wins)
 
     # Compile results
     print(f"\n{'='*70}")
@@ -514,29 +484,28 @@ def simulate_season(season: int, n_sims: int = 1000,
         div_results = []
 
         for tid in team_ids:
-            r = season_results[tid]
-            wins = r["wins"]
-            current = base_teams.get(tid)
-            current_w = current.wins if current else 0
-            current_l = current.losses if current else 0
+            i = cols.index.get(tid)
+            if i is None:
+                continue
+            wins = all_wins[:, i]
             div_results.append({
                 "team_id": tid,
                 "abbrev": TEAM_ABBREVS.get(tid, str(tid)),
                 "name": TEAM_NAMES.get(tid, str(tid)),
-                "current_wins": current_w,
-                "current_losses": current_l,
+                "current_wins": int(cols.wins[i]),
+                "current_losses": int(cols.losses[i]),
                 "avg_wins": np.mean(wins),
-                "avg_losses": np.mean(r["losses"]),
+                "avg_losses": np.mean(all_losses[:, i]),
                 "win_std": np.std(wins),
                 "p10_wins": np.percentile(wins, 10),
                 "p90_wins": np.percentile(wins, 90),
-                "playoff_pct": r["made_playoffs"] / n_sims,
-                "division_pct": r["won_division"] / n_sims,
-                "wild_card_pct": r["won_wild_card"] / n_sims,
-                "ds_pct": r["made_ds"] / n_sims,
-                "cs_pct": r["made_cs"] / n_sims,
-                "ws_pct": r["made_ws"] / n_sims,
-                "win_ws_pct": r["won_ws"] / n_sims,
+                "playoff_pct": counts["made_playoffs"][i] / n_sims,
+                "division_pct": counts["won_division"][i] / n_sims,
+                "wild_card_pct": counts["won_wild_card"][i] / n_sims,
+                "ds_pct": counts["made_ds"][i] / n_sims,
+                "cs_pct": counts["made_cs"][i] / n_sims,
+                "ws_pct": counts["made_ws"][i] / n_sims,
+                "win_ws_pct": counts["won_ws"][i] / n_sims,
             })
 
         div_results.sort(key=lambda x: x["avg_wins"], reverse=True)
@@ -576,6 +545,7 @@ if __name__ == "__main__":
     parser.add_argument("--n-sims", type=int, default=1000)
     parser.add_argument("--after-date", type=str, default=None,
                         help="Only simulate games after this date (YYYY-MM-DD)")
+    parser.add_argument("--seed", type=int, default=None)
     args = parser.parse_args()
 
-    simulate_season(args.season, args.n_sims, args.after_date)
+    simulate_season(args.season, args.n_sims, args.after_date, args.seed)
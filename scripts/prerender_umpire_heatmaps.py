@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Pre-render the default umpire zone heatmaps served by services/umpire_zone.py.
+
+Runs the league-average model and every per-umpire model over the heatmap
+grid (four-seamer, 0-0 count, both batter sides) and writes compact float16
+grids next to the models, so umpire pages skip model inference on the first
+view.  Grids older than their model are ignored by the app, so re-run this
+whenever the models are retrained (the web build does it on every deploy).
+
+Usage:
+  python scripts/prerender_umpire_heatmaps.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from services.umpire_zone import prerender_heatmaps
+
+
+if __name__ == "__main__":
+    t0 = time.time()
+    written = prerender_heatmaps()
+    print(f"Pre-rendered {written} umpire heatmap files in {time.time() - t0:.1f}s")
@@ -9,28 +9,50 @@ data/season_projection_{season}.json.
 
 Run nightly after games complete (e.g., 1:30 AM ET = 6:30 AM UTC).
 
+Simulations are split into fixed-size shards, each with its own seeded RNG
+stream, and run on a process pool; results depend on --seed only, not on
+--workers.  Within a shard, seasons are simulated as numpy arrays: one
+uniform draw per (sim, game) against a precomputed home-win vector, wins
+tallied with bincount, standings ranked with argsort, and playoff series
+resolved with one draw each against precomputed series-win matrices.
+
+The pool defaults to one process: the cron runs on a small instance, and
+os.cpu_count() reports the host's cores, not the container's limit.  Raise
+it with --workers or SEASON_PROJECTION_WORKERS.
+
 Usage:
-  python scripts/update_season_projection.py [--season 2026] [--sims 10000]
+  python scripts/update_season_projection.py [--season 2026] [--sims 100000]
+                                             [--workers 4] [--seed 42]
 """
 
 import os
 import sys
 import json
+import math
 import random
 import argparse
 import requests
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from collections import defaultdict
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 API_BASE = "https://statsapi.mlb.com/api/v1"
 
-N_SIMS = 5_000
+N_SIMS = 100_000
 # Bayesian prior: treat preseason projection as this many games of evidence.
 # With PRIOR_GAMES=50, after 3 real games the model is 94% preseason / 6% actual.
 # At 50 games it's 50/50, by 120 games it's ~70% actual.
 PRIOR_GAMES = 50
 
+# Sims per shard.  Shards (not workers) own the RNG streams, so a given seed
+# gives the same projection on any number of cores.
+SHARD_SIMS = 5_000
+DEFAULT_SEED = 42
+# Cap on the (sims x games) uniform matrix drawn at once (~16 MB of float64)
+CHUNK_CELLS = 2_000_000
+
 # Division name mapping: MLB API full name → abbreviated key used in the JSON/template
 DIV_ABBREV = {
     "American League East":    "AL East",
@@ -205,150 +227,214 @@ def log5(wp_home: float, wp_away: float, home_adv: float = 0.04) -> float:
     return (wp_h * (1 - wp_a)) / denom if denom > 0 else 0.5
 
 
-def series_winner(t1: int, t2: int, win_probs: dict, best_of: int) -> int:
-    """Simulate a best-of-N series, return winning team_id."""
-    need = (best_of + 1) // 2
-    w1 = w2 = 0
-    p = log5(win_probs.get(t1, 0.5), win_probs.get(t2, 0.5))
-    while w1 < need and w2 < need:
-        if random.random() < p:
-            w1 += 1
-        else:
-            w2 += 1
-    return t1 if w1 >= need else t2
+def log5_matrix(wp: np.ndarray, home_adv: float = 0.04) -> np.ndarray:
+    """log5() for every (home, away) pair: P[i, j] = P(team i beats team j at home)."""
+    wp_h = np.clip(wp + home_adv / 2, 0.25, 0.75)[:, None]
+    wp_a = np.clip(wp - home_adv / 2, 0.25, 0.75)[None, :]
+    num = wp_h * (1 - wp_a)
+    denom = num + wp_a * (1 - wp_h)
+    return np.where(denom > 0, num / np.where(denom > 0, denom, 1), 0.5)
 
 
-def simulate_playoff(league_teams: list, final_wins: dict, win_probs: dict,
-                     counters: dict):
-    """
-    Simulate one league's 6-team playoff bracket.
+def series_matrix(p: np.ndarray, best_of: int) -> np.ndarray:
+    """P(first team wins a best-of-N series) from per-game win probabilities.
 
-    Seeds 1-6 by final wins. Wild-card round is best-of-3, DS best-of-5, CS best-of-7.
-    Returns World Series representative for this league.
+    Closed form: the winner takes `need` games while the loser takes j < need,
+    sum_j C(need-1+j, j) p^need (1-p)^j.
     """
-    sorted_teams = sorted(league_teams, key=lambda t: final_wins.get(t["team_id"], 0), reverse=True)
-    if len(sorted_teams) < 6:
-        return None
-
-    seeded = [t["team_id"] for t in sorted_teams[:6]]
-
-    # Wild card round: (3 vs 6), (4 vs 5)
-    wc_w1 = series_winner(seeded[2], seeded[5], win_probs, 3)
-    wc_w2 = series_winner(seeded[3], seeded[4], win_probs, 3)
-
-    ds_field = [seeded[0], seeded[1], wc_w1, wc_w2]
-    for tid in ds_field:
-        counters["ds"][tid] += 1
+    need = (best_of + 1) // 2
+    q = 1 - p
+    total = np.zeros_like(p)
+    for j in range(need):
+        total += math.comb(need - 1 + j, j) * p ** need * q ** j
+    return total
 
-    # Division series: 1 vs lower WC winner, 2 vs higher WC winner
-    ds_w1 = series_winner(seeded[0], wc_w2, win_probs, 5)
-    ds_w2 = series_winner(seeded[1], wc_w1, win_probs, 5)
 
-    for tid in [ds_w1, ds_w2]:
-        counters["cs"][tid] += 1
+def _series(t1: np.ndarray, t2: np.ndarray, sp: np.ndarray, rng) -> np.ndarray:
+    """Winners of one series per sim (t1/t2 are team indices)."""
+    return np.where(rng.random(len(t1)) < sp[t1, t2], t1, t2)
 
-    # Championship series
-    lg_champ = series_winner(ds_w1, ds_w2, win_probs, 7)
-    counters["ws"][lg_champ] += 1
 
-    return lg_champ
+def _rank_desc(wins: np.ndarray) -> np.ndarray:
+    """Column order by wins, most first; ties keep column order (like a
+    stable sorted(..., reverse=True))."""
+    return np.argsort(-wins, axis=1, kind="stable")
 
 
 # ---------------------------------------------------------------------------
 # Main simulation loop
 # ---------------------------------------------------------------------------
 
-def run_simulation(teams: dict, remaining_games: list, win_probs: dict,
-                   n_sims: int) -> dict:
-    current_w = {tid: t["w"] for tid, t in teams.items()}
-    current_l = {tid: t["l"] for tid, t in teams.items()}
+def _simulate_shard(teams: dict, game_probs: list, win_probs: dict,
+                    n_sims: int, seed: int) -> dict:
+    """Run `n_sims` seasons on one RNG stream; returns raw accumulators.
 
-    # Group by league and division for playoff seeding
-    teams_by_league = defaultdict(list)
-    teams_by_div    = defaultdict(list)
-    for t in teams.values():
-        teams_by_league[t["league"]].append(t)
-        teams_by_div[t["div_key"]].append(t)
-
-    # Accumulators
-    playoff_cnt  = defaultdict(int)
-    div_cnt      = defaultdict(int)
-    wc_cnt       = defaultdict(int)
-    counters     = {"ds": defaultdict(int), "cs": defaultdict(int), "ws": defaultdict(int)}
-    win_ws_cnt   = defaultdict(int)
-    # Welford's online mean/variance — avoids storing all samples
-    win_count    = defaultdict(int)
-    win_mean     = defaultdict(float)
-    win_m2       = defaultdict(float)  # sum of squared deviations
-
-    # Reuse these dicts each iteration to avoid per-sim allocation
-    sim_wins = dict(current_w)
-    sim_loss = dict(current_l)
-
-    for _ in range(n_sims):
-        # Reset to current standings
-        sim_wins.update(current_w)
-        sim_loss.update(current_l)
-
-        for g in remaining_games:
-            hi, ai = g["home_id"], g["away_id"]
-            if hi not in win_probs or ai not in win_probs:
+    game_probs: (home_id, away_id, P(home wins)) per remaining game.
+    Module-level so it can run in a worker process.
+    """
+    rng = np.random.default_rng(seed)
+    tids = list(teams)
+    idx = {tid: i for i, tid in enumerate(tids)}
+    n_teams = len(tids)
+    current_w = np.array([teams[tid]["w"] for tid in tids], dtype=np.int64)
+
+    home = np.array([idx[h] for h, a, _ in game_probs if h in idx and a in idx], dtype=np.int64)
+    away = np.array([idx[a] for h, a, _ in game_probs if h in idx and a in idx], dtype=np.int64)
+    p_home = np.array([p for h, a, p in game_probs if h in idx and a in idx], dtype=np.float64)
+
+    # Per-game and per-series win probabilities for every pairing
+    p_game = log5_matrix(np.array([win_probs.get(tid, 0.5) for tid in tids], dtype=np.float64))
+    sp = {bo: series_matrix(p_game, bo) for bo in (3, 5, 7)}
+
+    # League -> division -> team indices, in standings order
+    leagues = defaultdict(lambda: defaultdict(list))
+    for tid, t in teams.items():
+        leagues[t["league"]][t["div_key"]].append(idx[tid])
+
+    keys = ("playoff", "div", "wc", "ds", "cs", "ws", "win_ws")
+    cnt = {k: np.zeros(n_teams, dtype=np.int64) for k in keys}
+    win_n = 0
+    win_mean = np.zeros(n_teams)
+    win_m2 = np.zeros(n_teams)
+
+    def _tally(key, team_idx):
+        cnt[key] += np.bincount(np.ravel(team_idx), minlength=n_teams)
+
+    chunk = max(1, min(n_sims, CHUNK_CELLS // max(1, len(home))))
+    done = 0
+    while done < n_sims:
+        m = min(chunk, n_sims - done)
+        done += m
+        rows = np.arange(m)[:, None]
+
+        # Regular season: one draw per (sim, game), wins tallied in one bincount
+        home_won = rng.random((m, len(home))) < p_home
+        winner = np.where(home_won, home, away)
+        wins = current_w + np.bincount(
+            (winner + rows * n_teams).ravel(), minlength=m * n_teams,
+        ).reshape(m, n_teams)
+
+        # Welford/Chan merge of this chunk's mean and M2
+        c_mean = wins.mean(axis=0)
+        c_m2 = ((wins - c_mean) ** 2).sum(axis=0)
+        n_new = win_n + m
+        delta = c_mean - win_mean
+        win_mean += delta * m / n_new
+        win_m2 += c_m2 + delta ** 2 * win_n * m / n_new
+        win_n = n_new
+
+        champs = []
+        for divisions in leagues.values():
+            div_winners = []
+            for members in divisions.values():
+                members = np.array(members)
+                div_winners.append(members[_rank_desc(wins[:, members])[:, 0]])
+            div_winners = np.stack(div_winners, axis=1)            # (m, n_div)
+            lg = np.concatenate([np.array(v) for v in divisions.values()])
+
+            # Wild cards: best three league records outside the division winners
+            n_wc = min(3, len(lg) - div_winners.shape[1])
+            lg_wins = wins[:, lg].astype(np.float64)
+            lg_wins[(lg[None, :, None] == div_winners[:, None, :]).any(axis=2)] = -np.inf
+            wc = lg[_rank_desc(lg_wins)[:, :n_wc]]
+            _tally("div", div_winners)
+            _tally("wc", wc)
+            _tally("playoff", div_winners)
+            _tally("playoff", wc)
+
+            # The bracket needs a full 6-team field
+            if div_winners.shape[1] + n_wc < 6:
                 continue
-            if random.random() < log5(win_probs[hi], win_probs[ai]):
-                sim_wins[hi] += 1
-                sim_loss[ai] += 1
-            else:
-                sim_wins[ai] += 1
-                sim_loss[hi] += 1
-
-        # Welford update
-        for tid in teams:
-            w = sim_wins.get(tid, 0)
-            win_count[tid] += 1
-            delta = w - win_mean[tid]
-            win_mean[tid] += delta / win_count[tid]
-            win_m2[tid] += delta * (w - win_mean[tid])
-
-        # Determine playoffs per league
-        ws_participants = []
-        for league, lg_teams in teams_by_league.items():
-            # Division winners
-            div_groups = defaultdict(list)
-            for t in lg_teams:
-                div_groups[t["div_key"]].append(t)
-
-            div_winners  = []
-            non_winners  = []
-            for dv, dv_teams in div_groups.items():
-                ranked = sorted(dv_teams, key=lambda t: sim_wins.get(t["team_id"], 0), reverse=True)
-                if ranked:
-                    div_winners.append(ranked[0])
-                    non_winners.extend(ranked[1:])
-                    div_cnt[ranked[0]["team_id"]] += 1
-
-            wc_teams = sorted(non_winners, key=lambda t: sim_wins.get(t["team_id"], 0), reverse=True)[:3]
-            for t in wc_teams:
-                wc_cnt[t["team_id"]] += 1
-
-            for t in div_winners + wc_teams:
-                playoff_cnt[t["team_id"]] += 1
-
-            # Simulate playoff bracket
-            champ = simulate_playoff(div_winners + wc_teams, sim_wins, win_probs, counters)
-            if champ:
-                ws_participants.append(champ)
+
+            # Seeds 1-6 by final wins. Wild-card round is best-of-3, DS best-of-5, CS best-of-7.
+            field = np.concatenate([div_winners, wc], axis=1)[:, :6]
+            seeded = np.take_along_axis(field, _rank_desc(wins[rows, field]), axis=1)
+
+            # Wild card round: (3 vs 6), (4 vs 5)
+            wc_w1 = _series(seeded[:, 2], seeded[:, 5], sp[3], rng)
+            wc_w2 = _series(seeded[:, 3], seeded[:, 4], sp[3], rng)
+            _tally("ds", [seeded[:, 0], seeded[:, 1], wc_w1, wc_w2])
+
+            # Division series: 1 vs lower WC winner, 2 vs higher WC winner
+            ds_w1 = _series(seeded[:, 0], wc_w2, sp[5], rng)
+            ds_w2 = _series(seeded[:, 1], wc_w1, sp[5], rng)
+            _tally("cs", [ds_w1, ds_w2])
+
+            # Championship series
+            lg_champ = _series(ds_w1, ds_w2, sp[7], rng)
+            _tally("ws", lg_champ)
+            champs.append(lg_champ)
 
         # World Series
-        if len(ws_participants) == 2:
-            ws_winner = series_winner(ws_participants[0], ws_participants[1], win_probs, 7)
-            win_ws_cnt[ws_winner] += 1
+        if len(champs) == 2:
+            _tally("win_ws", _series(champs[0], champs[1], sp[7], rng))
+
+    out = {k: {tid: int(cnt[k][i]) for i, tid in enumerate(tids)} for k in keys}
+    out["win_count"] = {tid: n_sims for tid in tids}
+    out["win_mean"] = {tid: float(win_mean[i]) for i, tid in enumerate(tids)}
+    out["win_m2"] = {tid: float(win_m2[i]) for i, tid in enumerate(tids)}
+    return out
+
+
+_COUNTER_KEYS = ("playoff", "div", "wc", "ds", "cs", "ws", "win_ws")
+
+
+def _merge_shards(shards: list) -> dict:
+    """Sum the counters and combine Welford (count, mean, M2) per team with
+    Chan et al.'s pairwise update.  Shards are merged in order, so the
+    result is deterministic."""
+    merged = {k: defaultdict(int) for k in _COUNTER_KEYS}
+    win_count = defaultdict(int)
+    win_mean = defaultdict(float)
+    win_m2 = defaultdict(float)
+    for sh in shards:
+        for k in _COUNTER_KEYS:
+            for tid, c in sh[k].items():
+                merged[k][tid] += c
+        for tid, nb in sh["win_count"].items():
+            na = win_count[tid]
+            n = na + nb
+            delta = sh["win_mean"][tid] - win_mean[tid]
+            win_mean[tid] += delta * nb / n
+            win_m2[tid] += sh["win_m2"][tid] + delta * delta * na * nb / n
+            win_count[tid] = n
+    merged.update(win_count=win_count, win_mean=win_mean, win_m2=win_m2)
+    return merged
+
+
+def run_simulation(teams: dict, remaining_games: list, win_probs: dict,
+                   n_sims: int, workers: int = 1, seed: int = DEFAULT_SEED) -> dict:
+    current_w = {tid: t["w"] for tid, t in teams.items()}
+    current_l = {tid: t["l"] for tid, t in teams.items()}
+
+    # log5 is fixed per game for the whole run — compute it once
+    game_probs = [
+        (g["home_id"], g["away_id"], log5(win_probs[g["home_id"]], win_probs[g["away_id"]]))
+        for g in remaining_games
+        if g["home_id"] in win_probs and g["away_id"] in win_probs
+    ]
+
+    # Independent, reproducible RNG stream per shard
+    master = random.Random(seed)
+    shard_sizes = [min(SHARD_SIMS, n_sims - i) for i in range(0, n_sims, SHARD_SIMS)]
+    shard_seeds = [master.getrandbits(64) for _ in shard_sizes]
+    args = [(teams, game_probs, win_probs, size, sd) for size, sd in zip(shard_sizes, shard_seeds)]
+
+    # Never more processes than shards; each one holds its own numpy arrays
+    workers = max(1, min(int(workers), len(args)))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            shards = list(pool.map(_simulate_shard, *zip(*args)))
+    else:
+        shards = [_simulate_shard(*a) for a in args]
+    acc = _merge_shards(shards)
 
     # Build per-team result dicts
     results = {}
     for tid, t in teams.items():
-        avg_wins = win_mean[tid]
-        n = win_count[tid]
-        std_wins = (win_m2[tid] / n) ** 0.5 if n > 1 else 0.0
+        avg_wins = acc["win_mean"][tid]
+        n = acc["win_count"][tid]
+        std_wins = (acc["win_m2"][tid] / n) ** 0.5 if n > 1 else 0.0
         # Approximate p10/p90 via normal distribution (win totals are roughly normal)
         p10_wins = round(max(current_w.get(tid, 0), avg_wins - 1.282 * std_wins))
         p90_wins = round(min(162, avg_wins + 1.282 * std_wins))
@@ -365,13 +451,13 @@ def run_simulation(teams: dict, remaining_games: list, win_probs: dict,
             "win_std":        round(std_wins, 3),
             "p10_wins":       float(p10_wins),
             "p90_wins":       float(p90_wins),
-            "playoff_pct":    round(playoff_cnt[tid] / n_sims, 3),
-            "division_pct":   round(div_cnt[tid]     / n_sims, 3),
-            "wild_card_pct":  round(wc_cnt[tid]      / n_sims, 3),
-            "ds_pct":         round(counters["ds"][tid] / n_sims, 3),
-            "cs_pct":         round(counters["cs"][tid] / n_sims, 3),
-            "ws_pct":         round(counters["ws"][tid] / n_sims, 3),
-            "win_ws_pct":     round(win_ws_cnt[tid]     / n_sims, 3),
+            "playoff_pct":    round(acc["playoff"][tid] / n_sims, 3),
+            "division_pct":   round(acc["div"][tid]     / n_sims, 3),
+            "wild_card_pct":  round(acc["wc"][tid]      / n_sims, 3),
+            "ds_pct":         round(acc["ds"][tid] / n_sims, 3),
+            "cs_pct":         round(acc["cs"][tid] / n_sims, 3),
+            "ws_pct":         round(acc["ws"][tid] / n_sims, 3),
+            "win_ws_pct":     round(acc["win_ws"][tid]  / n_sims, 3),
         }
     return results
 
@@ -384,6 +470,10 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="Nightly Monte Carlo season projection")
     parser.add_argument("--season", type=int, default=datetime.now(timezone.utc).year)
     parser.add_argument("--sims",   type=int, default=N_SIMS)
+    parser.add_argument("--workers", type=int,
+                        default=int(os.environ.get("SEASON_PROJECTION_WORKERS", "1")),
+                        help="Worker processes (default: $SEASON_PROJECTION_WORKERS or 1)")
+    parser.add_argument("--seed",   type=int, default=DEFAULT_SEED)
     args = parser.parse_args()
     season = args.season
     n_sims = args.sims
@@ -423,9 +513,9 @@ def main() -> int:
     win_probs = compute_win_probs(teams, preseason_wins)
 
     # 5. Monte Carlo
-    print(f"  Running {n_sims:,} simulations...")
-    random.seed(42)
-    results = run_simulation(teams, remaining, win_probs, n_sims)
+    print(f"  Running {n_sims:,} simulations ({args.workers} workers, seed {args.seed})...")
+    results = run_simulation(teams, remaining, win_probs, n_sims,
+                             workers=args.workers, seed=args.seed)
 
     # 6. Package into division-keyed output matching the template format
     output: dict = {}
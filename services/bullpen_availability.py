@@ -8,17 +8,17 @@ and rest into an availability status.
 """
 
 from __future__ import annotations
-import json
 import logging
-import urllib.request
 from datetime import datetime, timedelta
 
+from services import http_client
 from services.mlb_api import get_player_headshot_url
+from services.ttl_cache import get_cache
 
 log = logging.getLogger(__name__)
 
 # Module cache: (team_id, game_date_str) → bullpen list
-_cache: dict = {}
+_cache = get_cache("bullpen_availability", max_entries=128, default_ttl=60 * 60)
 
 # Availability tiers
 AVAILABLE = "available"
@@ -44,9 +44,7 @@ def _fetch_team_recent_games(team_id, game_date_str, lookback_days=4):
         f"&endDate={end.strftime('%Y-%m-%d')}"
         f"&hydrate=linescore"
     )
-    req = urllib.request.Request(url)
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        data = json.loads(resp.read())
+    data = http_client.get_json(url)
 
     games = []
     for d in data.get("dates") or []:
@@ -68,9 +66,7 @@ def _fetch_pitching_from_boxscore(game_pk, team_id):
     Returns list of {id, name, pitches, outs, is_starter}.
     """
     url = f"https://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live"
-    req = urllib.request.Request(url)
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        data = json.loads(resp.read())
+    data = http_client.get_json(url)
 
     boxscore = (data.get("liveData") or {}).get("boxscore") or {}
     teams = boxscore.get("teams") or {}
@@ -207,8 +203,9 @@ def get_bullpen_availability(team_id, game_date_str, team_abbrev=""):
       id, name, headshot, status, workload, note, appearances[]
     """
     cache_key = (team_id, game_date_str)
-    if cache_key in _cache:
-        return _cache[cache_key]
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
         recent_games = _fetch_team_recent_games(team_id, game_date_str)
@@ -293,7 +290,7 @@ def get_bullpen_availability(team_id, game_date_str, team_abbrev=""):
     status_order = {AVAILABLE: 0, LIMITED: 1, UNLIKELY: 2, UNAVAILABLE: 3}
     bullpen.sort(key=lambda x: (status_order.get(x["status"], 4), x["workload"]))
 
-    _cache[cache_key] = bullpen
+    _cache.set(cache_key, bullpen)
     return bullpen
 
 
@@ -307,9 +304,7 @@ def _fetch_roster_fallback(team_id):
             f"https://statsapi.mlb.com/api/v1/teams/{team_id}/roster"
             f"?rosterType=active&hydrate=person"
         )
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=8) as resp:
-            data = json.loads(resp.read())
+        data = http_client.get_json(url)
 
         roster = data.get("roster") or []
         bullpen = []
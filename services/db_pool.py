@@ -0,0 +1,173 @@
+# services/db_pool.py
+"""
+Process-wide Postgres connection pool shared by the DB-backed services.
+
+Opening a fresh connection to the hosted database (TCP + TLS + auth) costs
+more than most of the queries the services run, so every request used to
+pay it several times over.  This module keeps one `psycopg_pool`
+ConnectionPool per database URL and hands out connections with:
+
+- health checks on checkout (broken connections are replaced, not returned)
+- a default statement timeout, overridable per call (0 disables it)
+- pool-wait metrics — how long callers queued for a connection
+
+Usage mirrors `psycopg.connect`:
+
+    with db_pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(...)
+
+The transaction is committed when the block exits cleanly and rolled back
+on error, then the connection goes back to the pool.  If psycopg_pool is
+not installed, connections are opened directly as before.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import psycopg
+from psycopg.conninfo import conninfo_to_dict
+
+try:
+    from psycopg_pool import ConnectionPool, PoolTimeout  # type: ignore
+except Exception:  # optional dependency: fall back to direct connections
+    ConnectionPool = None
+    PoolTimeout = None
+
+POOL_MIN_SIZE = int(os.environ.get("DB_POOL_MIN_SIZE", "1"))
+POOL_MAX_SIZE = int(os.environ.get("DB_POOL_MAX_SIZE", "8"))
+# How long a caller may queue for a free connection before PoolTimeout
+POOL_WAIT_TIMEOUT = float(os.environ.get("DB_POOL_WAIT_TIMEOUT", "10"))
+CONNECT_TIMEOUT = 10
+DEFAULT_STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", "15000"))
+
+_USE_DEFAULT = object()
+
+_pools: Dict[str, Any] = {}
+_metrics: Dict[str, Dict[str, float]] = {}
+_lock = threading.Lock()
+
+
+def database_url() -> str:
+    """The app database URL (DATABASE_URL, falling back to DATABASE_URL_PG)."""
+    url = os.environ.get("DATABASE_URL") or os.environ.get("DATABASE_URL_PG") or ""
+    if not url:
+        raise RuntimeError("Missing DATABASE_URL env var")
+    # Render often gives postgres://
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql://", 1)
+    return url
+
+
+def get_pool(url: Optional[str] = None):
+    """The pool for `url` (default: the app database), created on first use."""
+    url = url or database_url()
+    pool = _pools.get(url)
+    if pool is not None:
+        return pool
+    with _lock:
+        pool = _pools.get(url)
+        if pool is None:
+            pool = ConnectionPool(
+                url,
+                min_size=POOL_MIN_SIZE,
+                max_size=POOL_MAX_SIZE,
+                timeout=POOL_WAIT_TIMEOUT,
+                max_idle=5 * 60,
+                max_lifetime=30 * 60,
+                check=ConnectionPool.check_connection,
+                kwargs=_connect_kwargs(),
+                name=f"pg{len(_pools)}",
+                open=True,
+            )
+            _pools[url] = pool
+            _metrics[url] = {"checkouts": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0, "timeouts": 0}
+    return pool
+
+
+def _record_wait(url: str, wait_ms: float, timed_out: bool = False) -> None:
+    with _lock:
+        m = _metrics[url]
+        if timed_out:
+            m["timeouts"] += 1
+            return
+        m["checkouts"] += 1
+        m["wait_ms_total"] += wait_ms
+        if wait_ms > m["wait_ms_max"]:
+            m["wait_ms_max"] = wait_ms
+
+
+@contextmanager
+def connection(url: Optional[str] = None, statement_timeout_ms=_USE_DEFAULT) -> Iterator["psycopg.Connection"]:
+    """Borrow a connection for the duration of a `with` block.
+
+    Args:
+        url: database URL; defaults to the app database.
+        statement_timeout_ms: per-query limit for this block (0 = none);
+            defaults to DB_STATEMENT_TIMEOUT_MS.  Applied with SET LOCAL,
+            so it lasts until the block's first commit.
+    """
+    url = url or database_url()
+
+    if ConnectionPool is None:
+        with psycopg.connect(url, **_connect_kwargs()) as conn:
+            _set_statement_timeout(conn, statement_timeout_ms)
+            yield conn
+        return
+
+    pool = get_pool(url)
+    t0 = time.perf_counter()
+    checked_out = False
+    try:
+        with pool.connection() as conn:
+            checked_out = True
+            _record_wait(url, (time.perf_counter() - t0) * 1000.0)
+            _set_statement_timeout(conn, statement_timeout_ms)
+            yield conn
+    except PoolTimeout:
+        if not checked_out:
+            _record_wait(url, 0.0, timed_out=True)
+        raise
+
+
+def _connect_kwargs() -> Dict[str, Any]:
+    return {
+        "connect_timeout": CONNECT_TIMEOUT,
+        "options": f"-c statement_timeout={DEFAULT_STATEMENT_TIMEOUT_MS}",
+    }
+
+
+def _set_statement_timeout(conn, statement_timeout_ms) -> None:
+    if statement_timeout_ms is not _USE_DEFAULT:
+        conn.execute(f"SET LOCAL statement_timeout = {int(statement_timeout_ms)}")
+
+
+def pool_stats() -> List[Dict[str, Any]]:
+    """Size, wait and error counters for every open pool (no credentials)."""
+    out = []
+    with _lock:
+        items = [(url, pool, dict(_metrics[url])) for url, pool in _pools.items()]
+    for url, pool, m in items:
+        stats = pool.get_stats()
+        checkouts = m["checkouts"]
+        out.append({
+            "name": pool.name,
+            "host": conninfo_to_dict(url).get("host"),
+            "min_size": pool.min_size,
+            "max_size": pool.max_size,
+            "pool_size": stats.get("pool_size"),
+            "pool_available": stats.get("pool_available"),
+            "requests_waiting": stats.get("requests_waiting"),
+            "checkouts": checkouts,
+            "wait_ms_avg": round(m["wait_ms_total"] / checkouts, 2) if checkouts else None,
+            "wait_ms_max": round(m["wait_ms_max"], 2),
+            "wait_timeouts": m["timeouts"],
+            "connections_lost": stats.get("connections_lost", 0),
+            "connections_errors": stats.get("connections_errors", 0),
+        })
+    return out
@@ -0,0 +1,80 @@
+# services/fanout.py
+"""
+Concurrent loader for page handlers.
+
+Pages like /player/<id> need a dozen independent statsapi and DB round
+trips.  `Fanout` runs them on one bounded, process-wide thread pool and
+hands results back by name.  Handlers add tasks in dependency order — each
+stage is submitted as soon as the result it needs is in hand, while the
+earlier stage's other tasks keep running — so a page costs roughly its
+slowest dependency chain instead of the sum of every call.
+
+    tasks = Fanout()
+    tasks.add("full", get_player_full, pid)
+    tasks.add("awards", get_player_awards, pid)
+    season = season_from(tasks.get("full"))
+    tasks.add("log", get_player_game_log, pid, season)
+    game_log = tasks.get("log", default=[])
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+MAX_WORKERS = 8
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_RAISE = object()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="fanout")
+    return _executor
+
+
+class Fanout:
+    """A named set of tasks for one request, run on the shared pool."""
+
+    def __init__(self, executor: Optional[ThreadPoolExecutor] = None):
+        self._executor = executor or _get_executor()
+        self._futures: Dict[str, Future] = {}
+
+    def add(self, name: str, fn: Callable, *args, **kwargs) -> Future:
+        """Schedule `fn(*args, **kwargs)` under `name`."""
+        fut = self._executor.submit(fn, *args, **kwargs)
+        self._futures[name] = fut
+        return fut
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._futures
+
+    def get(self, name: str, default: Any = _RAISE, timeout: Optional[float] = None) -> Any:
+        """Wait for `name` and return its result.
+
+        With a `default`, a failed (or never added) task logs and returns the
+        default instead of raising — the same best-effort handling the page
+        handlers already give each section.
+        """
+        fut = self._futures.get(name)
+        if fut is None:
+            if default is _RAISE:
+                raise KeyError(name)
+            return default
+        if default is _RAISE:
+            return fut.result(timeout=timeout)
+        try:
+            return fut.result(timeout=timeout)
+        except Exception as e:
+            log.warning("fanout task %s failed: %s: %s", name, type(e).__name__, e)
+            return default
@@ -17,11 +17,14 @@ import json
 import uuid
 import logging
 import random
+from bisect import bisect_right
 from typing import List, Dict, Optional, Tuple, Any
 
 import numpy as np
 import pandas as pd
 
+from services.ttl_cache import get_cache
+
 log = logging.getLogger(__name__)
 
 _ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -218,47 +221,52 @@ _park_factors_df = None
 _pitcher_arsenal_df = None
 _batter_spray_df = None
 
+# ProfileIndex views (services.profile_store) for O(1) per-player lookups
+_park_idx = None
+_pitcher_arsenal_idx = None
+_batter_spray_idx = None
+
 
 def _load_data():
     """Lazy-load parquet data files."""
     global _park_factors_df, _pitcher_arsenal_df, _batter_spray_df
+    global _park_idx, _pitcher_arsenal_idx, _batter_spray_idx
     if _park_factors_df is not None:
         return
+    from services.profile_store import ProfileIndex, load_profile_index
+
     try:
         _park_factors_df = pd.read_parquet(os.path.join(_DATA_DIR, "park_factors.parquet"))
     except Exception:
         _park_factors_df = pd.DataFrame()
+    _park_idx = ProfileIndex(_park_factors_df, ["venue", "stand"])
     # Pitcher arsenal is rebuilt nightly — read from Postgres (fresh data),
-    # falling back to the committed parquet file.
+    # falling back to the committed parquet file.  The index is shared with
+    # services.matchup_predict.
     try:
-        from services.profile_store import load_profile
-        _pitcher_arsenal_df = load_profile(
+        _pitcher_arsenal_idx = load_profile_index(
             "profile_pitcher_arsenal",
             os.path.join(_DATA_DIR, "pitcher_arsenal.parquet"),
+            ["pitcher", "stand"],
+            multi=True,
         )
     except Exception:
-        _pitcher_arsenal_df = pd.DataFrame()
+        _pitcher_arsenal_idx = ProfileIndex(pd.DataFrame(), ["pitcher", "stand"], multi=True)
+    _pitcher_arsenal_df = _pitcher_arsenal_idx.df
     try:
         _batter_spray_df = pd.read_parquet(os.path.join(_DATA_DIR, "batter_spray_profiles.parquet"))
     except Exception:
         _batter_spray_df = pd.DataFrame()
+    _batter_spray_idx = ProfileIndex(_batter_spray_df, ["batter"])
 
 
 def _get_park_factors(venue: str, season: int = 2025) -> dict:
     """Get park factors for a venue. Returns multipliers (1.0 = neutral)."""
     _load_data()
-    if _park_factors_df is None or _park_factors_df.empty:
+    r = _park_idx.get_or_latest((venue, "ALL"), season)
+    if r is None:
         return {"hr_factor": 1.0, "hit_factor": 1.0, "2b_factor": 1.0, "3b_factor": 1.0, "run_factor": 1.0}
 
-    pf = _park_factors_df
-    mask = (pf["venue"] == venue) & (pf["stand"] == "ALL")
-    row = pf[mask & (pf["season"] == season)]
-    if row.empty:
-        row = pf[mask].sort_values("season", ascending=False).head(1)
-    if row.empty:
-        return {"hr_factor": 1.0, "hit_factor": 1.0, "2b_factor": 1.0, "3b_factor": 1.0, "run_factor": 1.0}
-
-    r = row.iloc[0]
     return {
         "hr_factor": float(r.get("hr_factor", 1.0)) if pd.notna(r.get("hr_factor")) else 1.0,
         "hit_factor": float(r.get("hit_factor", 1.0)) if pd.notna(r.get("hit_factor")) else 1.0,
@@ -274,22 +282,12 @@ def _get_pitcher_arsenal_profile(pitcher_id: int, season: int = 2025) -> list:
     Returns list of dicts with pitch_type, usage, avg_velo, avg_spin, etc.
     """
     _load_data()
-    if _pitcher_arsenal_df is None or _pitcher_arsenal_df.empty:
-        return []
-
-    pa = _pitcher_arsenal_df
-    mask = (pa["pitcher"] == pitcher_id) & (pa["stand"] == "ALL")
-    df = pa[mask & (pa["season"] == season)]
-    if df.empty:
-        df = pa[mask].sort_values("season", ascending=False)
-        if not df.empty:
-            latest = df["season"].iloc[0]
-            df = df[df["season"] == latest]
-    if df.empty:
+    df = _pitcher_arsenal_idx.get_or_latest((pitcher_id, "ALL"), season)
+    if df is None:
         return []
 
     arsenal = []
-    for _, row in df.iterrows():
+    for row in df.to_dict("records"):
         arsenal.append({
             "pitch_type": row["pitch_type"],
             "usage": float(row.get("usage", 0)),
@@ -308,18 +306,10 @@ def _get_batter_spray_profile(batter_id: int, season: int = 2025) -> dict:
     """Get batter's spray angle tendencies."""
     _load_data()
     default = {"pull_pct": 0.40, "center_pct": 0.33, "oppo_pct": 0.27}
-    if _batter_spray_df is None or _batter_spray_df.empty:
+    r = _batter_spray_idx.get_or_latest((batter_id,), season)
+    if r is None:
         return default
 
-    bs = _batter_spray_df
-    mask = bs["batter"] == batter_id
-    row = bs[mask & (bs["season"] == season)]
-    if row.empty:
-        row = bs[mask].sort_values("season", ascending=False).head(1)
-    if row.empty:
-        return default
-
-    r = row.iloc[0]
     return {
         "pull_pct": float(r.get("bat_pull_pct", 0.40)),
         "center_pct": float(r.get("bat_center_pct", 0.33)),
@@ -1298,30 +1288,56 @@ def simulate_game(
     --------
     Complete game log dict with pitches, events, lineups, score, etc.
     """
-    rng = random.Random(seed)
-
-    # Load park factors for the venue
-    park_factors = _get_park_factors(venue, season)
-    dims = STADIUM_DIMENSIONS.get(venue, STADIUM_DIMENSIONS.get("NYY"))
+    setup = _prepare_game(away_lineup, home_lineup, away_pitcher, home_pitcher,
+                          away_bullpen, home_bullpen, venue, season)
+    return _play_game(
+        away_lineup, home_lineup, away_pitcher, home_pitcher,
+        away_bullpen, home_bullpen, venue, season,
+        random.Random(seed), setup,
+    )
+
+
+def _prepare_game(away_lineup, home_lineup, away_pitcher, home_pitcher,
+                  away_bullpen, home_bullpen, venue, season) -> dict:
+    """Load everything a game needs that doesn't depend on the dice:
+    park factors, every pitcher's arsenal (bullpen included) and batter
+    spray profiles.  Shared by every game of a simulate_games() batch."""
+    arsenals = {}
+    for p in [away_pitcher, home_pitcher] + list(away_bullpen) + list(home_bullpen):
+        arsenal = _get_pitcher_arsenal_profile(p["id"], season)
+        # If arsenal is empty, create a generic one
+        arsenals[p["id"]] = arsenal or _default_arsenal(p.get("p_throws", "R"))
 
-    # Load pitcher arsenal profiles
-    away_pitcher_arsenal = _get_pitcher_arsenal_profile(away_pitcher["id"], season)
-    home_pitcher_arsenal = _get_pitcher_arsenal_profile(home_pitcher["id"], season)
+    return {
+        "park_factors": _get_park_factors(venue, season),
+        "dims": STADIUM_DIMENSIONS.get(venue, STADIUM_DIMENSIONS.get("NYY")),
+        "arsenals": arsenals,
+        "spray_profiles": {
+            b["id"]: _get_batter_spray_profile(b["id"], season)
+            for b in away_lineup + home_lineup
+        },
+        "pa_probs": _get_pa_probs,
+    }
 
-    # If arsenal is empty, create a generic one
-    if not away_pitcher_arsenal:
-        away_pitcher_arsenal = _default_arsenal(away_pitcher.get("p_throws", "R"))
-    if not home_pitcher_arsenal:
-        home_pitcher_arsenal = _default_arsenal(home_pitcher.get("p_throws", "R"))
 
-    # Load batter spray profiles
-    spray_profiles = {}
-    for batter in away_lineup + home_lineup:
-        spray_profiles[batter["id"]] = _get_batter_spray_profile(batter["id"], season)
+def _play_game(
+    away_lineup, home_lineup, away_pitcher, home_pitcher,
+    away_bullpen, home_bullpen, venue, season,
+    rng: random.Random, setup: dict, record: bool = True,
+) -> dict:
+    """Play one game.  With `record=False` no pitch records, events or
+    checkpoints are built and only the box-score totals are returned."""
+    park_factors = setup["park_factors"]
+    dims = setup["dims"]
+    spray_profiles = setup["spray_profiles"]
+    get_pa_probs = setup["pa_probs"]
+    away_pitcher_arsenal = setup["arsenals"][away_pitcher["id"]]
+    home_pitcher_arsenal = setup["arsenals"][home_pitcher["id"]]
 
     # --------------- Game state ---------------
     pitches = []          # Every pitch in the game
     events = []           # PA/game events
+    n_pitches = 0
     game_id = str(uuid.uuid4())
 
     score = {"away": 0, "home": 0}
@@ -1362,6 +1378,10 @@ def simulate_game(
     # Times through order tracking
     n_thru_order = {"away": 1, "home": 1}
 
+    # Replay checkpoints for build_state_at_pitch: one per PA boundary
+    line_stats = {}       # batter lines as the scrubber tallies them
+    checkpoints = []
+
     # --------------- Inning loop ---------------
     max_innings = 9
     inning = 1
@@ -1410,33 +1430,32 @@ def simulate_game(
                         upcoming_batters, rng,
                     )
                     new_pitcher = bullpen_remaining[pitching_team].pop(reliever_idx)
-                    new_arsenal = _get_pitcher_arsenal_profile(new_pitcher["id"], season)
-                    if not new_arsenal:
-                        new_arsenal = _default_arsenal(new_pitcher.get("p_throws", "R"))
-
-                    pitching_changes.append({
-                        "inning": inning,
-                        "half": half,
-                        "outs": outs,
-                        "old_pitcher": pitcher_info["id"],
-                        "new_pitcher": new_pitcher["id"],
-                        "new_pitcher_name": new_pitcher["name"],
-                        "pitch_index": len(pitches),
-                        "options": [p["id"] for p in bullpen_remaining[pitching_team]],
-                    })
-
-                    events.append({
-                        "type": "pitching_change",
-                        "inning": inning,
-                        "half": half,
-                        "outs": outs,
-                        "old_pitcher_id": pitcher_info["id"],
-                        "old_pitcher_name": pitcher_info["name"],
-                        "new_pitcher_id": new_pitcher["id"],
-                        "new_pitcher_name": new_pitcher["name"],
-                        "description": f"Pitching change: {new_pitcher['name']} replaces {pitcher_info['name']}. ({pitcher_info.get('pitch_count', 0)} pitches)",
-                        "pitch_index": len(pitches),
-                    })
+                    new_arsenal = setup["arsenals"][new_pitcher["id"]]
+
+                    if record:
+                        pitching_changes.append({
+                            "inning": inning,
+                            "half": half,
+                            "outs": outs,
+                            "old_pitcher": pitcher_info["id"],
+                            "new_pitcher": new_pitcher["id"],
+                            "new_pitcher_name": new_pitcher["name"],
+                            "pitch_index": n_pitches,
+                            "options": [p["id"] for p in bullpen_remaining[pitching_team]],
+                        })
+
+                        events.append({
+                            "type": "pitching_change",
+                            "inning": inning,
+                            "half": half,
+                            "outs": outs,
+                            "old_pitcher_id": pitcher_info["id"],
+                            "old_pitcher_name": pitcher_info["name"],
+                            "new_pitcher_id": new_pitcher["id"],
+                            "new_pitcher_name": new_pitcher["name"],
+                            "description": f"Pitching change: {new_pitcher['name']} replaces {pitcher_info['name']}. ({pitcher_info.get('pitch_count', 0)} pitches)",
+                            "pitch_index": n_pitches,
+                        })
 
                     current_pitchers[pitching_team] = {
                         **new_pitcher,
@@ -1458,7 +1477,7 @@ def simulate_game(
                     n_thru_order[pitching_team] = min(n_thru_order[pitching_team] + 1, 5)
 
                 # --- Get matchup prediction ---
-                pa_probs = _get_pa_probs(
+                pa_probs = get_pa_probs(
                     batter["id"], pitcher_info["id"],
                     batter.get("stand", "R"), pitcher_info.get("p_throws", "R"),
                     venue, season, inning, outs,
@@ -1485,11 +1504,15 @@ def simulate_game(
                 pitch_num_in_ab = 0
                 prev_pitch = None
                 prev_pitch_velo = None
-                pa_pitches = []
                 pa_complete = False
                 pa_event = None
                 pa_bip = None
 
+                if record:
+                    checkpoints.append(_checkpoint(
+                        n_pitches, len(events), score, outs, bases, line_stats, pitcher_stats,
+                    ))
+
                 pitcher_stats[pitcher_info["id"]]["bf"] += 1
                 player_stats[batter["id"]]["pa"] += 1
 
@@ -1552,40 +1575,42 @@ def simulate_game(
                     )
 
                     # Build pitch record
-                    pitch_record = {
-                        "idx": len(pitches),
-                        "inning": inning,
-                        "half": half,
-                        "batter_id": batter["id"],
-                        "batter_name": batter["name"],
-                        "batter_stand": batter.get("stand", "R"),
-                        "pitcher_id": pitcher_info["id"],
-                        "pitcher_name": pitcher_info["name"],
-                        "pitcher_throws": pitcher_info.get("p_throws", "R"),
-                        "balls": balls,
-                        "strikes": strikes,
-                        "outs": outs,
-                        "pitch_type": pitch_type,
-                        "pitch_name": _pitch_name(pitch_type),
-                        "px": px,
-                        "pz": pz,
-                        "sz_top": round(sz_top, 2),
-                        "sz_bot": round(sz_bot, 2),
-                        "mph": mph,
-                        "spin": spin,
-                        "hb": round(hb, 1),
-                        "ivb": round(ivb, 1),
-                        "result": result,
-                        "is_ball": result == "ball",
-                        "is_strike": result in ("called_strike", "swinging_strike"),
-                        "is_foul": result == "foul",
-                        "is_in_play": result == "in_play",
-                        "runners": [b is not None for b in bases],
-                        "score_away": score["away"],
-                        "score_home": score["home"],
-                        "event": None,
-                        "bip": None,
-                    }
+                    pitch_record = None
+                    if record:
+                        pitch_record = {
+                            "idx": n_pitches,
+                            "inning": inning,
+                            "half": half,
+                            "batter_id": batter["id"],
+                            "batter_name": batter["name"],
+                            "batter_stand": batter.get("stand", "R"),
+                            "pitcher_id": pitcher_info["id"],
+                            "pitcher_name": pitcher_info["name"],
+                            "pitcher_throws": pitcher_info.get("p_throws", "R"),
+                            "balls": balls,
+                            "strikes": strikes,
+                            "outs": outs,
+                            "pitch_type": pitch_type,
+                            "pitch_name": _pitch_name(pitch_type),
+                            "px": px,
+                            "pz": pz,
+                            "sz_top": round(sz_top, 2),
+                            "sz_bot": round(sz_bot, 2),
+                            "mph": mph,
+                            "spin": spin,
+                            "hb": round(hb, 1),
+                            "ivb": round(ivb, 1),
+                            "result": result,
+                            "is_ball": result == "ball",
+                            "is_strike": result in ("called_strike", "swinging_strike"),
+                            "is_foul": result == "foul",
+                            "is_in_play": result == "in_play",
+                            "runners": [b is not None for b in bases],
+                            "score_away": score["away"],
+                            "score_home": score["home"],
+                            "event": None,
+                            "bip": None,
+                        }
 
                     # Update count
                     if result == "ball":
@@ -1611,16 +1636,18 @@ def simulate_game(
                         )
                         pa_event = bip_data["outcome"]
                         pa_bip = bip_data
-                        pitch_record["bip"] = bip_data
 
-                    # Record event on PA-ending pitch
-                    if pa_complete:
-                        pitch_record["event"] = pa_event
-                        pitch_record["balls"] = balls if pa_event != "BB" else balls - 1
-                        pitch_record["strikes"] = strikes if pa_event != "K" else strikes - 1
+                    if record:
+                        pitch_record["bip"] = pa_bip
+                        # Record event on PA-ending pitch
+                        if pa_complete:
+                            pitch_record["event"] = pa_event
+                            pitch_record["balls"] = balls if pa_event != "BB" else balls - 1
+                            pitch_record["strikes"] = strikes if pa_event != "K" else strikes - 1
 
-                    pitches.append(pitch_record)
-                    pa_pitches.append(pitch_record)
+                        pitches.append(pitch_record)
+                        _tally_line(line_stats, pitch_record)
+                    n_pitches += 1
 
                     prev_pitch = pitch_type
                     prev_pitch_velo = mph
@@ -1631,7 +1658,7 @@ def simulate_game(
                             bases, outs, balls, strikes, pitch_type, result,
                             inning, half, score, batting_team, pitching_team,
                             pitcher_info, batter,
-                            len(pitches) - 1, rng,
+                            n_pitches - 1, rng,
                         )
                         for br in br_events:
                             bases = br["new_bases"]
@@ -1643,7 +1670,8 @@ def simulate_game(
                                 if outs >= 3:
                                     pa_complete = True
                                     pa_event = "OUT"  # inning ends on CS
-                            events.append(br["event"])
+                            if record:
+                                events.append(br["event"])
 
                 # --- PA complete: update game state ---
                 # Track on current pitcher for managerial decisions
@@ -1662,16 +1690,17 @@ def simulate_game(
                     outs += 1
                     pst["ip_outs"] += 1
 
-                    events.append({
-                        "type": "strikeout",
-                        "inning": inning, "half": half,
-                        "batter_id": batter["id"],
-                        "batter_name": batter["name"],
-                        "pitcher_id": pitcher_info["id"],
-                        "pitcher_name": pitcher_info["name"],
-                        "description": f"{batter['name']} strikes out.",
-                        "pitch_index": pitches[-1]["idx"],
-                    })
+                    if record:
+                        events.append({
+                            "type": "strikeout",
+                            "inning": inning, "half": half,
+                            "batter_id": batter["id"],
+                            "batter_name": batter["name"],
+                            "pitcher_id": pitcher_info["id"],
+                            "pitcher_name": pitcher_info["name"],
+                            "description": f"{batter['name']} strikes out.",
+                            "pitch_index": n_pitches - 1,
+                        })
 
                 elif pa_event in ("BB", "HBP", "IBB"):
                     if pa_event == "BB":
@@ -1686,16 +1715,17 @@ def simulate_game(
                     inning_runs += runs
                     score[batting_team] += runs
 
-                    events.append({
-                        "type": "walk",
-                        "inning": inning, "half": half,
-                        "batter_id": batter["id"],
-                        "batter_name": batter["name"],
-                        "pitcher_id": pitcher_info["id"],
-                        "description": f"{batter['name']} walks.",
-                        "runs_scored": runs,
-                        "pitch_index": pitches[-1]["idx"],
-                    })
+                    if record:
+                        events.append({
+                            "type": "walk",
+                            "inning": inning, "half": half,
+                            "batter_id": batter["id"],
+                            "batter_name": batter["name"],
+                            "pitcher_id": pitcher_info["id"],
+                            "description": f"{batter['name']} walks.",
+                            "runs_scored": runs,
+                            "pitch_index": n_pitches - 1,
+                        })
 
                 elif pa_event in ("1B", "2B", "3B", "HR"):
                     ps["h"] += 1
@@ -1735,19 +1765,20 @@ def simulate_game(
                     if rbi > 0:
                         desc += f" {rbi} RBI."
 
-                    events.append({
-                        "type": "hit",
-                        "inning": inning, "half": half,
-                        "batter_id": batter["id"],
-                        "batter_name": batter["name"],
-                        "pitcher_id": pitcher_info["id"],
-                        "event": pa_bip["event"] if pa_bip else pa_event,
-                        "description": desc,
-                        "runs_scored": runs,
-                        "rbi": rbi,
-                        "pitch_index": pitches[-1]["idx"],
-                        "bip": pa_bip,
-                    })
+                    if record:
+                        events.append({
+                            "type": "hit",
+                            "inning": inning, "half": half,
+                            "batter_id": batter["id"],
+                            "batter_name": batter["name"],
+                            "pitcher_id": pitcher_info["id"],
+                            "event": pa_bip["event"] if pa_bip else pa_event,
+                            "description": desc,
+                            "runs_scored": runs,
+                            "rbi": rbi,
+                            "pitch_index": n_pitches - 1,
+                            "bip": pa_bip,
+                        })
 
                 elif pa_event == "OUT":
                     ps["ab"] += 1
@@ -1770,18 +1801,19 @@ def simulate_game(
                     if runs > 0:
                         desc += f" {runs} RBI."
 
-                    events.append({
-                        "type": "out",
-                        "inning": inning, "half": half,
-                        "batter_id": batter["id"],
-                        "batter_name": batter["name"],
-                        "pitcher_id": pitcher_info["id"],
-                        "event": pa_bip["event"] if pa_bip else "Out",
-                        "description": desc,
-                        "runs_scored": runs,
-                        "pitch_index": pitches[-1]["idx"],
-                        "bip": pa_bip,
-                    })
+                    if record:
+                        events.append({
+                            "type": "out",
+                            "inning": inning, "half": half,
+                            "batter_id": batter["id"],
+                            "batter_name": batter["name"],
+                            "pitcher_id": pitcher_info["id"],
+                            "event": pa_bip["event"] if pa_bip else "Out",
+                            "description": desc,
+                            "runs_scored": runs,
+                            "pitch_index": n_pitches - 1,
+                            "bip": pa_bip,
+                        })
 
                 # --- Walk-off check ---
                 if half == "Bottom" and inning >= max_innings and score["home"] > score["away"]:
@@ -1808,6 +1840,16 @@ def simulate_game(
     while len(linescore["home"]) < len(linescore["away"]):
         linescore["home"].append(0)
 
+    if not record:
+        return {
+            "score": score,
+            "linescore": linescore,
+            "player_stats": player_stats,
+            "pitcher_stats": pitcher_stats,
+            "total_pitches": n_pitches,
+            "innings_played": inning - 1,
+        }
+
     # Build final game data
     return {
         "game_id": game_id,
@@ -1816,7 +1858,7 @@ def simulate_game(
         "stadium_dims": dims,
         "park_factors": park_factors,
         "season": season,
-        "total_pitches": len(pitches),
+        "total_pitches": n_pitches,
         "pitches": pitches,
         "events": events,
         "pitching_changes": pitching_changes,
@@ -1831,9 +1873,209 @@ def simulate_game(
         "away_bullpen": away_bullpen,
         "home_bullpen": home_bullpen,
         "innings_played": inning - 1,
+        "checkpoints": checkpoints,
     }
 
 
+# ---------------------------------------------------------------------------
+# Batch simulation
+# ---------------------------------------------------------------------------
+# simulate_games() plays many games of the same matchup without building
+# pitch logs and reports distributions instead of a single replay.
+
+_BATTER_TOTALS = ("pa", "ab", "h", "1b", "2b", "3b", "hr", "bb", "hbp", "k", "rbi")
+_PITCHER_TOTALS = ("ip_outs", "bf", "pitches", "h", "r", "er", "bb", "k", "hr")
+
+
+def _memoized_pa_probs(get_pa_probs):
+    """Per-batch cache of matchup-model calls: the same batter/pitcher/context
+    recurs in nearly every game of a batch."""
+    cache = {}
+
+    def _probs(*args):
+        probs = cache.get(args)
+        if probs is None:
+            probs = cache[args] = get_pa_probs(*args)
+        return probs
+    return _probs
+
+
+def _new_totals() -> dict:
+    return {
+        "games": 0,
+        "wins": {"away": 0, "home": 0, "tie": 0},
+        "extra_innings": 0,
+        "runs": {"away": {}, "home": {}, "total": {}},
+        "margin": {},
+        "pitches": {"away": 0, "home": 0},
+        "batters": {},
+        "pitchers": {},
+    }
+
+
+def _add_game(totals: dict, g: dict) -> None:
+    away, home = g["score"]["away"], g["score"]["home"]
+    totals["games"] += 1
+    totals["wins"]["away" if away > home else "home" if home > away else "tie"] += 1
+    if g["innings_played"] > 9:
+        totals["extra_innings"] += 1
+    for key, runs in (("away", away), ("home", home), ("total", away + home)):
+        totals["runs"][key][runs] = totals["runs"][key].get(runs, 0) + 1
+    totals["margin"][home - away] = totals["margin"].get(home - away, 0) + 1
+
+    for pid, s in g["player_stats"].items():
+        t = totals["batters"].setdefault(pid, {"name": s["name"], "team": s["team"], **{k: 0 for k in _BATTER_TOTALS}})
+        for k in _BATTER_TOTALS:
+            t[k] += s.get(k, 0)
+    for pid, s in g["pitcher_stats"].items():
+        if not s["bf"]:
+            continue
+        t = totals["pitchers"].setdefault(pid, {"name": s["name"], "team": s["team"], "apps": 0, **{k: 0 for k in _PITCHER_TOTALS}})
+        t["apps"] += 1
+        for k in _PITCHER_TOTALS:
+            t[k] += s[k]
+        totals["pitches"][s["team"]] += s["pitches"]
+
+
+def _merge_totals(into: dict, other: dict) -> None:
+    into["games"] += other["games"]
+    into["extra_innings"] += other["extra_innings"]
+    for k, v in other["wins"].items():
+        into["wins"][k] += v
+    for side, dist in other["runs"].items():
+        for runs, n in dist.items():
+            into["runs"][side][runs] = into["runs"][side].get(runs, 0) + n
+    for m, n in other["margin"].items():
+        into["margin"][m] = into["margin"].get(m, 0) + n
+    for side, n in other["pitches"].items():
+        into["pitches"][side] += n
+    for group in ("batters", "pitchers"):
+        for pid, t in other[group].items():
+            mine = into[group].get(pid)
+            if mine is None:
+                into[group][pid] = dict(t)
+                continue
+            for k, v in t.items():
+                if isinstance(v, (int, float)):
+                    mine[k] += v
+
+
+def _simulate_chunk(game_args: tuple, seeds: List[int]) -> dict:
+    """Play one game per seed and return their merged totals.
+
+    Top-level (picklable) so simulate_games() can run it in worker processes.
+    """
+    setup = _prepare_game(*game_args)
+    setup["pa_probs"] = _memoized_pa_probs(setup["pa_probs"])
+    totals = _new_totals()
+    for seed in seeds:
+        _add_game(totals, _play_game(*game_args, random.Random(seed), setup, record=False))
+    return totals
+
+
+def _distribution(counts: dict, n: int) -> Dict[int, float]:
+    return {k: round(v / n, 4) for k, v in sorted(counts.items())}
+
+
+def _summarize_totals(totals: dict) -> dict:
+    n = totals["games"] or 1
+
+    def _mean(counts):
+        return round(sum(k * v for k, v in counts.items()) / n, 2)
+
+    batters = {}
+    for pid, t in totals["batters"].items():
+        per_game = {k: round(t[k] / n, 3) for k in _BATTER_TOTALS}
+        ab = t["ab"]
+        tb = t["1b"] + 2 * t["2b"] + 3 * t["3b"] + 4 * t["hr"]
+        pa = t["pa"]
+        batters[pid] = {
+            "name": t["name"],
+            "team": t["team"],
+            **per_game,
+            "avg": round(t["h"] / ab, 3) if ab else None,
+            "obp": round((t["h"] + t["bb"] + t["hbp"]) / pa, 3) if pa else None,
+            "slg": round(tb / ab, 3) if ab else None,
+        }
+
+    pitchers = {}
+    for pid, t in totals["pitchers"].items():
+        apps = t["apps"]
+        outs = t["ip_outs"] / apps
+        pitchers[pid] = {
+            "name": t["name"],
+            "team": t["team"],
+            "appearance_pct": round(apps / n, 4),
+            # Per appearance
+            "ip": round(outs / 3, 2),
+            **{k: round(t[k] / apps, 2) for k in _PITCHER_TOTALS if k != "ip_outs"},
+            "era": round(27 * t["er"] / t["ip_outs"], 2) if t["ip_outs"] else None,
+        }
+
+    return {
+        "n": totals["games"],
+        "away_win_pct": round(totals["wins"]["away"] / n, 4),
+        "home_win_pct": round(totals["wins"]["home"] / n, 4),
+        "tie_pct": round(totals["wins"]["tie"] / n, 4),
+        "extra_innings_pct": round(totals["extra_innings"] / n, 4),
+        "avg_runs": {side: _mean(dist) for side, dist in totals["runs"].items()},
+        "run_distribution": {side: _distribution(dist, n) for side, dist in totals["runs"].items()},
+        "margin_distribution": _distribution(totals["margin"], n),
+        "avg_pitches": {side: round(v / n, 1) for side, v in totals["pitches"].items()},
+        "batters": batters,
+        "pitchers": pitchers,
+    }
+
+
+def simulate_games(
+    n: int,
+    away_lineup: List[dict],
+    home_lineup: List[dict],
+    away_pitcher: dict,
+    home_pitcher: dict,
+    away_bullpen: List[dict],
+    home_bullpen: List[dict],
+    venue: str = "NYY",
+    season: int = 2026,
+    seed: Optional[int] = None,
+    workers: int = 1,
+) -> dict:
+    """
+    Simulate the same matchup `n` times and return aggregate distributions.
+
+    Same inputs as simulate_game().  Park factors, arsenals and spray
+    profiles are loaded once (per worker), matchup-model calls are memoized
+    across games, and no per-pitch logs are built.  With workers > 1 the
+    games are split across a process pool; each game draws from its own
+    seed, so results for a given `seed` don't depend on `workers`.
+
+    Returns:
+    --------
+    Dict with win %, run / margin distributions, average pitch counts,
+    per-batter expected lines (per game) and per-pitcher lines (per
+    appearance).
+    """
+    n = max(0, int(n))
+    master = random.Random(seed)
+    seeds = [master.getrandbits(63) for _ in range(n)]
+    game_args = (away_lineup, home_lineup, away_pitcher, home_pitcher,
+                 list(away_bullpen), list(home_bullpen), venue, season)
+
+    workers = max(1, min(int(workers or 1), n or 1))
+    if workers == 1:
+        totals = _simulate_chunk(game_args, seeds)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = [seeds[i::workers] for i in range(workers)]
+        totals = _new_totals()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_simulate_chunk, [game_args] * workers, chunks):
+                _merge_totals(totals, part)
+
+    return {"ok": True, "venue": venue, "season": season, **_summarize_totals(totals)}
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -2108,14 +2350,114 @@ def _pitch_name(pitch_type: str) -> str:
 # State builder — converts raw game log into gamecast-compatible JSON at pitch N
 # ---------------------------------------------------------------------------
 
+# ---------------------------------------------------------------------------
+# Replay checkpoints
+# ---------------------------------------------------------------------------
+# simulate_game() snapshots the running state at every PA boundary, so
+# scrubbing to pitch N replays at most one PA from the nearest checkpoint
+# instead of the whole game from pitch 0.
+
+_feed_cache = get_cache("game_simulation.feed", max_entries=32, default_ttl=60 * 60)
+
+
+def _checkpoint(pitch_index, n_events, score, outs, bases, line_stats, pitcher_stats) -> dict:
+    """Compact copy of the game state just before pitch `pitch_index`."""
+    return {
+        "pitch_index": pitch_index,
+        "n_events": n_events,
+        "score": dict(score),
+        "outs": outs,
+        "bases": [b is not None for b in bases],
+        "lines": {bid: dict(s) for bid, s in line_stats.items()},
+        "pitchers": {pid: dict(s) for pid, s in pitcher_stats.items() if s["bf"] > 0},
+    }
+
+
+def _tally_line(stats: dict, p: dict) -> None:
+    """Add one pitch to the scrubber's batter lines."""
+    bid = p["batter_id"]
+    if bid not in stats:
+        stats[bid] = {"pa": 0, "ab": 0, "h": 0, "bb": 0, "k": 0, "hr": 0, "rbi": 0}
+    ev = p.get("event")
+    if not ev:
+        return
+    s = stats[bid]
+    s["pa"] += 1
+    if ev in ("1B", "2B", "3B", "HR"):
+        s["h"] += 1
+        s["ab"] += 1
+        if ev == "HR":
+            s["hr"] += 1
+    elif ev == "K":
+        s["k"] += 1
+        s["ab"] += 1
+    elif ev == "BB":
+        s["bb"] += 1
+    elif ev == "OUT":
+        s["ab"] += 1
+
+
+def _nearest_checkpoint(game_data: dict, through: int) -> Optional[dict]:
+    cps = game_data.get("checkpoints")
+    if not cps:
+        return None
+    i = bisect_right(cps, through, key=lambda c: c["pitch_index"]) - 1
+    return cps[i] if i >= 0 else None
+
+
+def _lines_through(game_data: dict, cp: Optional[dict], through: int) -> dict:
+    """Batter lines through pitch `through`, replayed from checkpoint `cp`."""
+    if cp is None:
+        stats, start = {}, 0
+    else:
+        stats = {bid: dict(s) for bid, s in cp["lines"].items()}
+        start = cp["pitch_index"]
+    for p in game_data["pitches"][start:through + 1]:
+        _tally_line(stats, p)
+    return stats
+
+
+def _feed_entry(ev: dict) -> dict:
+    return {
+        "type": ev["type"],
+        "event": ev.get("event", ev["type"]),
+        "description": ev.get("description", ""),
+        "inning": f"{'Top' if ev['half'] == 'Top' else 'Bot'} {ev['inning']}",
+        "isScoring": ev.get("runs_scored", 0) > 0,
+    }
+
+
+def _feed_through(game_data: dict, cp: Optional[dict], through: int) -> list:
+    """Formatted feed of events up to pitch `through`.
+
+    Events are appended in pitch order, so the feed is a prefix of the
+    (formatted once per game) event list; the checkpoint bounds the scan.
+    """
+    events = game_data["events"]
+    key = game_data.get("game_id")
+    feed = _feed_cache.get(key) if key else None
+    if feed is None:
+        feed = [_feed_entry(ev) for ev in events]
+        if key:
+            _feed_cache.set(key, feed)
+    n = cp["n_events"] if cp else 0
+    while n < len(events) and events[n].get("pitch_index", 999999) <= through:
+        n += 1
+    return feed[:n]
+
+
 def build_state_at_pitch(game_data: dict, through: int) -> dict:
     """
     Build a gamecast-compatible state dict showing the game through pitch N.
     This mirrors the normalize_gamecast() output so the frontend can reuse
     Game Caster rendering functions.
+
+    Work is bounded by the current PA: lineup lines and the feed resume from
+    the nearest checkpoint at or before pitch N.
     """
     pitches_all = game_data["pitches"]
     through = max(0, min(through, len(pitches_all) - 1))
+    cp = _nearest_checkpoint(game_data, through)
 
     # Replay game state up to this pitch
     score = {"away": 0, "home": 0}
@@ -2179,16 +2521,7 @@ def build_state_at_pitch(game_data: dict, through: int) -> dict:
             outs_val = min(outs_val + 1, 3)
 
     # Build feed of events through this pitch
-    feed = []
-    for ev in game_data["events"]:
-        if ev.get("pitch_index", 999999) <= through:
-            feed.append({
-                "type": ev["type"],
-                "event": ev.get("event", ev["type"]),
-                "description": ev.get("description", ""),
-                "inning": f"{'Top' if ev['half'] == 'Top' else 'Bot'} {ev['inning']}",
-                "isScoring": ev.get("runs_scored", 0) > 0,
-            })
+    feed = _feed_through(game_data, cp, through)
 
     # BIP data for current pitch
     bip = None
@@ -2216,8 +2549,9 @@ def build_state_at_pitch(game_data: dict, through: int) -> dict:
             break
 
     # Build lineups with stats through this point
-    away_lineup_state = _build_lineup_state(game_data["away_lineup"], game_data["player_stats"], "away", pitches_all, through)
-    home_lineup_state = _build_lineup_state(game_data["home_lineup"], game_data["player_stats"], "home", pitches_all, through)
+    stats_through = _lines_through(game_data, cp, through)
+    away_lineup_state = _build_lineup_state(game_data["away_lineup"], stats_through)
+    home_lineup_state = _build_lineup_state(game_data["home_lineup"], stats_through)
 
     # Linescore through current inning
     ls_away = []
@@ -2278,34 +2612,29 @@ def build_state_at_pitch(game_data: dict, through: int) -> dict:
         "currentPitchIndex": through,
         "finalScore": game_data["score"],
         "pitchingChanges": game_data["pitching_changes"],
+        # Pitching lines as of the start of the current PA
+        "pitcherLines": _pitcher_lines(cp),
     }
 
 
-def _build_lineup_state(lineup, player_stats, team, pitches_all, through):
-    """Build lineup display with stats accumulated through pitch N."""
-    result = []
-    # Compute stats through the current pitch
-    stats_through = {}
-    for p in pitches_all[:through + 1]:
-        bid = p["batter_id"]
-        if bid not in stats_through:
-            stats_through[bid] = {"pa": 0, "ab": 0, "h": 0, "bb": 0, "k": 0, "hr": 0, "rbi": 0}
-        if p.get("event"):
-            stats_through[bid]["pa"] += 1
-            ev = p["event"]
-            if ev in ("1B", "2B", "3B", "HR"):
-                stats_through[bid]["h"] += 1
-                stats_through[bid]["ab"] += 1
-                if ev == "HR":
-                    stats_through[bid]["hr"] += 1
-            elif ev == "K":
-                stats_through[bid]["k"] += 1
-                stats_through[bid]["ab"] += 1
-            elif ev == "BB":
-                stats_through[bid]["bb"] += 1
-            elif ev == "OUT":
-                stats_through[bid]["ab"] += 1
+def _pitcher_lines(cp: Optional[dict]) -> list:
+    if not cp:
+        return []
+    return [
+        {
+            "id": pid,
+            "name": s["name"],
+            "team": s["team"],
+            "ip": f"{s['ip_outs'] // 3}.{s['ip_outs'] % 3}",
+            **{k: s[k] for k in ("h", "r", "er", "bb", "k", "hr", "pitches", "bf")},
+        }
+        for pid, s in cp["pitchers"].items()
+    ]
+
 
+def _build_lineup_state(lineup, stats_through):
+    """Build lineup display from batter lines accumulated through pitch N."""
+    result = []
     for i, b in enumerate(lineup):
         s = stats_through.get(b["id"], {"pa": 0, "ab": 0, "h": 0, "bb": 0, "k": 0})
         ab = s["ab"]
@@ -0,0 +1,125 @@
+# services/games_ticker.py
+"""
+Precomputed snapshot of today's slate for the global games ticker.
+
+The ticker used to be rebuilt (schedule fetch + normalization) inside a
+context processor on every template render.  Now one snapshot is kept per
+worker and refreshed on a short TTL in a background thread: readers always
+get the last snapshot in O(1) and never wait on statsapi, except for the
+very first build after a cold start.
+
+Each snapshot carries the lightweight ticker cards served by
+/api/ticker.json and an ETag over them, so polling clients can skip
+unchanged payloads.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from services.mlb_api import get_games_for_date
+
+log = logging.getLogger(__name__)
+
+TICKER_TZ = "America/Phoenix"
+REFRESH_SECONDS = 20
+# Never make a request wait longer than this for the first snapshot
+_COLD_START_WAIT_SECONDS = 5
+
+_EMPTY = {"date": None, "games": [], "cards": [], "etag": None, "built_at": 0.0}
+
+_snapshot = dict(_EMPTY)
+_last_attempt = 0.0
+_refresh_lock = threading.Lock()
+_first_build = threading.Event()
+
+
+def _card(g: dict) -> dict:
+    status_lc = (g.get("detailedState") or "").lower()
+    is_final = "final" in status_lc or "completed" in status_lc or "game over" in status_lc
+    return {
+        "gamePk": g.get("gamePk"),
+        "statusPill": g.get("statusPill"),
+        "timeLocal": g.get("timeLocal"),
+        "isLive": g.get("isLive"),
+        "isFinal": is_final,
+        "outs": g.get("outs"),
+        "bases": g.get("bases"),
+        "away": {
+            "abbrev": g.get("away", {}).get("abbrev"),
+            "score": g.get("away", {}).get("score"),
+            "logo": g.get("away", {}).get("logo"),
+        },
+        "home": {
+            "abbrev": g.get("home", {}).get("abbrev"),
+            "score": g.get("home", {}).get("score"),
+            "logo": g.get("home", {}).get("logo"),
+        },
+    }
+
+
+def _sort_key(c: dict) -> int:
+    # Live first, then scheduled, then final
+    if c["isLive"]:
+        return 0
+    if c["isFinal"]:
+        return 2
+    return 1
+
+
+def build_snapshot() -> dict:
+    """Fetch today's full slate (all statuses) and build ticker cards."""
+    today_ymd = datetime.now(ZoneInfo(TICKER_TZ)).date().strftime("%Y-%m-%d")
+    # IMPORTANT: this returns the full day's slate; do NOT filter by status
+    # Off the request path, so live games can afford their (small) linescore fetch
+    games = get_games_for_date(today_ymd, tz_name=TICKER_TZ, include_live_context=True)
+    cards = sorted((_card(g) for g in games), key=_sort_key)
+    body = json.dumps(cards, sort_keys=True, default=str).encode("utf-8")
+    return {
+        "date": today_ymd,
+        "games": games,
+        "cards": cards,
+        "etag": hashlib.md5(body).hexdigest(),
+        "built_at": time.time(),
+    }
+
+
+def _refresh() -> None:
+    global _snapshot
+    try:
+        _snapshot = build_snapshot()
+    except Exception as e:
+        log.warning("games ticker refresh failed: %s: %s", type(e).__name__, e)
+    finally:
+        _first_build.set()
+        _refresh_lock.release()
+
+
+def get_snapshot(wait: bool = True) -> dict:
+    """Current ticker snapshot; kicks off a background refresh when stale.
+
+    Only a cold worker can block (up to a few seconds, and only with
+    `wait`).  A snapshot from a previous day is treated as empty so the
+    ticker never shows yesterday's slate while today's is loading.
+    """
+    global _last_attempt
+    snap = _snapshot
+    now = time.time()
+    # Keyed on the last attempt, not the last success, so a failing
+    # upstream is retried once per interval rather than on every request
+    if now - _last_attempt >= REFRESH_SECONDS and _refresh_lock.acquire(blocking=False):
+        _last_attempt = now
+        threading.Thread(target=_refresh, name="games-ticker", daemon=True).start()
+    if wait and not _first_build.is_set():
+        _first_build.wait(timeout=_COLD_START_WAIT_SECONDS)
+        snap = _snapshot
+    today_ymd = datetime.now(ZoneInfo(TICKER_TZ)).date().strftime("%Y-%m-%d")
+    if snap["date"] != today_ymd:
+        return _EMPTY
+    return snap
@@ -10,11 +10,24 @@ Usage:
     from services.hr_park_calc import stadiums_hr_count
     result = stadiums_hr_count(exit_velo=105, launch_angle=28, spray_angle=-10)
     # result = {count: 22, total: 30, parks: [{team, name, is_hr, margin_ft}, ...]}
+
+Ball heights come from a precomputed trajectory grid (see
+build_trajectory_grid / scripts/build_hr_trajectory_grid.py) when it is
+present, and from a direct trajectory simulation otherwise.
 """
 
+import bisect
+import hashlib
+import logging
 import math
+import os
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 
+import numpy as np
+
+log = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 #  Physics constants
 # ---------------------------------------------------------------------------
@@ -924,17 +937,206 @@ def _ball_height_at_distance(
     Interpolate the ball's height at a given horizontal distance.
     Returns None if the ball never reaches that distance.
     """
+    # Horizontal distance only ever turns back on near-vertical pop-ups
+    # (LA > ~78), so binary search and fall back to a scan if the found
+    # segment doesn't bracket the fence.
+    i = bisect.bisect_left(trajectory, fence_dist, lo=1, key=lambda p: p[0])
+    if i < len(trajectory) and trajectory[i - 1][0] <= fence_dist <= trajectory[i][0]:
+        return _interp_segment(trajectory[i - 1], trajectory[i], fence_dist)
     for i in range(1, len(trajectory)):
-        d0, h0 = trajectory[i - 1]
-        d1, h1 = trajectory[i]
-        if d0 <= fence_dist <= d1:
-            if d1 == d0:
-                return h1
-            frac = (fence_dist - d0) / (d1 - d0)
-            return h0 + frac * (h1 - h0)
+        if trajectory[i - 1][0] <= fence_dist <= trajectory[i][0]:
+            return _interp_segment(trajectory[i - 1], trajectory[i], fence_dist)
     return None  # ball didn't reach the fence
 
 
+def _interp_segment(p0, p1, fence_dist: float) -> float:
+    d0, h0 = p0
+    d1, h1 = p1
+    if d1 == d0:
+        return h1
+    frac = (fence_dist - d0) / (d1 - d0)
+    return h0 + frac * (h1 - h0)
+
+
+def _simulate_trajectories(ev_mph, la_deg, rho, dist_ft, floor_ft: float = -150.0) -> np.ndarray:
+    """
+    Integrate many trajectories at once; returns heights (ft) at each of
+    `dist_ft`, shape (n_balls, len(dist_ft)).
+
+    Same drag/lift model and 5ms Euler step as _simulate_trajectory, but the
+    ball keeps falling below ground level (negative heights, down to
+    floor_ft) so height-vs-distance curves stay continuous for
+    interpolation.  NaN where a ball never gets that far.
+    """
+    ev_mph, la_deg, rho = (a.ravel() for a in np.broadcast_arrays(
+        np.asarray(ev_mph, dtype=np.float64),
+        np.asarray(la_deg, dtype=np.float64),
+        np.asarray(rho, dtype=np.float64),
+    ))
+    dist_m = np.asarray(dist_ft, dtype=np.float64) * FT_TO_M
+    n, m = len(ev_mph), len(dist_m)
+    out = np.full((n, m), np.nan)
+
+    ev = ev_mph * MPH_TO_MS
+    la = np.radians(la_deg)
+    vx = ev * np.cos(la)
+    vz = ev * np.sin(la)
+    x = np.zeros(n)
+    z = np.full(n, CONTACT_HEIGHT_FT * FT_TO_M)
+    idx = np.arange(n)             # balls still in flight
+    nxt = np.zeros(n, dtype=np.int64)  # next distance to record, per ball
+    floor_m = floor_ft * FT_TO_M
+    dt = 0.005
+
+    for _ in range(3000):
+        v = np.sqrt(vx * vx + vz * vz)
+        keep = (v >= 0.5) & (nxt < m) & (z >= floor_m)
+        if not keep.all():
+            idx, v, vx, vz, x, z, rho, nxt = (
+                a[keep] for a in (idx, v, vx, vz, x, z, rho, nxt))
+            if not len(idx):
+                break
+
+        cd = 0.29 + 0.22 / (1 + np.exp((v - 32.37) / 5.2))
+        q = 0.5 * rho * BALL_AREA * v * v
+        fd = cd * q
+        fl = LIFT_COEFF * q
+        vx = vx + (-fd * vx - fl * vz) / (v * BALL_MASS) * dt
+        vz = vz + (-GRAVITY + (-fd * vz + fl * vx) / (v * BALL_MASS)) * dt
+        x_prev, z_prev = x, z
+        x = x + vx * dt
+        z = z + vz * dt
+
+        # Record every grid distance crossed during this step
+        while True:
+            hit = np.flatnonzero((nxt < m) & (x >= dist_m[np.minimum(nxt, m - 1)]))
+            if not len(hit):
+                break
+            k = nxt[hit]
+            frac = (dist_m[k] - x_prev[hit]) / (x[hit] - x_prev[hit])
+            out[idx[hit], k] = z_prev[hit] + frac * (z[hit] - z_prev[hit])
+            nxt[hit] += 1
+
+    return out / FT_TO_M
+
+
+# ---------------------------------------------------------------------------
+#  Precomputed trajectory grid
+#  Heights (ft) of the ball at each GRID_DIST for every (EV, LA, park air)
+#  combination, as float32 (n_ev, n_la, n_env, n_dist).  The env axis holds
+#  the (elevation, temp) buckets stadiums_hr_count simulates for the 30 MLB
+#  parks.  The file is memory-mapped; a request reads one 2x2 EV/LA cell.
+# ---------------------------------------------------------------------------
+
+GRID_EV = np.arange(60.0, 126.0, 1.0)      # mph
+GRID_LA = np.arange(10.0, 51.0, 1.0)       # degrees
+GRID_DIST = np.arange(300.0, 432.0, 2.0)   # ft from home plate
+GRID_DIR = os.environ.get(
+    "HR_GRID_DIR", os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "data")))
+
+
+def _env_key(info: Dict) -> Tuple[int, int]:
+    """(elevation, temp) bucket: nearest 250 ft and 5 degrees F."""
+    return round(info["elevation"] / 250) * 250, round(info["temp"] / 5) * 5
+
+
+_MLB_PARKS = [team for team in _STADIUMS if not team.startswith("ST_")]
+GRID_ENVS = sorted({_env_key(_STADIUMS[team]) for team in _MLB_PARKS})
+_ENV_INDEX = {env: i for i, env in enumerate(GRID_ENVS)}
+
+
+def grid_path() -> str:
+    """Grid file for the current axes; any axis change gives a new name."""
+    axes = repr((GRID_EV.tolist(), GRID_LA.tolist(), GRID_DIST.tolist(), GRID_ENVS, LIFT_COEFF))
+    digest = hashlib.md5(axes.encode()).hexdigest()[:10]
+    return os.path.join(GRID_DIR, f"hr_trajectory_grid_{digest}.npy")
+
+
+def build_trajectory_grid(path: Optional[str] = None) -> str:
+    """Simulate every grid trajectory and write the .npy file; returns its path."""
+    path = path or grid_path()
+    shape = (len(GRID_EV), len(GRID_LA), len(GRID_ENVS), len(GRID_DIST))
+    grid = np.empty(shape, dtype=np.float32)
+    ev, la = np.meshgrid(GRID_EV, GRID_LA, indexing="ij")
+    for e, (elev, temp) in enumerate(GRID_ENVS):
+        heights = _simulate_trajectories(ev, la, _air_density(elev, temp), GRID_DIST)
+        grid[:, :, e, :] = heights.reshape(len(GRID_EV), len(GRID_LA), len(GRID_DIST))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, grid)
+    os.replace(tmp, path)
+    return path
+
+
+_grid = None
+_grid_loaded = False
+
+
+def _load_grid():
+    """The memory-mapped grid, or None if it hasn't been built."""
+    global _grid, _grid_loaded
+    if not _grid_loaded:
+        _grid_loaded = True
+        path = grid_path()
+        expected = (len(GRID_EV), len(GRID_LA), len(GRID_ENVS), len(GRID_DIST))
+        try:
+            grid = np.load(path, mmap_mode="r")
+            if grid.shape != expected:
+                raise ValueError(f"grid shape {grid.shape}, expected {expected}")
+            _grid = grid
+        except FileNotFoundError:
+            log.info("No HR trajectory grid at %s; simulating trajectories per request", path)
+        except Exception as e:
+            log.warning("Ignoring HR trajectory grid %s: %s", path, e)
+    return _grid
+
+
+def _grid_heights(exit_velo: float, launch_angle: float,
+                  env_idx: np.ndarray, fence_dist: np.ndarray) -> Optional[np.ndarray]:
+    """Ball heights (ft) at each park's fence from the grid, NaN where the
+    ball lands first.  None if the grid is missing or doesn't cover the input."""
+    grid = _load_grid()
+    if grid is None:
+        return None
+    if not (GRID_EV[0] <= exit_velo <= GRID_EV[-1] and GRID_LA[0] <= launch_angle <= GRID_LA[-1]):
+        return None
+    if fence_dist.min() < GRID_DIST[0] or fence_dist.max() > GRID_DIST[-1]:
+        return None
+
+    fi = (exit_velo - GRID_EV[0]) / (GRID_EV[1] - GRID_EV[0])
+    i = min(int(fi), len(GRID_EV) - 2)
+    u = fi - i
+    fj = (launch_angle - GRID_LA[0]) / (GRID_LA[1] - GRID_LA[0])
+    j = min(int(fj), len(GRID_LA) - 2)
+    w = fj - j
+    cell = np.asarray(grid[i:i + 2, j:j + 2], dtype=np.float64)
+    curves = ((1 - u) * ((1 - w) * cell[0, 0] + w * cell[0, 1])
+              + u * ((1 - w) * cell[1, 0] + w * cell[1, 1]))
+
+    fd = (fence_dist - GRID_DIST[0]) / (GRID_DIST[1] - GRID_DIST[0])
+    d = np.minimum(fd.astype(np.int64), len(GRID_DIST) - 2)
+    s = fd - d
+    h0 = curves[env_idx, d]
+    h1 = curves[env_idx, d + 1]
+    heights = h0 + s * (h1 - h0)
+    # Only a corner that never reached the distance at all gives NaN here;
+    # let the caller simulate that ball directly
+    if np.isnan(heights).any():
+        return None
+    heights[heights < 0] = np.nan  # landed before the fence
+    return heights
+
+
+@lru_cache(maxsize=2048)
+def _fence_profile(theta: float):
+    """Per-park fence distance/height and env bucket at `theta`, MLB parks only."""
+    dist = np.array([_eval_fence_distance(_STADIUMS[t]["dist"], theta) for t in _MLB_PARKS])
+    height = np.array([_eval_fence_height(_STADIUMS[t]["height"], theta) for t in _MLB_PARKS])
+    env_idx = np.array([_ENV_INDEX[_env_key(_STADIUMS[t])] for t in _MLB_PARKS])
+    return dist, height, env_idx
+
+
 # ---------------------------------------------------------------------------
 #  Public API
 # ---------------------------------------------------------------------------
@@ -963,7 +1165,7 @@ def stadiums_hr_count(
     theta = 45.0 + spray_angle
 
     # Only count the 30 MLB stadiums (not ST_ spring training parks)
-    mlb_total = sum(1 for k in _STADIUMS if not k.startswith("ST_"))
+    mlb_total = len(_MLB_PARKS)
 
     # Foul ball check
     if theta < 0 or theta > 90:
@@ -974,29 +1176,27 @@ def stadiums_hr_count(
             "error": "Foul ball — spray angle outside fair territory",
         }
 
-    # Cache trajectories by elevation bucket (round to nearest 250 ft)
-    # to avoid redundant simulations for similar elevations
-    _traj_cache = {}
+    fence_dists, fence_hts, env_idx = _fence_profile(theta)
+    ball_hts = _grid_heights(exit_velo, launch_angle, env_idx, fence_dists)
+
+    if ball_hts is None:
+        # Simulate once per elevation/temperature bucket (nearest 250 ft /
+        # 5 F) rather than once per park
+        trajs = {
+            env: _simulate_trajectory(exit_velo, launch_angle, *env)
+            for env in {GRID_ENVS[e] for e in env_idx}
+        }
+        ball_hts = [
+            _ball_height_at_distance(trajs[GRID_ENVS[e]], fd)
+            for e, fd in zip(env_idx, fence_dists)
+        ]
+    else:
+        ball_hts = [None if math.isnan(h) else float(h) for h in ball_hts]
 
     results = []
-    for team, info in _STADIUMS.items():
-        # Skip spring training parks — only use 30 MLB stadiums for count
-        if team.startswith("ST_"):
-            continue
-        fence_dist = _eval_fence_distance(info["dist"], theta)
-        fence_ht = _eval_fence_height(info["height"], theta)
-
-        # Round elevation to nearest 250 ft for caching
-        elev_key = round(info["elevation"] / 250) * 250
-        temp_key = round(info["temp"] / 5) * 5
-        cache_key = (elev_key, temp_key)
-        if cache_key not in _traj_cache:
-            _traj_cache[cache_key] = _simulate_trajectory(
-                exit_velo, launch_angle, elev_key, temp_key
-            )
-        traj = _traj_cache[cache_key]
-
-        ball_ht = _ball_height_at_distance(traj, fence_dist)
+    for team, fence_dist, fence_ht, ball_ht in zip(_MLB_PARKS, fence_dists, fence_hts, ball_hts):
+        fence_dist = float(fence_dist)
+        fence_ht = float(fence_ht)
         if ball_ht is not None:
             margin = ball_ht - fence_ht
             is_hr = margin > 0
@@ -1006,7 +1206,7 @@ def stadiums_hr_count(
 
         results.append({
             "team": team,
-            "name": info["name"],
+            "name": _STADIUMS[team]["name"],
             "is_hr": is_hr,
             "fence_dist": round(fence_dist, 1),
             "fence_height": round(fence_ht, 1),
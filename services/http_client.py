@@ -0,0 +1,166 @@
+# services/http_client.py
+"""
+Shared HTTP client for the MLB Stats API (and other upstream JSON APIs).
+
+One pooled `requests.Session` per worker, so live-game polling reuses warm
+keep-alive connections instead of paying a TLS handshake on every refresh.
+On top of the session:
+
+- bounded retries with exponential backoff for connection errors and
+  429/5xx responses (GET only, honours Retry-After)
+- per-endpoint timeouts — see `_ENDPOINT_TIMEOUTS`
+- conditional GETs: when a response carries an ETag or Last-Modified, the
+  body is kept and the next request for that URL revalidates with
+  If-None-Match / If-Modified-Since; a 304 is answered from the stored body
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from services.ttl_cache import get_cache
+
+CONNECT_TIMEOUT = 3.05
+DEFAULT_READ_TIMEOUT = 10
+
+# Read timeouts by URL path fragment; first match wins.  These keep the
+# per-call limits mlb_api used before the client existed: full live feeds
+# are the biggest payloads statsapi serves (their diffPatch deltas are
+# small), and schedule, league-wide stats and player lists fan out
+# server-side.  /people is ahead of /stats so per-player stat lookups keep
+# their shorter limit; the yearByYear career hydrations pass their own.
+_ENDPOINT_TIMEOUTS = (
+    ("/feed/live/diffPatch", 5),
+    ("/feed/live", 30),
+    ("/linescore", 5),
+    ("/schedule", 30),
+    ("/standings", 20),
+    ("/sports/1/players", 30),
+    ("/roster", 25),
+    ("/transactions", 20),
+    ("/people", 20),
+    ("/stats", 30),
+    ("/teams", 10),
+)
+
+_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=1,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# url -> (etag, last_modified, status, headers, content, encoding)
+_validators = get_cache("http_client.validators", max_entries=512,
+                        max_bytes=64 * 1024 * 1024, default_ttl=60 * 60)
+
+
+def get_session() -> requests.Session:
+    """The worker's shared, connection-pooled session (created lazily)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=_RETRY)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                s.headers.update({"Accept": "application/json", "User-Agent": "basenerd/1.0"})
+                _session = s
+    return _session
+
+
+def timeout_for(url: str, read: Optional[float] = None) -> Tuple[float, float]:
+    """(connect, read) timeout for `url`; an explicit `read` wins."""
+    if read is None:
+        read = DEFAULT_READ_TIMEOUT
+        path = urlsplit(url).path
+        for fragment, seconds in _ENDPOINT_TIMEOUTS:
+            if fragment in path:
+                read = seconds
+                break
+    return CONNECT_TIMEOUT, float(read)
+
+
+def _from_stored(stored, url: str) -> requests.Response:
+    _, _, status, headers, content, encoding = stored
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers)
+    resp._content = content
+    resp.encoding = encoding
+    resp.url = url
+    return resp
+
+
+def get(
+    url: str,
+    params=None,
+    headers: Optional[dict] = None,
+    timeout: Union[None, float, Tuple[float, float]] = None,
+    revalidate: bool = True,
+) -> requests.Response:
+    """GET through the pooled session.
+
+    Same return value as `requests.get`.  `timeout` may be a read timeout in
+    seconds or a full (connect, read) tuple; by default it comes from the
+    endpoint table.
+    """
+    session = get_session()
+    if not isinstance(timeout, tuple):
+        timeout = timeout_for(url, timeout)
+
+    full_url = url
+    req_headers = dict(headers or {})
+    stored = None
+    if revalidate:
+        try:
+            full_url = requests.Request("GET", url, params=params).prepare().url
+        except Exception:
+            revalidate = False
+        else:
+            stored = _validators.get(full_url)
+            if stored is not None:
+                etag, last_modified = stored[0], stored[1]
+                if etag:
+                    req_headers.setdefault("If-None-Match", etag)
+                if last_modified:
+                    req_headers.setdefault("If-Modified-Since", last_modified)
+
+    resp = session.get(url, params=params, headers=req_headers or None, timeout=timeout)
+
+    if resp.status_code == 304 and stored is not None:
+        return _from_stored(stored, full_url)
+
+    if revalidate and resp.status_code == 200:
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            _validators.set(
+                full_url,
+                (etag, last_modified, resp.status_code, dict(resp.headers),
+                 resp.content, resp.encoding),
+                size=len(resp.content),
+            )
+    return resp
+
+
+def get_json(url: str, params=None, headers: Optional[dict] = None,
+             timeout: Union[None, float, Tuple[float, float]] = None):
+    """GET and decode JSON, raising for non-2xx statuses."""
+    resp = get(url, params=params, headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    return resp.json()
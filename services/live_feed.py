@@ -0,0 +1,322 @@
+# services/live_feed.py
+"""
+Incremental ingestion of statsapi live feeds.
+
+A live game is polled every few seconds, and late in a game the full
+`feed/live` document is several MB while the change since the last poll is
+a pitch or two.  statsapi serves those changes as JSON Patch operations:
+
+    GET /api/v1.1/game/{pk}/feed/live/diffPatch?startTimecode=<metaData.timeStamp>
+
+which answers with a list of `{"diff": [ops...]}` blocks (empty when
+nothing changed) or, when the gap is too large to diff, the full document.
+
+This module keeps the last full document and its timecode per tracked game
+and brings it up to date from those deltas.  Patches are applied
+copy-on-write: only the containers on a patched path are copied, so any
+document handed out earlier is never mutated and unchanged plays keep their
+identity from poll to poll.  Each poll also records which `allPlays`
+indexes changed, so consumers can rework only those plays.
+
+services/mlb_api.get_game_feed seeds a game with a full fetch and then goes
+through `poll`; anything unexpected (an HTTP error, a patch that does not
+apply) drops the game so the next read falls back to a full fetch.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, List, Optional, Set, Tuple
+
+from services import http_client
+from services.ttl_cache import get_cache
+
+log = logging.getLogger(__name__)
+
+DIFF_URL = "https://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live/diffPatch"
+
+# A game untouched this long is dropped (suspended, or nobody watching)
+TRACK_TTL_SECONDS = 60 * 60
+
+_PLAYS_PATH = ("liveData", "plays", "allPlays")
+
+
+class PatchError(ValueError):
+    """A JSON Patch operation does not apply to the document."""
+
+
+class LiveFeed:
+    """Last known state of one tracked game.
+
+    Attributes:
+        doc: the current full feed document (never mutated in place).
+        timecode: its `metaData.timeStamp`, the next diffPatch start.
+        changed_plays: `allPlays` indexes changed by the last poll, or None
+            when the whole document was replaced.
+        polled_at: time of the last successful poll.
+    """
+
+    __slots__ = ("doc", "timecode", "changed_plays", "polled_at", "nbytes", "lock")
+
+    def __init__(self, doc: dict, nbytes: int = 0):
+        self.doc = doc
+        self.timecode = _timecode(doc)
+        self.changed_plays: Optional[Set[int]] = None
+        self.polled_at = time.time()
+        self.nbytes = int(nbytes)
+        self.lock = threading.Lock()
+
+
+# game_pk -> LiveFeed
+_games = get_cache("live_feed.games", max_entries=64, max_bytes=512 * 1024 * 1024,
+                   default_ttl=TRACK_TTL_SECONDS)
+
+
+def _timecode(doc: dict) -> Optional[str]:
+    return ((doc or {}).get("metaData") or {}).get("timeStamp") or None
+
+
+# ----------------------------
+# JSON Patch (RFC 6902), copy-on-write
+# ----------------------------
+def _pointer(path: str) -> List[str]:
+    if path == "":
+        return []
+    if not path.startswith("/"):
+        raise PatchError(f"bad pointer {path!r}")
+    return [p.replace("~1", "/").replace("~0", "~") for p in path[1:].split("/")]
+
+
+def _index(container: list, token: str, allow_end: bool = False) -> int:
+    if token == "-" and allow_end:
+        return len(container)
+    try:
+        i = int(token)
+    except ValueError:
+        raise PatchError(f"bad list index {token!r}") from None
+    if i < 0 or i > len(container) or (i == len(container) and not allow_end):
+        raise PatchError(f"list index {i} out of range")
+    return i
+
+
+def _child(container: Any, token: str) -> Any:
+    if isinstance(container, dict):
+        if token not in container:
+            raise PatchError(f"missing key {token!r}")
+        return container[token]
+    if isinstance(container, list):
+        return container[_index(container, token)]
+    raise PatchError(f"cannot descend into {type(container).__name__}")
+
+
+def _get(doc: Any, tokens: List[str]) -> Any:
+    node = doc
+    for t in tokens:
+        node = _child(node, t)
+    return node
+
+
+def _copy(node: Any) -> Any:
+    return dict(node) if isinstance(node, dict) else list(node)
+
+
+def _set(doc: Any, tokens: List[str], op: str, value: Any = None) -> Any:
+    """Return a copy of `doc` with `op` ("add" / "replace" / "remove")
+    applied at `tokens`; containers off the path are shared, not copied."""
+    if not tokens:
+        if op == "remove":
+            raise PatchError("cannot remove the document root")
+        return value
+
+    root = parent = _copy(doc)
+    for t in tokens[:-1]:
+        if not isinstance(parent, (dict, list)):
+            raise PatchError(f"cannot descend into {type(parent).__name__}")
+        key = t if isinstance(parent, dict) else _index(parent, t)
+        node = _child(parent, t)
+        if not isinstance(node, (dict, list)):
+            raise PatchError(f"cannot descend into {type(node).__name__}")
+        parent[key] = _copy(node)
+        parent = parent[key]
+
+    last = tokens[-1]
+    if isinstance(parent, dict):
+        if op != "add" and last not in parent:
+            raise PatchError(f"missing key {last!r}")
+        if op == "remove":
+            del parent[last]
+        else:
+            parent[last] = value
+    elif isinstance(parent, list):
+        i = _index(parent, last, allow_end=(op == "add"))
+        if op == "add":
+            parent.insert(i, value)
+        elif op == "replace":
+            parent[i] = value
+        else:
+            del parent[i]
+    else:
+        raise PatchError(f"cannot patch into {type(parent).__name__}")
+    return root
+
+
+def _play_count(doc: Any) -> Optional[int]:
+    try:
+        return len(_get(doc, list(_PLAYS_PATH)))
+    except (PatchError, TypeError):
+        return None
+
+
+def _touched_play(tokens: List[str], doc: Any) -> Tuple[bool, Optional[int]]:
+    """(touches allPlays at all, index of the play touched or None for the
+    whole list) for a pointer into `doc`, the document before the op."""
+    n = len(_PLAYS_PATH)
+    if tuple(tokens[:n]) != _PLAYS_PATH[:len(tokens[:n])]:
+        return False, None
+    if len(tokens) <= n:
+        return True, None
+    if tokens[n] == "-":
+        return True, _play_count(doc)
+    try:
+        return True, int(tokens[n])
+    except ValueError:
+        return True, None
+
+
+def apply_patch(doc: dict, ops: List[dict]) -> Tuple[dict, Optional[Set[int]]]:
+    """Apply JSON Patch `ops` to `doc` without mutating it.
+
+    Returns (new document, indexes of the `allPlays` entries that were added
+    or changed); the index set is None if the list was replaced wholesale.
+    Raises PatchError when an operation does not apply.
+    """
+    changed: Optional[Set[int]] = set()
+    for o in ops:
+        try:
+            kind = o["op"]
+            tokens = _pointer(o["path"])
+        except (KeyError, TypeError):
+            raise PatchError(f"malformed op {o!r}") from None
+
+        for ptr in (tokens, _pointer(o["from"]) if "from" in o else None):
+            is_source = ptr is not tokens
+            if ptr is None or changed is None or kind == "test" or (is_source and kind == "copy"):
+                continue
+            hit, idx = _touched_play(ptr, doc)
+            if not hit:
+                continue
+            # Adding or removing a play anywhere but the end shifts every
+            # later index, so treat that as the list being rewritten
+            if len(ptr) == len(_PLAYS_PATH) + 1 and kind != "replace":
+                appends = kind in ("add", "copy") and not is_source and idx == _play_count(doc)
+                if not appends:
+                    idx = None
+            if idx is None:
+                changed = None
+            else:
+                changed.add(idx)
+
+        if kind in ("add", "replace"):
+            if "value" not in o:
+                raise PatchError(f"{kind} without a value")
+            doc = _set(doc, tokens, kind, o["value"])
+        elif kind == "remove":
+            doc = _set(doc, tokens, "remove")
+        elif kind in ("move", "copy"):
+            src = _pointer(o.get("from", ""))
+            value = _get(doc, src)
+            if kind == "move":
+                doc = _set(doc, src, "remove")
+            doc = _set(doc, tokens, "add", value)
+        elif kind == "test":
+            if _get(doc, tokens) != o.get("value"):
+                raise PatchError(f"test failed at {o['path']!r}")
+        else:
+            raise PatchError(f"unknown op {kind!r}")
+    return doc, changed
+
+
+def _diff_ops(body: list) -> List[dict]:
+    """Flatten a diffPatch response into one list of operations."""
+    ops: List[dict] = []
+    for block in body:
+        if isinstance(block, dict) and "op" in block:
+            ops.append(block)
+        elif isinstance(block, dict):
+            ops.extend(block.get("diff") or [])
+        else:
+            raise PatchError(f"unexpected diff block {type(block).__name__}")
+    return ops
+
+
+# ----------------------------
+# Tracked games
+# ----------------------------
+def track(game_pk: int, doc: dict, nbytes: int = 0) -> None:
+    """Start (or restart) incremental polling from a freshly fetched full feed."""
+    if not _timecode(doc):
+        return
+    _games.set(int(game_pk), LiveFeed(doc, nbytes), size=nbytes or None)
+
+
+def forget(game_pk: int) -> None:
+    _games.pop(int(game_pk), None)
+
+
+def get(game_pk: int) -> Optional[LiveFeed]:
+    return _games.get(int(game_pk))
+
+
+def changed_plays(game_pk: int) -> Optional[Set[int]]:
+    """`allPlays` indexes changed by the game's last poll (None if unknown)."""
+    feed = get(game_pk)
+    return set(feed.changed_plays) if feed is not None and feed.changed_plays is not None else None
+
+
+def poll(game_pk: int) -> Optional[dict]:
+    """Bring a tracked game's feed up to date from diffPatch.
+
+    Returns the current document, or None when the game is not tracked or
+    the delta could not be applied; the caller then does a full fetch (and
+    `track`s the result again).
+    """
+    game_pk = int(game_pk)
+    feed = get(game_pk)
+    if feed is None or not feed.timecode:
+        return None
+
+    with feed.lock:
+        try:
+            r = http_client.get(
+                DIFF_URL.format(game_pk=game_pk),
+                params={"startTimecode": feed.timecode},
+                revalidate=False,
+            )
+            if r.status_code != 200:
+                raise PatchError(f"diffPatch status={r.status_code}")
+            body = r.json()
+
+            if isinstance(body, dict):
+                # Gap too large to diff: statsapi sent the whole document
+                if not _timecode(body):
+                    raise PatchError("full document without metaData.timeStamp")
+                feed.doc, feed.changed_plays = body, None
+                feed.nbytes = len(r.content)
+            elif isinstance(body, list):
+                feed.doc, feed.changed_plays = apply_patch(feed.doc, _diff_ops(body))
+            else:
+                raise PatchError(f"unexpected diffPatch body {type(body).__name__}")
+        except Exception as e:
+            log.info("live feed %s: dropping incremental state (%s: %s)",
+                     game_pk, type(e).__name__, e)
+            forget(game_pk)
+            return None
+
+        feed.timecode = _timecode(feed.doc) or feed.timecode
+        feed.polled_at = time.time()
+
+    # Refresh the entry's TTL (and its size once a full document came back)
+    _games.set(game_pk, feed, size=feed.nbytes or None)
+    return feed.doc
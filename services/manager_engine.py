@@ -11,9 +11,10 @@ when a real manager would plausibly consider them.
 from __future__ import annotations
 
 import logging
-import time
 from datetime import datetime
 
+from services.ttl_cache import get_cache
+
 log = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -61,9 +62,9 @@ SB_BREAKEVEN = {
     (2, 2): 0.798,
 }
 
-# Module-level cache: (game_pk, key_tuple) -> (result, timestamp)
-_cache: dict = {}
+# Module-level cache: (game_pk, key_tuple) -> result
 _CACHE_TTL = 10  # seconds
+_cache = get_cache("manager_engine", max_entries=256, default_ttl=_CACHE_TTL)
 
 
 # ===================================================================
@@ -95,10 +96,8 @@ def evaluate_decisions(feed: dict, game_pk: int) -> list[dict]:
         ctx["batter_id"], ctx["pitcher_id"], ctx["base_state"],
     )
     cached = _cache.get(cache_key)
-    if cached:
-        result, ts = cached
-        if time.time() - ts < _CACHE_TTL:
-            return result
+    if cached is not None:
+        return cached
 
     recommendations = []
 
@@ -167,7 +166,7 @@ def evaluate_decisions(feed: dict, game_pk: int) -> list[dict]:
     recommendations.sort(key=lambda r: r.get("confidence", 0), reverse=True)
     result = recommendations[:2]
 
-    _cache[cache_key] = (result, time.time())
+    _cache.set(cache_key, result)
     return result
 
 
@@ -572,6 +571,43 @@ def _evaluate_bunt(ctx: dict) -> dict | None:
     }
 
 
+def _score_candidates(candidates: list[dict], make_pair, context: dict, label: str) -> list:
+    """Matchup results for `candidates`, in order (None where one failed).
+
+    Each candidate's row is built on its own, so a bad one is skipped rather
+    than sinking the others; the rest share one batched model call.  If that
+    call fails, candidates are scored one at a time.
+    """
+    from services.matchup_predict import predict_matchup_live, predict_matchups_batch
+
+    results = [None] * len(candidates)
+    pairs, idx = [], []
+    for i, cand in enumerate(candidates):
+        try:
+            pairs.append(make_pair(cand))
+            idx.append(i)
+        except Exception as e:
+            log.debug("%s eval error for %s: %s", label, cand.get("id"), e)
+    if not pairs:
+        return results
+
+    try:
+        scored = predict_matchups_batch(pairs, context=context)
+    except Exception as e:
+        log.debug("%s batch eval error, scoring one by one: %s", label, e)
+        scored = []
+        for pair in pairs:
+            try:
+                scored.append(predict_matchup_live(**{**context, **pair}))
+            except Exception as e:
+                log.debug("%s eval error for %s: %s", label, pair, e)
+                scored.append(None)
+
+    for i, result in zip(idx, scored):
+        results[i] = result
+    return results
+
+
 def _evaluate_pitching_change(ctx: dict, relievers: list[dict]) -> dict | None:
     """Evaluate whether to pull the current pitcher."""
     if not relievers:
@@ -605,48 +641,49 @@ def _evaluate_pitching_change(ctx: dict, relievers: list[dict]) -> dict | None:
 
     current_obp = current_result.get("summary", {}).get("obp", 0.320)
 
-    # Evaluate top 3 relievers
-    best = None
-    for rel in relievers[:3]:
-        try:
-            # Resolve batter stand for switch hitters vs this reliever
-            rel_stand = ctx["stand"]
-            if rel_stand == "S":
-                rel_stand = "L" if rel["throws"] == "R" else "R"
-
-            rel_result = predict_matchup_live(
-                batter_id=ctx["batter_id"],
-                pitcher_id=rel["id"],
-                stand=rel_stand,
-                p_throws=rel["throws"],
-                venue=ctx["venue"],
-                season=ctx["season"],
-                inning=ctx["inning"],
-                outs=ctx["outs"],
-                runner_1b=1 if ctx["runner_1b_id"] else 0,
-                runner_2b=1 if ctx["runner_2b_id"] else 0,
-                runner_3b=1 if ctx["runner_3b_id"] else 0,
-                n_thru_order=1,
-            )
-            if not rel_result.get("ok"):
-                continue
+    # Evaluate top 3 relievers (one batched model call)
+    def _rel_stand(rel):
+        # Resolve batter stand for switch hitters vs this reliever
+        if ctx["stand"] == "S":
+            return "L" if rel["throws"] == "R" else "R"
+        return ctx["stand"]
+
+    candidates = relievers[:3]
+    rel_results = _score_candidates(
+        candidates,
+        lambda rel: {"pitcher_id": rel["id"], "stand": _rel_stand(rel), "p_throws": rel["throws"]},
+        context={
+            "batter_id": ctx["batter_id"],
+            "venue": ctx["venue"],
+            "season": ctx["season"],
+            "inning": ctx["inning"],
+            "outs": ctx["outs"],
+            "runner_1b": 1 if ctx["runner_1b_id"] else 0,
+            "runner_2b": 1 if ctx["runner_2b_id"] else 0,
+            "runner_3b": 1 if ctx["runner_3b_id"] else 0,
+            "n_thru_order": 1,
+        },
+        label="reliever",
+    )
 
-            rel_obp = rel_result.get("summary", {}).get("obp", 0.320)
-            improvement = current_obp - rel_obp
-
-            if improvement >= OBP_IMPROVE_THRESH_PC:
-                if best is None or improvement > best["improvement"]:
-                    best = {
-                        "reliever": rel,
-                        "improvement": improvement,
-                        "rel_obp": rel_obp,
-                        "rel_k_pct": rel_result.get("summary", {}).get("k_pct", 0),
-                        "cur_k_pct": current_result.get("summary", {}).get("k_pct", 0),
-                    }
-        except Exception as e:
-            log.debug("reliever eval error for %s: %s", rel.get("id"), e)
+    best = None
+    for rel, rel_result in zip(candidates, rel_results):
+        if not rel_result or not rel_result.get("ok"):
             continue
 
+        rel_obp = rel_result.get("summary", {}).get("obp", 0.320)
+        improvement = current_obp - rel_obp
+
+        if improvement >= OBP_IMPROVE_THRESH_PC:
+            if best is None or improvement > best["improvement"]:
+                best = {
+                    "reliever": rel,
+                    "improvement": improvement,
+                    "rel_obp": rel_obp,
+                    "rel_k_pct": rel_result.get("summary", {}).get("k_pct", 0),
+                    "cur_k_pct": current_result.get("summary", {}).get("k_pct", 0),
+                }
+
     if not best:
         return None
 
@@ -721,43 +758,45 @@ def _evaluate_pinch_hit(ctx: dict, bench: list[dict]) -> dict | None:
         scored.append((platoon_bonus, bp))
     scored.sort(key=lambda x: x[0], reverse=True)
 
+    def _bp_stand(bp):
+        if bp["bat_side"] == "S":
+            return "L" if ctx["p_throws"] == "R" else "R"
+        return bp["bat_side"]
+
+    candidates = [bp for _, bp in scored[:3]]
+    bp_results = _score_candidates(
+        candidates,
+        lambda bp: {"batter_id": bp["id"], "stand": _bp_stand(bp)},
+        context={
+            "pitcher_id": ctx["pitcher_id"],
+            "p_throws": ctx["p_throws"],
+            "venue": ctx["venue"],
+            "season": ctx["season"],
+            "inning": ctx["inning"],
+            "outs": ctx["outs"],
+            "runner_1b": 1 if ctx["runner_1b_id"] else 0,
+            "runner_2b": 1 if ctx["runner_2b_id"] else 0,
+            "runner_3b": 1 if ctx["runner_3b_id"] else 0,
+            "n_thru_order": 1,
+        },
+        label="pinch_hit",
+    )
+
     best = None
-    for _, bp in scored[:3]:
-        try:
-            bp_stand = bp["bat_side"]
-            if bp_stand == "S":
-                bp_stand = "L" if ctx["p_throws"] == "R" else "R"
-
-            bp_result = predict_matchup_live(
-                batter_id=bp["id"],
-                pitcher_id=ctx["pitcher_id"],
-                stand=bp_stand,
-                p_throws=ctx["p_throws"],
-                venue=ctx["venue"],
-                season=ctx["season"],
-                inning=ctx["inning"],
-                outs=ctx["outs"],
-                runner_1b=1 if ctx["runner_1b_id"] else 0,
-                runner_2b=1 if ctx["runner_2b_id"] else 0,
-                runner_3b=1 if ctx["runner_3b_id"] else 0,
-                n_thru_order=1,
-            )
-            if not bp_result.get("ok"):
-                continue
+    for bp, bp_result in zip(candidates, bp_results):
+        if not bp_result or not bp_result.get("ok"):
+            continue
 
-            bp_obp = bp_result.get("summary", {}).get("obp", 0.320)
-            improvement = bp_obp - current_obp
+        bp_obp = bp_result.get("summary", {}).get("obp", 0.320)
+        improvement = bp_obp - current_obp
 
-            if improvement >= OBP_IMPROVE_THRESH_PH:
-                if best is None or improvement > best["improvement"]:
-                    best = {
-                        "player": bp,
-                        "improvement": improvement,
-                        "bp_obp": bp_obp,
-                    }
-        except Exception as e:
-            log.debug("pinch_hit eval error for %s: %s", bp.get("id"), e)
-            continue
+        if improvement >= OBP_IMPROVE_THRESH_PH:
+            if best is None or improvement > best["improvement"]:
+                best = {
+                    "player": bp,
+                    "improvement": improvement,
+                    "bp_obp": bp_obp,
+                }
 
     if not best:
         return None
@@ -10,21 +10,13 @@ from __future__ import annotations
 
 import json
 import logging
-import os
 from collections import Counter
 
-import psycopg
+from services import db_pool
 
 log = logging.getLogger(__name__)
 
 
-def _db_url():
-    url = os.environ.get("DATABASE_URL") or os.environ.get("DATABASE_URL_PG") or ""
-    if not url:
-        raise RuntimeError("Missing DATABASE_URL env var")
-    return url
-
-
 def get_quiz_scenarios(n: int = 10) -> list[dict]:
     """
     Fetch n random scenarios with diversity enforcement.
@@ -46,7 +38,7 @@ def get_quiz_scenarios(n: int = 10) -> list[dict]:
         LIMIT %s
     """
 
-    with psycopg.connect(_db_url(), connect_timeout=10) as conn:
+    with db_pool.connection() as conn:
         with conn.cursor() as cur:
             cur.execute(sql, (fetch_limit,))
             cols = [desc.name for desc in cur.description]
@@ -100,7 +92,7 @@ def record_response(scenario_id: int, session_uuid: str, user_choice: str) -> di
         VALUES (%s, %s, %s)
         ON CONFLICT (scenario_id, session_uuid) DO NOTHING
     """
-    with psycopg.connect(_db_url(), connect_timeout=10) as conn:
+    with db_pool.connection() as conn:
         with conn.cursor() as cur:
             cur.execute(sql, (scenario_id, session_uuid, user_choice))
         conn.commit()
@@ -116,7 +108,7 @@ def get_community_stats(scenario_id: int) -> dict:
         WHERE scenario_id = %s
         GROUP BY user_choice
     """
-    with psycopg.connect(_db_url(), connect_timeout=10) as conn:
+    with db_pool.connection() as conn:
         with conn.cursor() as cur:
             cur.execute(sql, (scenario_id,))
             rows = cur.fetchall()
@@ -146,7 +138,7 @@ def get_scenario_result(scenario_id: int) -> dict:
         FROM manager_game_scenarios
         WHERE id = %s
     """
-    with psycopg.connect(_db_url(), connect_timeout=10) as conn:
+    with db_pool.connection() as conn:
         with conn.cursor() as cur:
             cur.execute(sql, (scenario_id,))
             row = cur.fetchone()
@@ -18,7 +18,8 @@ from functools import lru_cache
 import joblib
 import numpy as np
 import pandas as pd
-import requests
+from services import db_pool, http_client
+from services.ttl_cache import MISSING, get_cache
 
 log = logging.getLogger(__name__)
 
@@ -42,6 +43,12 @@ _batter_pitch_types = None
 _pitcher_arsenal = None
 _park_factors = None
 
+# ProfileIndex views of the profile tables above, keyed for O(1) lookups
+_batter_idx = None          # (batter, vs_hand) -> season -> row
+_batter_pt_idx = None       # (batter, pitch_type) -> season -> row
+_pitcher_arsenal_idx = None  # (pitcher, stand) -> season -> DataFrame of pitch types
+_park_idx = None            # (venue, stand) -> season -> row
+
 CLASSES = ["1B", "2B", "3B", "BB", "HBP", "HR", "IBB", "K", "OUT"]
 
 PITCH_CATEGORY = {
@@ -105,6 +112,7 @@ def _load():
     """Lazy-load model, metadata, calibrators, and profile DataFrames."""
     global _model, _meta, _calibrators, _pitch_sel, _pitch_sel_meta
     global _batter_profiles, _batter_pitch_types, _pitcher_arsenal, _park_factors
+    global _batter_idx, _batter_pt_idx, _pitcher_arsenal_idx, _park_idx
 
     if _model is not None:
         return
@@ -140,17 +148,22 @@ def _load():
 
     # Profiles rebuilt nightly by the rebuild-profiles cron: read from Postgres
     # (the cron writes there so fresh data survives Render's ephemeral disks),
-    # falling back to the committed parquet files.
-    from services.profile_store import load_profile
-
-    for attr, table, path in [
-        ("_batter_profiles", "profile_batter", "batter_profiles.parquet"),
-        ("_batter_pitch_types", "profile_batter_pitch_type", "batter_pitch_type_profiles.parquet"),
-        ("_pitcher_arsenal", "profile_pitcher_arsenal", "pitcher_arsenal.parquet"),
+    # falling back to the committed parquet files.  Each is indexed once so
+    # feature lookups don't scan the table per call.
+    from services.profile_store import ProfileIndex, load_profile_index
+
+    for attr, idx_attr, table, path, keys, multi in [
+        ("_batter_profiles", "_batter_idx", "profile_batter",
+         "batter_profiles.parquet", ["batter", "vs_hand"], False),
+        ("_batter_pitch_types", "_batter_pt_idx", "profile_batter_pitch_type",
+         "batter_pitch_type_profiles.parquet", ["batter", "pitch_type"], False),
+        ("_pitcher_arsenal", "_pitcher_arsenal_idx", "profile_pitcher_arsenal",
+         "pitcher_arsenal.parquet", ["pitcher", "stand"], True),
     ]:
-        df = load_profile(table, os.path.join(_DATA_DIR, path))
-        globals()[attr] = df
-        log.info("%s: %d rows", table, len(df))
+        idx = load_profile_index(table, os.path.join(_DATA_DIR, path), keys, multi=multi)
+        globals()[attr] = idx.df
+        globals()[idx_attr] = idx
+        log.info("%s: %d rows", table, len(idx.df))
 
     # Park factors are not rebuilt nightly — still parquet only.
     try:
@@ -159,6 +172,7 @@ def _load():
     except Exception as e:
         log.warning("Could not load Park factors: %s", e)
         _park_factors = pd.DataFrame()
+    _park_idx = ProfileIndex(_park_factors, ["venue", "stand"])
 
 
 def _get_batter_features(batter_id, season, p_throws):
@@ -178,11 +192,9 @@ def _get_batter_features(batter_id, season, p_throws):
       Final profile is then regressed toward league average based on total
       weighted PA (at 400+ weighted PA, league average weight is ~0).
     """
-    if _batter_profiles is None or _batter_profiles.empty:
+    if not _batter_idx:
         return {**_LEAGUE_AVG_BATTER, **_LEAGUE_AVG_BATTER_PLAT}
 
-    bp = _batter_profiles
-
     # --- Multi-year weighted overall (ALL) profile ---
     RECENCY_WEIGHTS = {0: 1.0, 1: 0.7, 2: 0.4}  # 0=current, 1=last year, 2=two years ago
     RELIABLE_PA = 400  # total weighted PA for full confidence (no league regression)
@@ -193,12 +205,9 @@ def _get_batter_features(batter_id, season, p_throws):
         total_weighted_pa = 0.0
 
         for years_ago, recency_w in RECENCY_WEIGHTS.items():
-            target_season = season - years_ago
-            mask = (bp["batter"] == batter_id) & (bp["vs_hand"] == hand_filter) & (bp["season"] == target_season)
-            row = bp[mask]
-            if row.empty:
+            r = _batter_idx.get((batter_id, hand_filter), season - years_ago)
+            if r is None:
                 continue
-            r = row.iloc[0]
             pa = float(r.get("pa", 0)) if pd.notna(r.get("pa")) else 0
             if pa < 1:
                 continue
@@ -244,9 +253,8 @@ def _get_batter_features(batter_id, season, p_throws):
             plat[k] = w * plat[k] + (1 - w) * prior
 
     # Store current-season PA for sample-size feature
-    curr_mask = (bp["batter"] == batter_id) & (bp["vs_hand"] == "ALL") & (bp["season"] == season)
-    curr_row = bp[curr_mask]
-    overall["bat_season_pa"] = float(curr_row.iloc[0].get("pa", 0)) if not curr_row.empty and pd.notna(curr_row.iloc[0].get("pa")) else 0
+    curr_row = _batter_idx.get((batter_id, "ALL"), season)
+    overall["bat_season_pa"] = float(curr_row.get("pa", 0)) if curr_row is not None and pd.notna(curr_row.get("pa")) else 0
 
     return {**overall, **plat}
 
@@ -260,7 +268,7 @@ def _get_batter_pitch_type_features(batter_id, season, pitcher_usage):
     features = {}
     stats = ["whiff_rate", "chase_rate", "zone_contact_rate", "hard_hit_rate", "xwoba"]
 
-    if _batter_pitch_types is None or _batter_pitch_types.empty:
+    if not _batter_pt_idx:
         # Fill all with league average
         for cat in ["fastball", "breaking", "offspeed"]:
             for stat in stats:
@@ -269,19 +277,14 @@ def _get_batter_pitch_type_features(batter_id, season, pitcher_usage):
             features[f"bvpt_w_{stat}"] = _LEAGUE_AVG_BVPT[f"bvpt_{stat}"]
         return features
 
-    bpt = _batter_pitch_types
     for cat in ["fastball", "breaking", "offspeed"]:
-        cat_key = f"CAT_{cat}"
-        mask = (bpt["batter"] == batter_id) & (bpt["pitch_type"] == cat_key)
-        row = bpt[mask & (bpt["season"] == season)]
-        if row.empty:
-            row = bpt[mask].sort_values("season", ascending=False).head(1)
+        row = _batter_pt_idx.get_or_latest((batter_id, f"CAT_{cat}"), season)
 
         for stat in stats:
-            if row.empty:
+            if row is None:
                 features[f"bvpt_{stat}_{cat}"] = _LEAGUE_AVG_BVPT[f"bvpt_{stat}"]
             else:
-                val = row.iloc[0].get(stat)
+                val = row.get(stat)
                 features[f"bvpt_{stat}_{cat}"] = float(val) if pd.notna(val) else _LEAGUE_AVG_BVPT[f"bvpt_{stat}"]
 
     # Pitch-weighted composites
@@ -300,8 +303,9 @@ def _get_batter_pitch_type_features(batter_id, season, pitcher_usage):
 
 _API_BASE = "https://statsapi.mlb.com/api/v1"
 
-# Cache for live API pitcher lookups (cleared on app restart)
-_api_pitcher_cache = {}
+# Cache for live API pitcher lookups; None is cached too so misses aren't refetched
+_api_pitcher_cache = get_cache("matchup_predict.api_pitcher", max_entries=512,
+                               max_bytes=16 * 1024 * 1024, default_ttl=60 * 60 * 6)
 
 
 def _fetch_pitcher_from_api(pitcher_id, season):
@@ -310,8 +314,9 @@ def _fetch_pitcher_from_api(pitcher_id, season):
     Returns a DataFrame matching pitcher_arsenal.parquet schema, or None.
     """
     cache_key = (pitcher_id, season)
-    if cache_key in _api_pitcher_cache:
-        return _api_pitcher_cache[cache_key]
+    cached = _api_pitcher_cache.get(cache_key, MISSING)
+    if cached is not MISSING:
+        return cached
 
     try:
         url = (
@@ -319,12 +324,12 @@ def _fetch_pitcher_from_api(pitcher_id, season):
             f"?stats=statsSingleSeason,expectedStatistics,pitchArsenal"
             f"&season={season}&group=pitching"
         )
-        resp = requests.get(url, timeout=8)
+        resp = http_client.get(url)
         resp.raise_for_status()
         data = resp.json()
     except Exception as e:
         log.warning("MLB API fetch for pitcher %s failed: %s", pitcher_id, e)
-        _api_pitcher_cache[cache_key] = None
+        _api_pitcher_cache.set(cache_key, None, ttl=60 * 10)
         return None
 
     # Parse pitchArsenal
@@ -356,7 +361,7 @@ def _fetch_pitcher_from_api(pitcher_id, season):
                 xstats = s.get("stat", {})
 
     if not arsenal_rows:
-        _api_pitcher_cache[cache_key] = None
+        _api_pitcher_cache.set(cache_key, None)
         return None
 
     # Build a mini DataFrame matching parquet schema
@@ -410,7 +415,7 @@ def _fetch_pitcher_from_api(pitcher_id, season):
         })
 
     df = pd.DataFrame(rows)
-    _api_pitcher_cache[cache_key] = df
+    _api_pitcher_cache.set(cache_key, df)
     return df
 
 
@@ -429,7 +434,7 @@ def _estimate_pitch_whiff(pitch_type, overall_k_rate):
     return min(base_whiff * mult, 0.55)
 
 
-_stuff_plus_cache = {}
+_stuff_plus_cache = get_cache("matchup_predict.stuff_plus", max_entries=2048, default_ttl=60 * 60 * 6)
 
 
 def _get_stuff_plus_from_live(pitcher_id):
@@ -437,15 +442,14 @@ def _get_stuff_plus_from_live(pitcher_id):
     Look up average stuff+ for a pitcher from pitch_model_scores (per-pitch model
     scores keyed to statcast_pitches). Returns {pitch_type: avg_stuff_plus} or {}.
     """
-    if pitcher_id in _stuff_plus_cache:
-        return _stuff_plus_cache[pitcher_id]
+    cached = _stuff_plus_cache.get(pitcher_id)
+    if cached is not None:
+        return cached
 
     try:
-        import psycopg
-        db_url = os.environ.get("DATABASE_URL") or os.environ.get("DATABASE_URL_PG") or ""
-        if not db_url:
+        if not (os.environ.get("DATABASE_URL") or os.environ.get("DATABASE_URL_PG")):
             return {}
-        with psycopg.connect(db_url) as conn:
+        with db_pool.connection() as conn:
             with conn.cursor() as cur:
                 cur.execute("""
                     SELECT sp.pitch_type, AVG(s.stuff_plus) AS avg_stuff
@@ -459,11 +463,11 @@ def _get_stuff_plus_from_live(pitcher_id):
                 """, (pitcher_id,))
                 rows = cur.fetchall()
                 result = {row[0]: float(row[1]) for row in rows}
-                _stuff_plus_cache[pitcher_id] = result
+                _stuff_plus_cache.set(pitcher_id, result)
                 return result
     except Exception as e:
         log.debug("stuff+ live lookup failed for %s: %s", pitcher_id, e)
-        _stuff_plus_cache[pitcher_id] = {}
+        _stuff_plus_cache.set(pitcher_id, {}, ttl=60 * 10)
         return {}
 
 
@@ -495,15 +499,8 @@ def _get_pitcher_features(pitcher_id, season):
     df_season = None
     source = "parquet"
 
-    if _pitcher_arsenal is not None and not _pitcher_arsenal.empty:
-        pa = _pitcher_arsenal
-        mask = (pa["pitcher"] == pitcher_id) & (pa["stand"] == "ALL")
-        df_season = pa[mask & (pa["season"] == season)]
-        if df_season.empty:
-            df_season = pa[mask].sort_values("season", ascending=False)
-            if not df_season.empty:
-                latest = df_season["season"].iloc[0]
-                df_season = df_season[df_season["season"] == latest]
+    if _pitcher_arsenal_idx:
+        df_season = _pitcher_arsenal_idx.get_or_latest((pitcher_id, "ALL"), season)
 
     # --- Fall back to MLB API if parquet has no data ---
     if df_season is None or df_season.empty:
@@ -554,17 +551,13 @@ def _get_pitcher_features(pitcher_id, season):
     _RECENCY_W = {0: 1.0, 1: 0.7, 2: 0.4}
     _RELIABLE_PITCHER_N = 2000  # ~2000 pitches for full confidence
 
-    if _pitcher_arsenal is not None and not _pitcher_arsenal.empty:
-        pa_df = _pitcher_arsenal
-        pit_mask = (pa_df["pitcher"] == pitcher_id) & (pa_df["stand"] == "ALL")
-
+    if _pitcher_arsenal_idx:
         for feat, col, default in _RATE_STATS:
             weighted_sum = 0.0
             total_w = 0.0
             for years_ago, rec_w in _RECENCY_W.items():
-                s_mask = pit_mask & (pa_df["season"] == season - years_ago)
-                s_data = pa_df[s_mask]
-                if s_data.empty:
+                s_data = _pitcher_arsenal_idx.get((pitcher_id, "ALL"), season - years_ago)
+                if s_data is None:
                     continue
                 s_n = pd.to_numeric(s_data["n"], errors="coerce").fillna(0).values.astype(float)
                 s_total = s_n.sum()
@@ -656,18 +649,10 @@ def _get_pitcher_features(pitcher_id, season):
 
 def _get_park_features(venue, season):
     """Look up park factors. Falls back to neutral."""
-    if _park_factors is None or _park_factors.empty:
+    r = _park_idx.get_or_latest((venue, "ALL"), season) if _park_idx else None
+    if r is None:
         return {"park_run_factor": 1.0, "park_hr_factor": 1.0}
 
-    pf = _park_factors
-    mask = (pf["venue"] == venue) & (pf["stand"] == "ALL")
-    row = pf[mask & (pf["season"] == season)]
-    if row.empty:
-        row = pf[mask].sort_values("season", ascending=False).head(1)
-    if row.empty:
-        return {"park_run_factor": 1.0, "park_hr_factor": 1.0}
-
-    r = row.iloc[0]
     return {
         "park_run_factor": float(r["run_factor"]) if pd.notna(r.get("run_factor")) else 1.0,
         "park_hr_factor": float(r["hr_factor"]) if pd.notna(r.get("hr_factor")) else 1.0,
@@ -687,59 +672,54 @@ def _get_pitch_usage(pitcher_id, season, stand, arsenal_list):
     return arsenal_list
 
 
-def predict_matchup(
-    batter_id,
-    pitcher_id,
-    stand="R",
-    p_throws="R",
-    venue=None,
-    season=2025,
-    inning=1,
-    outs=0,
-    runner_1b=0,
-    runner_2b=0,
-    runner_3b=0,
-    n_thru_order=1,
-):
-    """
-    Predict PA outcome probabilities for a batter-vs-pitcher matchup.
-
-    Returns dict with:
-      - probs: {1B, 2B, 3B, BB, HBP, HR, IBB, K, OUT} probabilities
-      - summary: {k_pct, bb_pct, hit_pct, hr_pct, obp, xba, xslg}
-      - arsenal: [{pitch_type, name, usage, velo, whiff, stuff}, ...]
-      - ok: True
-    """
-    _load()
-
-    if _model is None:
-        return {"ok": False, "reason": "model_not_loaded"}
-
-    # Assemble feature vector
-    features = {}
-
-    # Batter overall + platoon features
-    features.update(_get_batter_features(batter_id, season, p_throws))
+# Guard values for any feature still NaN/None after assembly.
+# NaN features cause XGBoost to follow default split directions which can
+# produce unrealistically high hit probabilities (observed: +46% hit rate
+# when all pitcher features are NaN).
+_FEATURE_FALLBACK = {
+    **_LEAGUE_AVG_BATTER, **_LEAGUE_AVG_BATTER_PLAT,
+    **{f"bvpt_{s}_{c}": _LEAGUE_AVG_BVPT[f"bvpt_{s}"]
+       for c in ("fastball", "breaking", "offspeed")
+       for s in ("whiff_rate", "chase_rate", "zone_contact_rate", "hard_hit_rate", "xwoba")},
+    **{f"bvpt_w_{s}": _LEAGUE_AVG_BVPT[f"bvpt_{s}"]
+       for s in ("whiff_rate", "chase_rate", "zone_contact_rate", "hard_hit_rate", "xwoba")},
+    **_LEAGUE_AVG_PITCHER,
+    "p_usage_fastball": 0.55, "p_usage_breaking": 0.30, "p_usage_offspeed": 0.15,
+    "p_pitch1_usage": 0.40, "p_pitch1_velo": 93.5, "p_pitch1_whiff": 0.20, "p_pitch1_stuff": 100.0,
+    "p_pitch2_usage": 0.25, "p_pitch2_velo": 85.0, "p_pitch2_whiff": 0.30, "p_pitch2_stuff": 100.0,
+    "p_pitch3_usage": 0.15, "p_pitch3_velo": 84.0, "p_pitch3_whiff": 0.25, "p_pitch3_stuff": 100.0,
+    "park_run_factor": 1.0, "park_hr_factor": 1.0,
+    "inning": 1, "outs_when_up": 0, "n_thruorder_pitcher": 1,
+    "runner_on_1b": 0, "runner_on_2b": 0, "runner_on_3b": 0,
+    **_LEAGUE_AVG_BATTER_R14, **_LEAGUE_AVG_PITCHER_R14,
+    "stand": 1, "p_throws": 1,
+    # v2 new features
+    "runners_on": 0, "base_out_state": 0, "score_diff": 0,
+    "wl_is_starter": 1, "bat_season_pa": 300,
+    "matchup_k_advantage": 0, "interact_k_whiff": 0.055,
+    "p_delta_whiff": 0, "p_delta_chase": 0, "p_delta_xwoba": 0,
+    "platoon_k_split": 0,
+}
 
-    # Pitcher features (also returns category usage and arsenal list)
-    pitcher_feats, cat_usage, arsenal_list = _get_pitcher_features(pitcher_id, season)
-    features.update(pitcher_feats)
+# Default per-PA context for predict_matchups_batch rows
+_DEFAULT_CONTEXT = {
+    "stand": "R", "p_throws": "R", "venue": None, "season": 2025,
+    "inning": 1, "outs": 0, "runner_1b": 0, "runner_2b": 0, "runner_3b": 0,
+    "n_thru_order": 1,
+}
 
-    # Batter vs pitch-type features (weighted by this pitcher's usage)
-    features.update(_get_batter_pitch_type_features(batter_id, season, cat_usage))
 
-    # Park factors
-    if venue:
-        features.update(_get_park_features(venue, season))
-    else:
-        features.update({"park_run_factor": 1.0, "park_hr_factor": 1.0})
+def _regress_recent_form(features, batter_id, pitcher_id, bat_r14=None, pit_r14=None):
+    """Add rolling 14-day form features, regressed toward the player's own profile.
 
-    # Recent form (rolling 14-day) — regressed toward player's own profile
-    # when sample size is small (early season / recent call-up).
+    Regression matters when sample size is small (early season / recent
+    call-up).  `bat_r14` / `pit_r14` may be passed in when the caller has
+    already fetched them; otherwise they are looked up here.
+    """
     try:
         from services.recent_form import get_batter_recent_form, get_pitcher_recent_form, RELIABLE_PA
-        bat_r14 = get_batter_recent_form(batter_id)
-        pit_r14 = get_pitcher_recent_form(pitcher_id)
+        bat_r14 = dict(bat_r14) if bat_r14 is not None else get_batter_recent_form(batter_id)
+        pit_r14 = dict(pit_r14) if pit_r14 is not None else get_pitcher_recent_form(pitcher_id)
 
         # Regress batter recent form toward their own season-level profile
         bat_pa = bat_r14.pop("_pa", RELIABLE_PA)
@@ -793,8 +773,53 @@ def predict_matchup(
         features.update(_LEAGUE_AVG_BATTER_R14)
         features.update(_LEAGUE_AVG_PITCHER_R14)
 
+
+def _assemble_features(ctx, pitcher_cache):
+    """
+    Build the model feature dict for one batter/pitcher/context row.
+
+    `pitcher_cache` maps (pitcher_id, season) -> _get_pitcher_features output
+    so a batch that shares a pitcher (a lineup vs one starter) only resolves
+    that pitcher's arsenal, API fallback and stuff+ once.
+
+    Returns (features, arsenal_list).
+    """
+    batter_id = ctx["batter_id"]
+    pitcher_id = ctx["pitcher_id"]
+    season = ctx["season"]
+    stand = ctx["stand"]
+    p_throws = ctx["p_throws"]
+    outs = ctx["outs"]
+    runner_1b, runner_2b, runner_3b = ctx["runner_1b"], ctx["runner_2b"], ctx["runner_3b"]
+    n_thru_order = ctx["n_thru_order"]
+
+    features = {}
+
+    # Batter overall + platoon features
+    features.update(_get_batter_features(batter_id, season, p_throws))
+
+    # Pitcher features (also returns category usage and arsenal list)
+    pkey = (pitcher_id, season)
+    if pkey not in pitcher_cache:
+        pitcher_cache[pkey] = _get_pitcher_features(pitcher_id, season)
+    pitcher_feats, cat_usage, arsenal_list = pitcher_cache[pkey]
+    features.update(pitcher_feats)
+
+    # Batter vs pitch-type features (weighted by this pitcher's usage)
+    features.update(_get_batter_pitch_type_features(batter_id, season, cat_usage))
+
+    # Park factors
+    if ctx["venue"]:
+        features.update(_get_park_features(ctx["venue"], season))
+    else:
+        features.update({"park_run_factor": 1.0, "park_hr_factor": 1.0})
+
+    # Recent form (rolling 14-day)
+    _regress_recent_form(features, batter_id, pitcher_id,
+                         ctx.get("bat_r14"), ctx.get("pit_r14"))
+
     # Context
-    features["inning"] = inning
+    features["inning"] = ctx["inning"]
     features["outs_when_up"] = outs
     features["n_thruorder_pitcher"] = n_thru_order
     features["runner_on_1b"] = runner_1b
@@ -815,7 +840,6 @@ def predict_matchup(
     p_whiff = features.get("p_whiff_rate", _LEAGUE_AVG_PITCHER["p_whiff_rate"])
     p_chase = features.get("p_chase_rate", _LEAGUE_AVG_PITCHER["p_chase_rate"])
     p_xwoba = features.get("p_xwoba", _LEAGUE_AVG_PITCHER["p_xwoba"])
-    p_zone = features.get("p_zone_rate", 0.45)
     features["matchup_k_advantage"] = (bat_k - 0.223) + (p_whiff - 0.245)
     features["interact_k_whiff"] = bat_k * p_whiff
     features["p_delta_whiff"] = p_whiff - 0.245
@@ -830,62 +854,11 @@ def predict_matchup(
     features["stand"] = 0 if stand == "L" else 1
     features["p_throws"] = 0 if p_throws == "L" else 1
 
-    # Build feature array in model's expected order
-    feature_names = _meta["numeric_features"] + _meta["categorical_features"]
-    X = np.array([[features.get(f, np.nan) for f in feature_names]], dtype=np.float64)
-
-    # Guard: replace any remaining NaN/None with league-average defaults.
-    # NaN features cause XGBoost to follow default split directions which can
-    # produce unrealistically high hit probabilities (observed: +46% hit rate
-    # when all pitcher features are NaN).
-    _FALLBACK = {
-        **_LEAGUE_AVG_BATTER, **_LEAGUE_AVG_BATTER_PLAT,
-        **{f"bvpt_{s}_{c}": _LEAGUE_AVG_BVPT[f"bvpt_{s}"]
-           for c in ("fastball", "breaking", "offspeed")
-           for s in ("whiff_rate", "chase_rate", "zone_contact_rate", "hard_hit_rate", "xwoba")},
-        **{f"bvpt_w_{s}": _LEAGUE_AVG_BVPT[f"bvpt_{s}"]
-           for s in ("whiff_rate", "chase_rate", "zone_contact_rate", "hard_hit_rate", "xwoba")},
-        **_LEAGUE_AVG_PITCHER,
-        "p_usage_fastball": 0.55, "p_usage_breaking": 0.30, "p_usage_offspeed": 0.15,
-        "p_pitch1_usage": 0.40, "p_pitch1_velo": 93.5, "p_pitch1_whiff": 0.20, "p_pitch1_stuff": 100.0,
-        "p_pitch2_usage": 0.25, "p_pitch2_velo": 85.0, "p_pitch2_whiff": 0.30, "p_pitch2_stuff": 100.0,
-        "p_pitch3_usage": 0.15, "p_pitch3_velo": 84.0, "p_pitch3_whiff": 0.25, "p_pitch3_stuff": 100.0,
-        "park_run_factor": 1.0, "park_hr_factor": 1.0,
-        "inning": 1, "outs_when_up": 0, "n_thruorder_pitcher": 1,
-        "runner_on_1b": 0, "runner_on_2b": 0, "runner_on_3b": 0,
-        **_LEAGUE_AVG_BATTER_R14, **_LEAGUE_AVG_PITCHER_R14,
-        "stand": 1, "p_throws": 1,
-        # v2 new features
-        "runners_on": 0, "base_out_state": 0, "score_diff": 0,
-        "wl_is_starter": 1, "bat_season_pa": 300,
-        "matchup_k_advantage": 0, "interact_k_whiff": 0.055,
-        "p_delta_whiff": 0, "p_delta_chase": 0, "p_delta_xwoba": 0,
-        "platoon_k_split": 0,
-    }
-    nan_mask = np.isnan(X[0])
-    if nan_mask.any():
-        for i, is_nan in enumerate(nan_mask):
-            if is_nan:
-                fname = feature_names[i]
-                X[0, i] = _FALLBACK.get(fname, 0.0)
-        log.debug("Replaced %d NaN features with defaults", int(nan_mask.sum()))
-
-    # Predict
-    probs = _model.predict_proba(X)[0]
-
-    # NOTE: Isotonic calibrators exist for aggregate analysis
-    # (models/matchup_model_v2_calibrators.joblib) but are NOT applied
-    # to individual PA predictions — they distort matchup-specific
-    # probabilities. The raw model is well-calibrated on aggregate
-    # (21.1% K on 2026 vs 23.3% actual). Calibrators are for the
-    # game simulator's post-hoc aggregate corrections only.
+    return features, arsenal_list
 
-    # Map to class names
-    prob_dict = {}
-    for i, cls in enumerate(CLASSES):
-        prob_dict[cls] = round(float(probs[i]), 4)
 
-    # Derived summary stats
+def _summarize_probs(prob_dict):
+    """Derived summary stats (k_pct, obp, xba, xslg, ...) from class probs."""
     hit_pct = prob_dict["1B"] + prob_dict["2B"] + prob_dict["3B"] + prob_dict["HR"]
     on_base_pct = hit_pct + prob_dict["BB"] + prob_dict["HBP"] + prob_dict["IBB"]
     ab_pct = 1.0 - prob_dict["BB"] - prob_dict["HBP"] - prob_dict["IBB"]
@@ -895,7 +868,7 @@ def predict_matchup(
           prob_dict["3B"] * 3 + prob_dict["HR"] * 4)
     xslg = tb / ab_pct if ab_pct > 0 else 0
 
-    summary = {
+    return {
         "k_pct": round(prob_dict["K"], 3),
         "bb_pct": round(prob_dict["BB"] + prob_dict["IBB"], 3),
         "hit_pct": round(hit_pct, 3),
@@ -905,15 +878,134 @@ def predict_matchup(
         "xslg": round(xslg, 3),
     }
 
-    # Get arsenal/pitch usage for this matchup
-    arsenal = _get_pitch_usage(pitcher_id, season, stand, arsenal_list)
 
-    return {
-        "ok": True,
-        "probs": prob_dict,
-        "summary": summary,
-        "arsenal": arsenal,
-    }
+def predict_matchups_batch(pairs, context=None):
+    """
+    Predict PA outcome probabilities for many matchups with one model call.
+
+    pairs: list of dicts with at least batter_id and pitcher_id; any of the
+        predict_matchup keyword arguments (stand, p_throws, venue, season,
+        inning, outs, runner_1b/2b/3b, n_thru_order) may be set per row.
+        Optional bat_r14 / pit_r14 carry prefetched recent-form dicts.
+    context: defaults shared by every row (a row's own keys win).
+
+    Returns a list of predict_matchup-style dicts, in the order of `pairs`;
+    a row whose features can't be assembled comes back as {"ok": False}
+    without failing the rest of the batch.
+    """
+    _load()
+
+    if _model is None:
+        return [{"ok": False, "reason": "model_not_loaded"} for _ in pairs]
+    if not pairs:
+        return []
+
+    shared = {**_DEFAULT_CONTEXT, **(context or {})}
+    # Callers may put either id in `context` (one pitcher against a lineup,
+    # one batter against the bullpen), so resolve rows before reading ids
+    merged = [{**shared, **p} for p in pairs]
+
+    # Recent form for every batter/pitcher in one query per role
+    bat_form, pit_form = {}, {}
+    try:
+        from services.recent_form import get_batch_recent_form
+        need_bat = [m["batter_id"] for m in merged if m.get("bat_r14") is None]
+        need_pit = [m["pitcher_id"] for m in merged if m.get("pit_r14") is None]
+        if need_bat:
+            bat_form = get_batch_recent_form(need_bat, role="batter")
+        if need_pit:
+            pit_form = get_batch_recent_form(need_pit, role="pitcher")
+    except Exception as e:
+        log.warning("Recent form prefetch failed: %s", e)
+
+    # A row whose features can't be assembled (unknown id, missing data) is
+    # reported as not ok and left out of the model call
+    results = [None] * len(pairs)
+    pitcher_cache = {}
+    rows = []
+    arsenals = []
+    row_idx = []
+    for i, (pair, ctx) in enumerate(zip(pairs, merged)):
+        try:
+            if ctx.get("bat_r14") is None:
+                ctx["bat_r14"] = bat_form.get(ctx["batter_id"])
+            if ctx.get("pit_r14") is None:
+                ctx["pit_r14"] = pit_form.get(ctx["pitcher_id"])
+            features, arsenal_list = _assemble_features(ctx, pitcher_cache)
+            arsenal = _get_pitch_usage(ctx["pitcher_id"], ctx["season"], ctx["stand"], arsenal_list)
+        except Exception as e:
+            log.debug("Matchup row %s skipped: %s", pair, e)
+            results[i] = {"ok": False, "reason": f"features_failed: {type(e).__name__}"}
+            continue
+        rows.append(features)
+        arsenals.append(arsenal)
+        row_idx.append(i)
+
+    if not rows:
+        return results
+
+    # Build feature matrix in model's expected order
+    feature_names = _meta["numeric_features"] + _meta["categorical_features"]
+    X = np.array([[f.get(name, np.nan) for name in feature_names] for f in rows], dtype=np.float64)
+
+    # Guard: replace any remaining NaN/None with league-average defaults
+    nan_mask = np.isnan(X)
+    if nan_mask.any():
+        fallback = np.array([_FEATURE_FALLBACK.get(name, 0.0) for name in feature_names], dtype=np.float64)
+        X = np.where(nan_mask, fallback, X)
+        log.debug("Replaced %d NaN features with defaults", int(nan_mask.sum()))
+
+    # Predict — one call for the whole batch
+    all_probs = _model.predict_proba(X)
+
+    # NOTE: Isotonic calibrators exist for aggregate analysis
+    # (models/matchup_model_v2_calibrators.joblib) but are NOT applied
+    # to individual PA predictions — they distort matchup-specific
+    # probabilities. The raw model is well-calibrated on aggregate
+    # (21.1% K on 2026 vs 23.3% actual). Calibrators are for the
+    # game simulator's post-hoc aggregate corrections only.
+
+    for i, probs, arsenal in zip(row_idx, all_probs, arsenals):
+        prob_dict = {cls: round(float(probs[j]), 4) for j, cls in enumerate(CLASSES)}
+        results[i] = {
+            "ok": True,
+            "probs": prob_dict,
+            "summary": _summarize_probs(prob_dict),
+            "arsenal": arsenal,
+        }
+    return results
+
+
+def predict_matchup(
+    batter_id,
+    pitcher_id,
+    stand="R",
+    p_throws="R",
+    venue=None,
+    season=2025,
+    inning=1,
+    outs=0,
+    runner_1b=0,
+    runner_2b=0,
+    runner_3b=0,
+    n_thru_order=1,
+):
+    """
+    Predict PA outcome probabilities for a batter-vs-pitcher matchup.
+
+    Returns dict with:
+      - probs: {1B, 2B, 3B, BB, HBP, HR, IBB, K, OUT} probabilities
+      - summary: {k_pct, bb_pct, hit_pct, hr_pct, obp, xba, xslg}
+      - arsenal: [{pitch_type, name, usage, velo, whiff, stuff}, ...]
+      - ok: True
+    """
+    return predict_matchups_batch([{
+        "batter_id": batter_id, "pitcher_id": pitcher_id,
+        "stand": stand, "p_throws": p_throws, "venue": venue, "season": season,
+        "inning": inning, "outs": outs,
+        "runner_1b": runner_1b, "runner_2b": runner_2b, "runner_3b": runner_3b,
+        "n_thru_order": n_thru_order,
+    }])[0]
 
 
 def predict_matchup_live(
@@ -942,20 +1034,18 @@ def predict_matchup_live(
       - adjustments: dict showing what shifted and by how much
       - pregame_probs: baseline prediction (inning 1, no runners, 1st TTO)
     """
-    # Get live prediction (already uses real context: inning, runners, TTO)
-    result = predict_matchup(
-        batter_id, pitcher_id, stand, p_throws, venue, season,
-        inning, outs, runner_1b, runner_2b, runner_3b, n_thru_order,
-    )
+    # Live context + pregame baseline (inning 1, no runners, 1st TTO) in one model call
+    base = {"batter_id": batter_id, "pitcher_id": pitcher_id,
+            "stand": stand, "p_throws": p_throws, "venue": venue, "season": season}
+    result, pregame = predict_matchups_batch([
+        {**base, "inning": inning, "outs": outs, "runner_1b": runner_1b,
+         "runner_2b": runner_2b, "runner_3b": runner_3b, "n_thru_order": n_thru_order},
+        base,
+    ])
 
     if not result.get("ok"):
         return result
 
-    # Get pregame baseline for comparison
-    pregame = predict_matchup(
-        batter_id, pitcher_id, stand, p_throws, venue, season,
-        inning=1, outs=0, runner_1b=0, runner_2b=0, runner_3b=0, n_thru_order=1,
-    )
     result["pregame_probs"] = pregame.get("probs", {})
 
     # Apply Bayesian adjustments
@@ -964,14 +1054,10 @@ def predict_matchup_live(
 
     # Velocity adjustment
     _load()
-    if pitcher_velo_tonight is not None and _pitcher_arsenal is not None and not _pitcher_arsenal.empty:
-        pa = _pitcher_arsenal
-        mask = (pa["pitcher"] == pitcher_id) & (pa["stand"] == "ALL")
-        season_data = pa[mask & (pa["season"] == season)]
-        if season_data.empty:
-            season_data = pa[mask].sort_values("season", ascending=False)
-
-        if not season_data.empty:
+    if pitcher_velo_tonight is not None and _pitcher_arsenal_idx:
+        season_data = _pitcher_arsenal_idx.get_or_latest((pitcher_id, "ALL"), season)
+
+        if season_data is not None:
             n = season_data["n"].values.astype(float)
             total = n.sum()
             if total > 0:
@@ -1014,22 +1100,7 @@ def predict_matchup_live(
         result["probs"] = adjusted
 
         # Recompute summary with adjusted probs
-        hit_pct = adjusted["1B"] + adjusted["2B"] + adjusted["3B"] + adjusted["HR"]
-        on_base_pct = hit_pct + adjusted["BB"] + adjusted["HBP"] + adjusted["IBB"]
-        ab_pct = 1.0 - adjusted["BB"] - adjusted["HBP"] - adjusted["IBB"]
-        xba = hit_pct / ab_pct if ab_pct > 0 else 0
-        tb = adjusted["1B"] + adjusted["2B"] * 2 + adjusted["3B"] * 3 + adjusted["HR"] * 4
-        xslg = tb / ab_pct if ab_pct > 0 else 0
-
-        result["summary"] = {
-            "k_pct": round(adjusted["K"], 3),
-            "bb_pct": round(adjusted["BB"] + adjusted["IBB"], 3),
-            "hit_pct": round(hit_pct, 3),
-            "hr_pct": round(adjusted["HR"], 3),
-            "obp": round(on_base_pct, 3),
-            "xba": round(xba, 3),
-            "xslg": round(xslg, 3),
-        }
+        result["summary"] = _summarize_probs(adjusted)
 
     result["adjustments"] = adjustments
     return result
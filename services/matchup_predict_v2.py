@@ -45,6 +45,10 @@ _batter_profiles = None
 _batter_pitch_types = None
 _pitcher_arsenal = None
 _park_factors = None
+_batter_idx = None
+_batter_pt_idx = None
+_pitcher_arsenal_idx = None
+_park_idx = None
 
 CLASSES = ["1B", "2B", "3B", "BB", "HBP", "HR", "IBB", "K", "OUT"]
 
@@ -81,6 +85,7 @@ LG_PITCHER = {
 def _load():
     """Lazy-load model and data."""
     global _model, _meta, _batter_profiles, _batter_pitch_types, _pitcher_arsenal, _park_factors
+    global _batter_idx, _batter_pt_idx, _pitcher_arsenal_idx, _park_idx
 
     if _model is not None:
         return
@@ -107,14 +112,19 @@ def _load():
     # Profiles rebuilt nightly by the rebuild-profiles cron: read from Postgres
     # (the cron writes there so fresh data survives Render's ephemeral disks),
     # falling back to the committed parquet files.
-    from services.profile_store import load_profile
-
-    for attr, table, path in [
-        ("_batter_profiles", "profile_batter", "batter_profiles.parquet"),
-        ("_batter_pitch_types", "profile_batter_pitch_type", "batter_pitch_type_profiles.parquet"),
-        ("_pitcher_arsenal", "profile_pitcher_arsenal", "pitcher_arsenal.parquet"),
+    from services.profile_store import ProfileIndex, load_profile_index
+
+    for attr, idx_attr, table, path, keys, multi in [
+        ("_batter_profiles", "_batter_idx", "profile_batter",
+         "batter_profiles.parquet", ["batter", "vs_hand"], False),
+        ("_batter_pitch_types", "_batter_pt_idx", "profile_batter_pitch_type",
+         "batter_pitch_type_profiles.parquet", ["batter", "pitch_type"], False),
+        ("_pitcher_arsenal", "_pitcher_arsenal_idx", "profile_pitcher_arsenal",
+         "pitcher_arsenal.parquet", ["pitcher", "stand"], True),
     ]:
-        globals()[attr] = load_profile(table, os.path.join(_DATA_DIR, path))
+        idx = load_profile_index(table, os.path.join(_DATA_DIR, path), keys, multi=multi)
+        globals()[attr] = idx.df
+        globals()[idx_attr] = idx
 
     # Park factors are not rebuilt nightly — still parquet only.
     try:
@@ -122,6 +132,7 @@ def _load():
     except Exception as e:
         log.warning("Could not load Park factors: %s", e)
         _park_factors = pd.DataFrame()
+    _park_idx = ProfileIndex(_park_factors, ["venue", "stand"])
 
 
 def _get_batter_features(batter_id, season, p_throws):
@@ -131,7 +142,7 @@ def _get_batter_features(batter_id, season, p_throws):
     """
     features = {}
 
-    if _batter_profiles is None or _batter_profiles.empty:
+    if not _batter_idx:
         # Fill all with league average
         for prefix in ["bat_", "bat_prev_", "bat_blend_"]:
             for k, v in LEAGUE_AVG.items():
@@ -142,19 +153,13 @@ def _get_batter_features(batter_id, season, p_throws):
         features["bat_season_pa"] = 0
         return features
 
-    bp = _batter_profiles
-
     # Current season "ALL" hand split
     def _extract_profile(batter, target_season, prefix):
-        mask = (bp["batter"] == batter) & (bp["vs_hand"] == "ALL")
-        row = bp[mask & (bp["season"] == target_season)]
-        if row.empty:
-            row = bp[mask].sort_values("season", ascending=False).head(1)
-        if row.empty:
+        r = _batter_idx.get_or_latest((batter, "ALL"), target_season)
+        if r is None:
             for k, v in LEAGUE_AVG.items():
                 features[f"{prefix}{k}"] = v
             return 0
-        r = row.iloc[0]
         pa = int(r.get("pa", 0))
         for k, v in LEAGUE_AVG.items():
             col = k
@@ -184,17 +189,13 @@ def _get_batter_features(batter_id, season, p_throws):
 
     # Platoon split
     plat_hand = p_throws if p_throws in ("L", "R") else "R"
-    mask_plat = (bp["batter"] == batter_id) & (bp["vs_hand"] == plat_hand)
-    row_plat = bp[mask_plat & (bp["season"] == season)]
-    if row_plat.empty:
-        row_plat = bp[mask_plat].sort_values("season", ascending=False).head(1)
+    r = _batter_idx.get_or_latest((batter_id, plat_hand), season)
 
     plat_cols = ["k_pct", "bb_pct", "whiff_rate", "chase_rate", "avg_ev", "barrel_rate", "xwoba"]
-    if row_plat.empty:
+    if r is None:
         for k in plat_cols:
             features[f"bat_plat_{k}"] = LEAGUE_AVG.get(k, 0.0)
     else:
-        r = row_plat.iloc[0]
         for k in plat_cols:
             val = r.get(k)
             features[f"bat_plat_{k}"] = float(val) if pd.notna(val) else LEAGUE_AVG.get(k, 0.0)
@@ -208,7 +209,7 @@ def _get_pitcher_features(pitcher_id, season):
     cat_usage = {"fastball": 0.55, "breaking": 0.30, "offspeed": 0.15}
     arsenal_list = []
 
-    if _pitcher_arsenal is None or _pitcher_arsenal.empty:
+    if not _pitcher_arsenal_idx:
         for k, v in LG_PITCHER.items():
             features[f"p_{k}"] = v
             features[f"p_prev_{k}"] = v
@@ -227,17 +228,9 @@ def _get_pitcher_features(pitcher_id, season):
             features[f"p_pitch{rank}_stuff"] = 100.0
         return features, cat_usage, arsenal_list
 
-    pa = _pitcher_arsenal
-
     def _extract_pitcher(target_season, prefix):
-        mask = (pa["pitcher"] == pitcher_id) & (pa["stand"] == "ALL")
-        df_s = pa[mask & (pa["season"] == target_season)]
-        if df_s.empty:
-            df_s = pa[mask].sort_values("season", ascending=False)
-            if not df_s.empty:
-                latest = df_s["season"].iloc[0]
-                df_s = df_s[df_s["season"] == latest]
-        if df_s.empty:
+        df_s = _pitcher_arsenal_idx.get_or_latest((pitcher_id, "ALL"), target_season)
+        if df_s is None:
             for k, v in LG_PITCHER.items():
                 features[f"{prefix}{k}"] = v
             return None
@@ -346,7 +339,7 @@ def _get_bvpt_features(batter_id, season, cat_usage):
     defaults = {"whiff_rate": 0.245, "chase_rate": 0.295, "zone_contact_rate": 0.82,
                 "hard_hit_rate": 0.35, "xwoba": 0.315}
 
-    if _batter_pitch_types is None or _batter_pitch_types.empty:
+    if not _batter_pt_idx:
         for cat in ["fastball", "breaking", "offspeed"]:
             for stat in stats:
                 features[f"bvpt_{stat}_{cat}"] = defaults[stat]
@@ -354,18 +347,13 @@ def _get_bvpt_features(batter_id, season, cat_usage):
             features[f"bvpt_w_{stat}"] = defaults[stat]
         return features
 
-    bpt = _batter_pitch_types
     for cat in ["fastball", "breaking", "offspeed"]:
-        cat_key = f"CAT_{cat}"
-        mask = (bpt["batter"] == batter_id) & (bpt["pitch_type"] == cat_key)
-        row = bpt[mask & (bpt["season"] == season)]
-        if row.empty:
-            row = bpt[mask].sort_values("season", ascending=False).head(1)
+        row = _batter_pt_idx.get_or_latest((batter_id, f"CAT_{cat}"), season)
         for stat in stats:
-            if row.empty:
+            if row is None:
                 features[f"bvpt_{stat}_{cat}"] = defaults[stat]
             else:
-                val = row.iloc[0].get(stat)
+                val = row.get(stat)
                 features[f"bvpt_{stat}_{cat}"] = float(val) if pd.notna(val) else defaults[stat]
 
     # Weighted composites
@@ -382,18 +370,10 @@ def _get_bvpt_features(batter_id, season, cat_usage):
 
 def _get_park_features(venue, season):
     """Look up park factors."""
-    if _park_factors is None or _park_factors.empty:
-        return {"park_run_factor": 1.0, "park_hr_factor": 1.0}
-
-    pf = _park_factors
-    mask = (pf["venue"] == venue) & (pf["stand"] == "ALL")
-    row = pf[mask & (pf["season"] == season)]
-    if row.empty:
-        row = pf[mask].sort_values("season", ascending=False).head(1)
-    if row.empty:
+    r = _park_idx.get_or_latest((venue, "ALL"), season) if _park_idx else None
+    if r is None:
         return {"park_run_factor": 1.0, "park_hr_factor": 1.0}
 
-    r = row.iloc[0]
     return {
         "park_run_factor": float(r["run_factor"]) if pd.notna(r.get("run_factor")) else 1.0,
         "park_hr_factor": float(r["hr_factor"]) if pd.notna(r.get("hr_factor")) else 1.0,
@@ -33,11 +33,12 @@ def _grad_style(value, baseline, span=8.0):
     except Exception:
         return ""
 
-import time
 import json
 import os
+import threading
 import random
 import bisect
+import heapq
 from datetime import datetime, date, timedelta
 from typing import Any, Dict, Optional, List, Tuple
 import unicodedata
@@ -48,6 +49,10 @@ import numpy as np
 import pandas as pd
 from sqlalchemy import create_engine, text
 
+from services import http_client, live_feed, player_directory
+from services.fanout import Fanout
+from services.ttl_cache import get_cache
+
 # ----------------------------
 # Monte Carlo run expectancy (LAZY)
 # ----------------------------
@@ -508,25 +513,79 @@ def monte_carlo_game_from_pas(pas: List[dict], sims: int = 5000, seed: int = 42)
 
 BASE = "https://statsapi.mlb.com/api/v1"
 
+# ----------------------------
+# Request coalescing (single-flight)
+# ----------------------------
+# A popular live game has gamecast, matchup, manager, analytics and pitcher
+# endpoints all asking for the same feed at once.  On a cache miss only the
+# first caller goes to the network; the others wait on its per-URL flight
+# and share the response (or its exception).
+_FLIGHT_WAIT_SECONDS = 45
+_IN_FLIGHT: Dict[Tuple, "_Flight"] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+
+class _Flight:
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+def _flight_key(url: str, params=None, headers=None) -> Tuple:
+    try:
+        full_url = requests.Request("GET", url, params=params).prepare().url
+    except Exception:
+        full_url = f"{url}?{params!r}"
+    return full_url, tuple(sorted((headers or {}).items()))
+
+
+def _http_get(url: str, params=None, headers=None, timeout=None):
+    """GET through the shared pooled client, with concurrent identical
+    requests collapsed into one fetch.  Timeouts come from the client's
+    per-endpoint table unless given."""
+    key = _flight_key(url, params, headers)
+    with _IN_FLIGHT_LOCK:
+        flight = _IN_FLIGHT.get(key)
+        leader = flight is None
+        if leader:
+            flight = _IN_FLIGHT[key] = _Flight()
+
+    if not leader:
+        if flight.done.wait(timeout=_FLIGHT_WAIT_SECONDS):
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+        # Leader is stuck; don't hold this request hostage to it
+        return http_client.get(url, params=params, headers=headers, timeout=timeout)
+
+    try:
+        flight.response = http_client.get(url, params=params, headers=headers, timeout=timeout)
+        return flight.response
+    except Exception as e:
+        flight.error = e
+        raise
+    finally:
+        with _IN_FLIGHT_LOCK:
+            _IN_FLIGHT.pop(key, None)
+        flight.done.set()
+
 # ----------------------------
 # Analytics cache (in-memory, per worker)
 # ----------------------------
-_ANALYTICS_CACHE = {}
+_ANALYTICS_CACHE = get_cache("mlb_api.analytics", max_entries=64, max_bytes=32 * 1024 * 1024)
 
-def _analytics_cache_get(key, ttl_s: int):
+def _analytics_cache_get(key):
     try:
-        item = _ANALYTICS_CACHE.get(key)
-        if not item:
-            return None
-        if (time.time() - float(item.get("ts", 0))) > ttl_s:
-            return None
-        return item.get("payload")
+        return _ANALYTICS_CACHE.get(key)
     except Exception:
         return None
 
-def _analytics_cache_set(key, payload: dict):
+def _analytics_cache_set(key, payload: dict, ttl_s: int):
     try:
-        _ANALYTICS_CACHE[key] = {"ts": time.time(), "payload": payload}
+        _ANALYTICS_CACHE.set(key, payload, ttl=ttl_s)
     except Exception:
         pass
 
@@ -767,8 +826,10 @@ def predict_xba_xslg(
 # ----------------------------
 # Simple in-memory cache
 # ----------------------------
-_cache: Dict[str, Dict[str, Any]] = {}
 CACHE_TTL_SECONDS = 60 * 5  # 5 minutes
+# Bounded so a day of live feeds (hundreds of KB each) can't pile up in the worker
+_cache = get_cache("mlb_api", max_entries=1024, max_bytes=128 * 1024 * 1024,
+                   default_ttl=CACHE_TTL_SECONDS)
 # ----------------------------
 # 40-man directory (All teams)
 # ----------------------------
@@ -827,7 +888,7 @@ def get_40man_directory(season: int = None) -> List[dict]:
             "hydrate": "person",
             "fields": "roster,person,id,fullName,firstName,lastName,position,abbreviation"
         }
-        r = requests.get(url, params=params, timeout=25)
+        r = _http_get(url, params=params)
         r.raise_for_status()
         roster = (r.json() or {}).get("roster", []) or []
 
@@ -869,6 +930,7 @@ def get_40man_directory(season: int = None) -> List[dict]:
     out.sort(key=_sort_key)
 
     _set_cached(cache_key, out, ttl=FORTYMAN_TTL_SECONDS)
+    _suggest_index(f"40man:{season}", out)
     return out
 
 def _fuzzy_score(qn: str, kn: str) -> float:
@@ -890,26 +952,232 @@ def _fuzzy_score(qn: str, kn: str) -> float:
     score += difflib.SequenceMatcher(None, qn, kn).ratio()
     return score
 
-def suggest_40man_players(query: str, season: int = None, limit: int = 10) -> List[dict]:
-    """
-    Returns top matches from the 40-man directory for autocomplete.
-    Each item: {id, label, url}
-    """
-    q = _norm_txt(query or "")
-    if not q:
-        return []
+# ----------------------------
+# Autocomplete search index
+# ----------------------------
+# _fuzzy_score ranks in strict tiers: a query found at a word start of the
+# key scores >= 2.8, elsewhere in the key 1.2..2.2, and a non-substring match
+# only its SequenceMatcher ratio (<= 1.0).  When the query is a substring the
+# ratio is exactly 2*len(q)/(len(q)+len(k)), so the index scores the first
+# two tiers without difflib, and only runs it (on the few keys whose
+# character counts can still pass) when those tiers can't fill the result.
+
+_FUZZY_MIN_SCORE = 0.55
+# ratio <= 2*min(q, k)/(q + k), so a key longer than this many query lengths
+# can't reach _FUZZY_MIN_SCORE without containing the query
+_FUZZY_MAX_LEN_RATIO = 2 / _FUZZY_MIN_SCORE - 1
 
-    players = get_40man_directory(season=season)
-    scored = []
-    for p in players:
-        kn = p.get("_k") or ""
-        s = _fuzzy_score(q, kn)
-        if s > 0.55:
-            scored.append((s, p))
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    top = [p for _, p in scored[:max(1, int(limit))]]
+def _trigrams(s: str) -> set:
+    return {s[i:i + 3] for i in range(len(s) - 2)}
 
+
+class _SuggestIndex:
+    """Prefix and trigram index over a player directory's `_k` keys.
+
+    - tokens: every word of every key, sorted, with its player row and
+      whether it is the key's first word (prefix array)
+    - grams: trigram -> sorted player rows whose key contains it
+    - char_counts: per-row character counts, bounding difflib's ratio
+    - active: bool per row, for the active-only filter
+    """
+
+    def __init__(self, players: List[dict]):
+        self.players = players
+        self.keys = [p.get("_k") or "" for p in players]
+        self.key_len = np.array([len(k) for k in self.keys], dtype=np.int64)
+        self.active = np.array([bool(p.get("active")) for p in players], dtype=bool)
+
+        entries = []
+        grams: Dict[str, list] = {}
+        for row, key in enumerate(self.keys):
+            for pos, tok in enumerate(key.split()):
+                entries.append((tok, row, pos == 0))
+            for g in _trigrams(key):
+                grams.setdefault(g, []).append(row)
+        entries.sort(key=lambda e: e[0])
+        self.tokens = [e[0] for e in entries]
+        self.token_row = np.array([e[1] for e in entries], dtype=np.int64)
+        self.token_first = np.array([e[2] for e in entries], dtype=bool)
+        self.grams = {g: np.array(rows, dtype=np.int64) for g, rows in grams.items()}
+
+        self.char_col = {ch: i for i, ch in enumerate(sorted(set("".join(self.keys))))}
+        self.char_counts = np.zeros((len(self.keys), max(1, len(self.char_col))), dtype=np.uint8)
+        for row, key in enumerate(self.keys):
+            for ch in key:
+                self.char_counts[row, self.char_col[ch]] += 1
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Flat arrays for services.player_directory (see from_arrays)."""
+        gram_names = sorted(self.grams)
+        gram_offsets = np.zeros(len(gram_names) + 1, dtype=np.int64)
+        np.cumsum([len(self.grams[g]) for g in gram_names], out=gram_offsets[1:])
+        arrays = {
+            "ix_key_len": self.key_len,
+            "ix_token_row": self.token_row,
+            "ix_token_first": self.token_first,
+            "ix_gram_offsets": gram_offsets,
+            "ix_gram_rows": (np.concatenate([self.grams[g] for g in gram_names])
+                             if gram_names else np.empty(0, dtype=np.int64)),
+            "ix_char_counts": self.char_counts,
+        }
+        for name, values in (("ix_tokens", self.tokens), ("ix_gram_names", gram_names),
+                             ("ix_chars", sorted(self.char_col, key=self.char_col.get))):
+            arrays[name] = player_directory.pack_strings(values)
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, players: List[dict], arrays: Dict[str, np.ndarray]) -> "_SuggestIndex":
+        """Rebuild from to_arrays() output without re-indexing; the arrays
+        may be memory-mapped."""
+        def strings(name):
+            return player_directory.unpack_strings(arrays[name])
+
+        index = cls.__new__(cls)
+        index.players = players
+        index.keys = [p.get("_k") or "" for p in players]
+        index.key_len = arrays["ix_key_len"]
+        index.active = np.array([bool(p.get("active")) for p in players], dtype=bool)
+        index.tokens = strings("ix_tokens")
+        index.token_row = arrays["ix_token_row"]
+        index.token_first = arrays["ix_token_first"]
+        bounds = arrays["ix_gram_offsets"].tolist()
+        rows = arrays["ix_gram_rows"]
+        index.grams = {g: rows[bounds[i]:bounds[i + 1]] for i, g in enumerate(strings("ix_gram_names"))}
+        index.char_col = {ch: i for i, ch in enumerate(strings("ix_chars"))}
+        index.char_counts = arrays["ix_char_counts"]
+        return index
+
+    def _token_range(self, prefix: str) -> slice:
+        lo = bisect.bisect_left(self.tokens, prefix)
+        hi = bisect.bisect_left(self.tokens, prefix + "\uffff", lo)
+        return slice(lo, hi)
+
+    def _containing(self, q: str) -> np.ndarray:
+        """Rows whose key contains q."""
+        if len(q) >= 3:
+            postings = sorted((self.grams.get(g) for g in _trigrams(q)),
+                              key=lambda a: -1 if a is None else len(a))
+            if postings[0] is None:
+                return np.empty(0, dtype=np.int64)
+            rows = postings[0]
+            for other in postings[1:]:
+                rows = np.intersect1d(rows, other, assume_unique=True)
+        else:
+            rows = np.arange(len(self.keys))
+        keys = self.keys
+        return np.array([r for r in rows.tolist() if q in keys[r]], dtype=np.int64)
+
+    def search(self, q: str, limit: int, active_only: bool = False) -> List[dict]:
+        """Top `limit` players by _fuzzy_score(q, key) above _FUZZY_MIN_SCORE,
+        ties in directory order."""
+        lq = len(q)
+        keys = self.keys
+        allowed = self.active if active_only else None
+        rows, scores = [], []
+
+        # Tier 1: query at a word start
+        words = q.split()
+        contains = None
+        if len(words) == 1:
+            # Single word: word-start flags come straight from the prefix array
+            span = self._token_range(q)
+            cand_rows = self.token_row[span]
+            first = np.zeros(len(keys), dtype=bool)
+            later = np.zeros(len(keys), dtype=bool)
+            first[cand_rows[self.token_first[span]]] = True
+            later[cand_rows[~self.token_first[span]]] = True
+            ws = np.flatnonzero(first | later)
+            if allowed is not None:
+                ws = ws[allowed[ws]]
+            # Same additions in the same order as _fuzzy_score
+            score = np.zeros(len(ws))
+            score += np.where(first[ws], 2.2, 0.0)
+            score += np.where(later[ws], 1.6, 0.0)
+            score += 1.2
+            score += 2.0 * lq / (lq + self.key_len[ws])
+            rows.append(ws)
+            scores.append(score)
+        else:
+            contains = self._containing(q)
+            ws = np.array([r for r in contains.tolist()
+                           if keys[r].startswith(q) or f" {q}" in keys[r]], dtype=np.int64)
+            if allowed is not None:
+                ws = ws[allowed[ws]]
+            rows.append(ws)
+            scores.append(np.array([_fuzzy_score(q, keys[r]) for r in ws.tolist()]))
+        found = len(ws)
+
+        # Tier 2: substring anywhere else (trigram postings)
+        if found < limit:
+            if contains is None:
+                contains = self._containing(q)
+            sub = np.setdiff1d(contains, ws, assume_unique=True)
+            if allowed is not None:
+                sub = sub[allowed[sub]]
+            rows.append(sub)
+            scores.append(1.2 + 2.0 * lq / (lq + self.key_len[sub]))
+            found += len(sub)
+            ws = np.concatenate([ws, sub])
+
+        # Tier 3: misspellings.  Only keys whose length and character
+        # counts (difflib's quick_ratio bound) leave room for a passing
+        # ratio are re-scored with difflib.
+        if found < limit:
+            cand = np.flatnonzero(self.key_len < lq * _FUZZY_MAX_LEN_RATIO)
+            if allowed is not None:
+                cand = cand[allowed[cand]]
+            cand = np.setdiff1d(cand, ws, assume_unique=True)
+            if len(cand):
+                q_counts = np.zeros(self.char_counts.shape[1], dtype=np.uint8)
+                for ch in q:
+                    col = self.char_col.get(ch)
+                    if col is not None:
+                        q_counts[col] += 1
+                shared = np.minimum(self.char_counts[cand], q_counts).sum(axis=1)
+                bound = 2.0 * shared / (lq + self.key_len[cand])
+                keep = bound > _FUZZY_MIN_SCORE
+                cand, bound = cand[keep], bound[keep]
+
+                # Best bound first; stop once no remaining key can displace
+                # the worst of the `need` kept so far
+                need = limit - found
+                order = np.lexsort((cand, -bound))
+                best = []  # min-heap of (score, -row)
+                for r, b in zip(cand[order].tolist(), bound[order].tolist()):
+                    if len(best) >= need and b < best[0][0]:
+                        break
+                    sc = _fuzzy_score(q, keys[r])
+                    if sc <= _FUZZY_MIN_SCORE:
+                        continue
+                    if len(best) < need:
+                        heapq.heappush(best, (sc, -r))
+                    elif (sc, -r) > best[0]:
+                        heapq.heapreplace(best, (sc, -r))
+                rows.append(np.array([-nr for _, nr in best], dtype=np.int64))
+                scores.append(np.array([sc for sc, _ in best]))
+
+        rows = np.concatenate(rows)
+        scores = np.concatenate(scores)
+        ok = scores > _FUZZY_MIN_SCORE
+        rows, scores = rows[ok], scores[ok]
+        order = np.lexsort((rows, -scores))[:limit]
+        return [self.players[r] for r in rows[order].tolist()]
+
+
+_suggest_indexes = get_cache("mlb_api.suggest_index", max_entries=8, default_ttl=None)
+
+
+def _suggest_index(name: str, players: List[dict]) -> _SuggestIndex:
+    """The search index for a directory list, rebuilt when the list is."""
+    index = _suggest_indexes.get(name)
+    if index is None or index.players is not players:
+        index = _SuggestIndex(players)
+        _suggest_indexes.set(name, index)
+    return index
+
+
+def _suggest_items(top: List[dict]) -> List[dict]:
     out = []
     for p in top:
         label = f"{p.get('fullName','')} \u2022 {p.get('pos','')} \u2022 {p.get('team','')}"
@@ -920,6 +1188,21 @@ def suggest_40man_players(query: str, season: int = None, limit: int = 10) -> Li
         })
     return out
 
+def suggest_40man_players(query: str, season: int = None, limit: int = 10) -> List[dict]:
+    """
+    Returns top matches from the 40-man directory for autocomplete.
+    Each item: {id, label, url}
+    """
+    q = _norm_txt(query or "")
+    if not q:
+        return []
+
+    if season is None:
+        season = datetime.now().year
+    players = get_40man_directory(season=season)
+    index = _suggest_index(f"40man:{season}", players)
+    return _suggest_items(index.search(q, max(1, int(limit))))
+
 def filter_40man_by_letter(letter: str, season: int = None) -> List[dict]:
     """
     Filter directory by starting letter of last name.
@@ -975,7 +1258,7 @@ def _get_season_players(season: int) -> List[dict]:
         "fields": "people,id,fullName,firstName,lastName,primaryPosition,abbreviation,currentTeam,id,abbreviation,active",
     }
     try:
-        r = requests.get(url, params=params, timeout=30)
+        r = _http_get(url, params=params)
         r.raise_for_status()
         people = r.json().get("people", []) or []
     except Exception:
@@ -1013,17 +1296,18 @@ def _get_season_players(season: int) -> List[dict]:
     return out
 
 
-def get_all_players_directory(active_ids: list = None) -> List[dict]:
+ALL_PLAYERS_TTL_SECONDS = 60 * 60 * 12
+
+# Directory columns stored in the player_directory file, besides id/active
+_DIRECTORY_STR_COLS = ("fullName", "firstName", "lastName", "pos", "team", "_k")
+
+
+def build_all_players_directory(active_ids: list = None) -> List[dict]:
     """
-    Build a directory of all MLB players since 1990.
-    Returns list of {id, fullName, firstName, lastName, pos, team, active}.
-    Uses aggressive caching per season.
+    Build a directory of all MLB players since 1990 from the per-season lists.
+    Returns list of {id, fullName, firstName, lastName, pos, team, active, _k},
+    sorted by last name, first name.
     """
-    mem_key = "all_players_directory"
-    cached = _get_cached(mem_key)
-    if cached is not None:
-        return cached
-
     current_year = datetime.now().year
     seen = {}  # id -> player dict (latest appearance wins)
 
@@ -1053,7 +1337,73 @@ def get_all_players_directory(active_ids: list = None) -> List[dict]:
         return (_norm_txt(ln), _norm_txt(fn))
 
     out.sort(key=_sort_key)
-    _set_cached(mem_key, out, ttl=60 * 60 * 12)  # 12-hour cache
+    return out
+
+
+def save_all_players_directory(players: List[dict], index: "_SuggestIndex" = None,
+                               path: str = None) -> str:
+    """Write the directory and its search index with services.player_directory."""
+    index = index or _SuggestIndex(players)
+    arrays = {
+        "id": np.array([p["id"] for p in players], dtype=np.int64),
+        "active": np.array([bool(p.get("active")) for p in players], dtype=bool),
+    }
+    for col in _DIRECTORY_STR_COLS:
+        arrays[col] = player_directory.pack_strings([p.get(col) or "" for p in players])
+    arrays.update(index.to_arrays())
+    return player_directory.save(arrays, meta={"rows": len(players)}, path=path)
+
+
+def _load_all_players_directory(active_ids: list = None):
+    """(players, index) from the player_directory file, or None."""
+    loaded = player_directory.load(max_age=ALL_PLAYERS_TTL_SECONDS)
+    if loaded is None:
+        return None
+    _, arrays = loaded
+    cols = {col: player_directory.unpack_strings(arrays[col]) for col in _DIRECTORY_STR_COLS}
+    ids = arrays["id"]
+    active = np.isin(ids, list(active_ids)) if active_ids else arrays["active"]
+    players = [
+        {"id": pid, "fullName": full, "firstName": first, "lastName": last,
+         "pos": pos, "team": team, "active": act, "_k": key}
+        for pid, full, first, last, pos, team, act, key in zip(
+            ids.tolist(), cols["fullName"], cols["firstName"], cols["lastName"],
+            cols["pos"], cols["team"], active.tolist(), cols["_k"])
+    ]
+    return players, _SuggestIndex.from_arrays(players, arrays)
+
+
+def get_all_players_directory(active_ids: list = None) -> List[dict]:
+    """
+    Directory of all MLB players since 1990.
+    Returns list of {id, fullName, firstName, lastName, pos, team, active}.
+
+    Served from the in-memory cache, then the prebuilt player_directory file
+    (see scripts/build_player_directory.py), and only then rebuilt from the
+    per-season lists, in which case the file is refreshed for the next
+    cold worker.
+    """
+    mem_key = "all_players_directory"
+    cached = _get_cached(mem_key)
+    if cached is not None:
+        return cached
+
+    loaded = _load_all_players_directory(active_ids)
+    if loaded is not None:
+        out, index = loaded
+    else:
+        out = build_all_players_directory(active_ids)
+        index = _SuggestIndex(out)
+        if out:
+            try:
+                save_all_players_directory(out, index)
+            except Exception as e:
+                print(f"[players] could not write directory file: {e}")
+
+    # Size hint: the JSON estimate would serialize the whole directory
+    _set_cached(mem_key, out, ttl=ALL_PLAYERS_TTL_SECONDS,
+                size=int(index.key_len.sum()) * 2 + 160 * len(out))
+    _suggest_indexes.set("all_players", index)
     return out
 
 
@@ -1086,27 +1436,8 @@ def suggest_all_players(query: str, active_only: bool = False, active_ids: list
         return []
 
     players = get_all_players_directory(active_ids=active_ids)
-    scored = []
-    for p in players:
-        if active_only and not p.get("active"):
-            continue
-        kn = p.get("_k") or ""
-        s = _fuzzy_score(q, kn)
-        if s > 0.55:
-            scored.append((s, p))
-
-    scored.sort(key=lambda x: x[0], reverse=True)
-    top = [p for _, p in scored[:max(1, int(limit))]]
-
-    out = []
-    for p in top:
-        label = f"{p.get('fullName','')} \u2022 {p.get('pos','')} \u2022 {p.get('team','')}"
-        out.append({
-            "id": p["id"],
-            "label": label,
-            "url": f"/player/{p['id']}",
-        })
-    return out
+    index = _suggest_index("all_players", players)
+    return _suggest_items(index.search(q, max(1, int(limit)), active_only=active_only))
 
 
 def get_player_role(player: dict) -> str:
@@ -1129,18 +1460,73 @@ def get_player_role(player: dict) -> str:
     return "hitting"
 
 def _get_cached(key: str):
-    item = _cache.get(key)
-    if not item:
-        return None
-    ttl = item.get("ttl", CACHE_TTL_SECONDS)
-    if time.time() - item["ts"] > ttl:
+    return _cache.get(key)
+
+def _set_cached(key: str, data, ttl: int = None, size: int = None):
+    _cache.set(key, data, ttl=int(ttl) if ttl is not None else None, size=size)
+
+
+# ----------------------------
+# Normalization caches (game detail / gamecast)
+# ----------------------------
+# Every tab and poller of a game normalizes the same feed snapshot, so whole
+# payloads are memoized per (normalizer, game, metaData.timeStamp).
+_NORMALIZED_CACHE = get_cache("mlb_api.normalized", max_entries=64, default_ttl=60 * 60)
+# A completed play's normalized record doesn't change with later pitches, so
+# it is built once per (atBatIndex, playEndTime); only the in-progress PA
+# and the game-level aggregates are rebuilt on each new snapshot.
+_PLAY_RECORD_CACHE = get_cache("mlb_api.play_records", max_entries=20000,
+                               default_ttl=60 * 60 * 6)
+
+
+def _feed_game_pk(feed: dict) -> Optional[int]:
+    feed = feed or {}
+    pk = feed.get("gamePk") or (((feed.get("gameData") or {}).get("game") or {}).get("pk"))
+    try:
+        return int(pk) if pk else None
+    except (TypeError, ValueError):
         return None
-    return item["data"]
 
-def _set_cached(key: str, data, ttl: int = None):
-    _cache[key] = {"ts": time.time(), "data": data}
-    if ttl is not None:
-        _cache[key]["ttl"] = int(ttl)
+
+def _memoized_normalize(kind: str, feed: dict, build, *args) -> dict:
+    """build(feed, *args), reused for the same game and feed timestamp.
+
+    Callers get a shallow copy, so top-level keys they add don't leak into
+    the memo; nested structures are shared and must not be mutated.
+    """
+    game_pk = _feed_game_pk(feed)
+    ts = ((feed or {}).get("metaData") or {}).get("timeStamp")
+    if not game_pk or not ts or (feed or {}).get("scheduleOnly"):
+        return build(feed, *args)
+
+    key = (kind, game_pk, ts) + args
+    out = _NORMALIZED_CACHE.get(key)
+    if out is None:
+        out = build(feed, *args)
+        _NORMALIZED_CACHE.set(key, out)
+    return dict(out)
+
+
+def _play_record(kind: str, game_pk: Optional[int], play: dict, build):
+    """build(play), cached for completed plays on (atBatIndex, playEndTime).
+
+    The event count and result description also go into the key, so a
+    scoring change or late-arriving event on a finished play is picked up.
+    """
+    about = play.get("about") or {}
+    at_bat_index = about.get("atBatIndex")
+    if not game_pk or at_bat_index is None or not about.get("isComplete"):
+        return build(play)
+
+    end_time = play.get("playEndTime") or about.get("endTime")
+    result = play.get("result") or {}
+    key = (kind, game_pk, at_bat_index, end_time,
+           len(play.get("playEvents") or []), result.get("description"))
+    rec = _PLAY_RECORD_CACHE.get(key)
+    if rec is None:
+        rec = build(play)
+        _PLAY_RECORD_CACHE.set(key, rec)
+    return rec
 
 
 
@@ -1289,7 +1675,7 @@ def get_qualified_league_player_stats(season: int, kind: str, league_short: str)
         "limit": 10000,
         "leagueId": league_id,
     }
-    r = requests.get(url, params=params, timeout=30)
+    r = _http_get(url, params=params)
     r.raise_for_status()
     data = r.json()
 
@@ -1367,7 +1753,8 @@ def get_player_full(pid: int) -> dict:
     """
     url = f"{BASE}/people/{pid}"
     params = {"hydrate": "stats(group=[hitting,pitching],type=[yearByYear])"}
-    r = requests.get(url, params=params, timeout=30)
+    # Career hydration: long-tenured players make for a slow response
+    r = _http_get(url, params=params, timeout=30)
     r.raise_for_status()
     people = r.json().get("people", []) or []
     if not people:
@@ -1382,7 +1769,8 @@ def get_player_full_by_game_type(pid: int, game_type: str = "R") -> dict:
     """
     url = f"{BASE}/people/{pid}"
     params = {"hydrate": f"stats(group=[hitting,pitching],type=[yearByYear],gameType={game_type})"}
-    r = requests.get(url, params=params, timeout=30)
+    # Career hydration: long-tenured players make for a slow response
+    r = _http_get(url, params=params, timeout=30)
     r.raise_for_status()
     people = r.json().get("people", []) or []
     if not people:
@@ -1399,6 +1787,14 @@ def get_player_headshot_url(pid: int, size: int = 360) -> str:
 def normalize_gamecast(feed: dict) -> dict:
     """
     Minimal payload for the GameCast tab polling /game/<pk>/gamecast.json
+    (memoized per feed snapshot; see _normalize_gamecast).
+    """
+    return _memoized_normalize("gamecast", feed, _normalize_gamecast)
+
+
+def _normalize_gamecast(feed: dict) -> dict:
+    """
+    Minimal payload for the GameCast tab polling /game/<pk>/gamecast.json
 
     Front-end expects:
       ok, inning, half, balls, strikes, outs,
@@ -2143,7 +2539,9 @@ def normalize_gamecast(feed: dict) -> dict:
     if cp_idx is not None and current_play not in _all_plus_current:
         _all_plus_current.append(current_play)
 
-    for p in _all_plus_current:
+    def _play_feed_entries(p: dict) -> list:
+        """Feed panel entries for one play (action events, then the at-bat)."""
+        entries = []
         about = p.get("about") or {}
         result = p.get("result") or {}
         inn_label = _feed_inning_label(p)
@@ -2170,7 +2568,7 @@ def normalize_gamecast(feed: dict) -> dict:
 
                     abs_label = "ABS Challenge" if review_type == "MJ" else f"Review ({review_type})"
                     result_text = "Overturned" if overturned else "Confirmed"
-                    feed_out.append({
+                    entries.append({
                         "type": "abs_challenge",
                         "event": abs_label,
                         "description": f"{abs_label}: {call_desc} — {result_text}",
@@ -2188,7 +2586,7 @@ def normalize_gamecast(feed: dict) -> dict:
                 violation = details.get("violation") or {}
                 viol_type = violation.get("type") or ""
                 feed_type = "pitcher_clock_violation" if "pitcher" in viol_type else "batter_clock_violation"
-                feed_out.append({
+                entries.append({
                     "type": feed_type,
                     "event": violation.get("description") or ev_desc,
                     "description": ev_desc,
@@ -2213,7 +2611,7 @@ def normalize_gamecast(feed: dict) -> dict:
                 # Detect ABS challenge embedded in action event descriptions too
                 _ev_desc_lc = ev_desc.lower()
                 if "challenged (pitch result)" in _ev_desc_lc:
-                    feed_out.append({
+                    entries.append({
                         "type": "abs_challenge",
                         "event": "ABS Challenge",
                         "description": ev_desc,
@@ -2222,7 +2620,7 @@ def normalize_gamecast(feed: dict) -> dict:
                         "overturned": "overturned" in _ev_desc_lc,
                     })
 
-                feed_out.append({
+                entries.append({
                     "type": mapped,
                     "event": det_event.replace("_", " ").title() if det_event else mapped.replace("_", " ").title(),
                     "description": ev_desc,
@@ -2240,7 +2638,7 @@ def normalize_gamecast(feed: dict) -> dict:
             _desc_lc = ab_desc.lower()
             if "challenged (pitch result)" in _desc_lc:
                 _overturned = "overturned" in _desc_lc
-                feed_out.append({
+                entries.append({
                     "type": "abs_challenge",
                     "event": "ABS Challenge",
                     "description": ab_desc,
@@ -2260,7 +2658,7 @@ def normalize_gamecast(feed: dict) -> dict:
                 ab_category = "hit_by_pitch"
 
             matchup = p.get("matchup") or {}
-            feed_out.append({
+            entries.append({
                 "type": ab_category,
                 "event": ab_event.replace("_", " ").title() if ab_event else "",
                 "description": ab_desc,
@@ -2269,6 +2667,11 @@ def normalize_gamecast(feed: dict) -> dict:
                 "batter": (matchup.get("batter") or {}).get("fullName"),
                 "pitcher": (matchup.get("pitcher") or {}).get("fullName"),
             })
+        return entries
+
+    game_pk = _feed_game_pk(feed)
+    for p in _all_plus_current:
+        feed_out.extend(_play_record("gamecast.feed", game_pk, p, _play_feed_entries))
 
     # -------------------------
     # Expected runs (rest of half-inning)
@@ -2343,23 +2746,24 @@ def extract_career_statline(player: dict) -> Tuple[Optional[str], Optional[dict]
 # ----------------------------
 # Team abbrev helper (used in year-by-year rows)
 # ----------------------------
-_TEAM_ABBREV_CACHE: Dict[int, str] = {}
+_TEAM_ABBREV_CACHE = get_cache("mlb_api.team_abbrev", max_entries=256, default_ttl=60 * 60 * 24)
 
 
 def get_team_abbrev(team_id: int) -> str:
     if not team_id:
         return ""
-    if team_id in _TEAM_ABBREV_CACHE:
-        return _TEAM_ABBREV_CACHE[team_id]
+    cached = _TEAM_ABBREV_CACHE.get(team_id)
+    if cached is not None:
+        return cached
 
     url = f"{BASE}/teams/{team_id}"
-    r = requests.get(url, timeout=10)
+    r = _http_get(url)
     r.raise_for_status()
     data = r.json() or {}
     team = (data.get("teams") or [{}])[0]
     abbrev = (team.get("abbreviation") or "").upper()
 
-    _TEAM_ABBREV_CACHE[team_id] = abbrev
+    _TEAM_ABBREV_CACHE.set(team_id, abbrev)
     return abbrev
 
 
@@ -2468,7 +2872,7 @@ def get_player_career_totals(pid: int, kind: str) -> Optional[dict]:
     url = f"{BASE}/people/{pid}/stats"
     params = {"stats": "career", "group": kind}
 
-    r = requests.get(url, params=params, timeout=20)
+    r = _http_get(url, params=params)
     r.raise_for_status()
     data = r.json() or {}
     stats = data.get("stats", []) or []
@@ -2491,7 +2895,7 @@ def get_player_awards(pid: int) -> List[dict]:
         return cached
 
     url = f"{BASE}/people/{pid}/awards"
-    r = requests.get(url, timeout=20)
+    r = _http_get(url)
     r.raise_for_status()
     data = r.json() or {}
     awards = data.get("awards", []) or []
@@ -2504,10 +2908,9 @@ def get_player_game_log(player_id: int, season: int) -> List[dict]:
     Raw StatsAPI gamelog blocks.
     """
     url = f"{MLB_API_BASE}/people/{player_id}/stats"
-    resp = requests.get(
+    resp = _http_get(
         url,
         params={"stats": "gameLog", "group": "hitting,pitching", "season": season},
-        timeout=15,
     )
     resp.raise_for_status()
     return (resp.json() or {}).get("stats", []) or []
@@ -2753,7 +3156,7 @@ def get_standings(season_year: int) -> dict:
     }
 
     try:
-        r = requests.get(url, params=params, headers=headers, timeout=20)
+        r = _http_get(url, params=params, headers=headers)
         r.raise_for_status()
         data = r.json()
         if isinstance(data, dict):
@@ -2772,7 +3175,7 @@ def get_teams(season: int) -> dict:
         return cached
 
     params = {"sportId": 1, "season": season, "hydrate": "division,league"}
-    r = requests.get(f"{BASE}/teams", params=params, timeout=10)
+    r = _http_get(f"{BASE}/teams", params=params)
     r.raise_for_status()
     data = r.json()
 
@@ -2787,7 +3190,7 @@ def get_team(team_id: int) -> dict:
         return cached
 
     params = {"hydrate": "division,league,venue"}
-    r = requests.get(f"{BASE}/teams/{team_id}", params=params, timeout=10)
+    r = _http_get(f"{BASE}/teams/{team_id}", params=params)
     r.raise_for_status()
     data = r.json()
 
@@ -2822,7 +3225,7 @@ def get_team_schedule(team_id: int, season: int) -> dict:
         "hydrate": "probablePitchers,decisions,team",
     }
 
-    r = requests.get(url, params=params, timeout=20)
+    r = _http_get(url, params=params)
     r.raise_for_status()
     data = r.json()
 
@@ -2842,7 +3245,7 @@ def get_40man_roster_grouped(team_id: int):
     """
     url = f"{BASE}/teams/{team_id}/roster/40Man"
     params = {"hydrate": "person"}  # ensures batSide/pitchHand/height/weight/birthDate show up
-    r = requests.get(url, params=params, timeout=20)
+    r = _http_get(url, params=params)
     r.raise_for_status()
     data = r.json() or {}
 
@@ -3008,7 +3411,7 @@ def get_team_transactions(team_id: int, start_date: str, end_date: str) -> dict:
         "hydrate": "person,fromTeam,toTeam",
     }
 
-    r = requests.get(url, params=params, timeout=20)
+    r = _http_get(url, params=params)
     r.raise_for_status()
     data = r.json() or {}
 
@@ -3029,7 +3432,7 @@ def search_players(query: str) -> List[dict]:
         return cached
 
     url = f"{MLB_API_BASE}/people/search"
-    resp = requests.get(url, params={"names": q}, timeout=10)
+    resp = _http_get(url, params={"names": q})
     resp.raise_for_status()
     people = (resp.json() or {}).get("people", []) or []
 
@@ -3044,7 +3447,7 @@ def get_player(player_id: int) -> dict:
         return cached
 
     url = f"{MLB_API_BASE}/people/{player_id}"
-    resp = requests.get(url, params={"hydrate": "currentTeam"}, timeout=10)
+    resp = _http_get(url, params={"hydrate": "currentTeam"})
     resp.raise_for_status()
     person = (resp.json() or {}).get("people", [{}])[0]
 
@@ -3076,10 +3479,9 @@ def get_player_season_stats_live(
     Returns the raw 'stats' array from /people/{id}/stats.
     """
     url = f"{MLB_API_BASE}/people/{player_id}/stats"
-    resp = requests.get(
+    resp = _http_get(
         url,
         params={"stats": stat_type, "group": groups, "season": season},
-        timeout=10,
     )
     resp.raise_for_status()
     return (resp.json() or {}).get("stats", []) or []
@@ -3091,10 +3493,9 @@ def get_player_game_log(player_id: int, season: int, groups: str = "hitting,pitc
     /people/{id}/stats?stats=gameLog&group=hitting,pitching&season=YYYY
     """
     url = f"{MLB_API_BASE}/people/{player_id}/stats"
-    resp = requests.get(
+    resp = _http_get(
         url,
         params={"stats": "gameLog", "group": groups, "season": season},
-        timeout=15,
     )
     resp.raise_for_status()
     return (resp.json() or {}).get("stats", []) or []
@@ -3114,10 +3515,9 @@ def get_player_transactions(player_id: int) -> List[dict]:
         return cached
 
     url = f"{BASE}/transactions"
-    resp = requests.get(
+    resp = _http_get(
         url,
         params={"sportId": 1, "playerId": player_id, "hydrate": "person,fromTeam,toTeam"},
-        timeout=20,
     )
     resp.raise_for_status()
     txs = (resp.json() or {}).get("transactions", []) or []
@@ -3291,13 +3691,37 @@ def get_schedule_for_dates(start_date_ymd: str, end_date_ymd: str) -> dict:
         # linescore gives inning info; probables/decisions are nice-to-have
         "hydrate": "team,linescore,probablePitcher(note),probablePitchers,decisions,venue,seriesStatus",
     }
-    r = requests.get(url, params=params, timeout=30)
+    r = _http_get(url, params=params)
     r.raise_for_status()
     data = r.json() or {}
 
     _set_cached(cache_key, data)
     return data
 
+def get_game_linescore(game_pk: int) -> dict:
+    """
+    Just the linescore for one game: inning, count, outs, runners and the
+    current batter/pitcher.  A few KB instead of the full live feed, so the
+    game cards and ticker use it for live state.
+    """
+    cache_key = f"linescore:{game_pk}"
+    cached = _get_cached(cache_key)
+    if cached is not None:
+        return cached
+
+    r = _http_get(f"{BASE}/game/{game_pk}/linescore")
+    r.raise_for_status()
+    data = r.json() or {}
+
+    _set_cached(cache_key, data, ttl=5)
+    return data
+
+def _is_live_game(g: dict) -> bool:
+    status = (g.get("status") or {})
+    abstract = (status.get("abstractGameState") or "").lower()
+    detailed = (status.get("detailedState") or "").lower()
+    return (abstract == "live") or ("in progress" in detailed) or ("live" in detailed)
+
 def find_next_date_with_games(start_date_ymd: str, max_days_ahead: int = 120) -> Optional[str]:
     """
     Fast: ONE schedule call from start_date -> start_date+max_days_ahead, then scan.
@@ -3464,10 +3888,29 @@ def get_games_for_date(
       - subline: regular season records OR postseason series score line
       - outs, bases (for live games; otherwise None/False)
       - isLive (bool)
+
+    include_live_context: fetch each live game's linescore (concurrently)
+    for current batter/pitcher and fresh count/outs/bases.
     """
     data = get_schedule_for_dates(date_ymd, date_ymd)
     out = []
 
+    # Live games get a fresh linescore (the schedule is cached for minutes);
+    # fetch them all at once rather than one after another.
+    live_linescores = {}
+    if include_live_context:
+        live_pks = [
+            int(g["gamePk"])
+            for d in (data.get("dates") or [])
+            for g in (d.get("games") or [])
+            if g.get("gamePk") and _is_live_game(g)
+        ]
+        tasks = Fanout()
+        for pk in live_pks:
+            tasks.add(str(pk), get_game_linescore, pk)
+        for pk in live_pks:
+            live_linescores[pk] = tasks.get(str(pk), default=None)
+
     for d in (data.get("dates") or []):
         for g in (d.get("games") or []):
             teams = g.get("teams") or {}
@@ -3576,25 +4019,23 @@ def get_games_for_date(
             away_slot = away_pp
             home_slot = home_pp
 
-            is_live = (abstract == "live") or ("in progress" in detailed) or ("live" in detailed)
+            is_live = _is_live_game(g)
+            live_ls = live_linescores.get(g.get("gamePk"))
 
             # Live: show current batter/pitcher on correct team row
             if is_live:
                 if include_live_context:
                     try:
-                        feed = get_game_feed(int(g.get("gamePk")))
-                        gc = normalize_gamecast(feed) if feed else {}
-                        if gc.get("ok"):
-                            b = (gc.get("batter") or {})
-                            p = (gc.get("pitcher") or {})
-                            batter_nm = b.get("shortName") or _short_name(b.get("name") or "")
-                            pitcher_nm = p.get("shortName") or _short_name(p.get("name") or "")
+                        if live_ls:
+                            b = ((live_ls.get("offense") or {}).get("batter") or {})
+                            p = ((live_ls.get("defense") or {}).get("pitcher") or {})
+                            batter_nm = _short_name(b.get("fullName") or "")
+                            pitcher_nm = _short_name(p.get("fullName") or "")
                             batter_lbl = f"H: {batter_nm}" if batter_nm else "H: —"
                             pitcher_lbl = f"P: {pitcher_nm}" if pitcher_nm else "P: —"
                             # Top of inning: away bats, home pitches
                             # Bottom: home bats, away pitches
-                            _ls = g.get("linescore") or {}
-                            _is_top = _ls.get("isTopInning")
+                            _is_top = live_ls.get("isTopInning")
                             if _is_top:
                                 away_slot = batter_lbl
                                 home_slot = pitcher_lbl
@@ -3636,7 +4077,7 @@ def get_games_for_date(
                     home_slot = f"L: {loser_short}" if loser_short else "L: —"
 
             # ---- Live baserunners / outs (for ticker + quick glance UIs) ----
-            ls = g.get("linescore") or {}
+            ls = live_ls or g.get("linescore") or {}
             offense = (ls.get("offense") or {})
             outs_now = _safe_int(ls.get("outs"))
             if outs_now is None:
@@ -3730,39 +4171,59 @@ def get_games_for_date(
 
     return out
 
+def _game_state(data: dict) -> str:
+    status = ((data.get("gameData") or {}).get("status") or {})
+    return (status.get("abstractGameState") or "").lower()
+
+
+def _game_feed_ttl(state: str) -> int:
+    # IMPORTANT:
+    # - live polling UX wants fresh data quickly
+    # - keep TTL short when "live"
+    if state == "live":
+        return 5
+    elif state == "final":
+        return 60 * 60 * 24
+    # preview / warmup / other
+    return 15
+
+
 def get_game_feed(game_pk: int) -> dict:
     """
     Try live feed. If not available (404 for future games) OR any network/API error,
     fall back to schedule lookup.
+
+    Live games are fetched in full once, then kept current from statsapi
+    diffPatch deltas (services/live_feed.py).
     """
     cache_key = f"gamefeed:{game_pk}"
     cached = _get_cached(cache_key)
     if cached is not None:
         return cached
 
+    data = live_feed.poll(game_pk)
+    if data is not None:
+        state = _game_state(data)
+        feed = live_feed.get(game_pk)
+        if state != "live":
+            live_feed.forget(game_pk)
+        _set_cached(cache_key, data, ttl=_game_feed_ttl(state),
+                    size=feed.nbytes if feed is not None else None)
+        return data
+
     url = f"https://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live"
 
     try:
-        r = requests.get(url, timeout=30)
+        r = _http_get(url)
 
         if r.status_code == 200:
             data = r.json() or {}
 
-            status = ((data.get("gameData") or {}).get("status") or {})
-            state = (status.get("abstractGameState") or "").lower()
-
-            # IMPORTANT:
-            # - live polling UX wants fresh data quickly
-            # - keep TTL short when "live"
+            state = _game_state(data)
             if state == "live":
-                ttl = 5
-            elif state == "final":
-                ttl = 60 * 60 * 24
-            else:
-                # preview / warmup / other
-                ttl = 15
+                live_feed.track(game_pk, data, nbytes=len(r.content))
 
-            _set_cached(cache_key, data, ttl=ttl)
+            _set_cached(cache_key, data, ttl=_game_feed_ttl(state), size=len(r.content))
             return data
 
         # Any other status: fallback
@@ -3942,7 +4403,7 @@ def get_stats_leaderboard(
     if league_id:
         params["leagueId"] = int(league_id)
 
-    r = requests.get(url, params=params, timeout=30)
+    r = _http_get(url, params=params)
     r.raise_for_status()
     data = r.json() or {}
 
@@ -3989,6 +4450,14 @@ def get_stats_leaderboard(
     return out
 
 def normalize_game_detail(feed: dict, tz_name: str = "America/Phoenix") -> dict:
+    """
+    Normalizes /api/v1.1/game/{gamePk}/feed/live for game.html
+    (memoized per feed snapshot; see _normalize_game_detail).
+    """
+    return _memoized_normalize("game_detail", feed, _normalize_game_detail, tz_name)
+
+
+def _normalize_game_detail(feed: dict, tz_name: str = "America/Phoenix") -> dict:
     """
     Normalizes /api/v1.1/game/{gamePk}/feed/live for game.html.
 
@@ -4588,8 +5057,7 @@ def normalize_game_detail(feed: dict, tz_name: str = "America/Phoenix") -> dict:
     # ---------------------
     # plate appearances (PAS) for PBP tab
     # ---------------------
-    pas_out = []
-    for p in all_plays:
+    def _pa_record(p: dict) -> dict:
         about = p.get("about") or {}
         inning = _safe_int(about.get("inning"), default=None)
         half = _half_norm(about.get("halfInning"))
@@ -4708,7 +5176,7 @@ def normalize_game_detail(feed: dict, tz_name: str = "America/Phoenix") -> dict:
         batter_obj = matchup.get("batter") or {}
         pitcher_obj = matchup.get("pitcher") or {}
 
-        pas_out.append(
+        return (
             {
                 "inning": inning,
                 "half": half,
@@ -4746,7 +5214,8 @@ def normalize_game_detail(feed: dict, tz_name: str = "America/Phoenix") -> dict:
             }
         )
 
-
+    game_pk = _feed_game_pk(feed)
+    pas_out = [_play_record("game_detail.pa", game_pk, p, _pa_record) for p in all_plays]
 
     game_obj["pas"] = pas_out
 
@@ -4781,7 +5250,7 @@ def get_schedule_game_by_pk(game_pk: int) -> Optional[dict]:
         "gamePk": game_pk,
         "hydrate": "team,probablePitchers,venue",
     }
-    r = requests.get(url, params=params, timeout=20)
+    r = _http_get(url, params=params)
     r.raise_for_status()
     data = r.json() or {}
 
@@ -4817,7 +5286,7 @@ def get_pitcher_season_line(person_id: int, season: int) -> dict:
     try:
         url = f"{BASE}/people/{person_id}/stats"
         params = {"stats": "season", "group": "pitching", "season": season}
-        r = requests.get(url, params=params, timeout=20)
+        r = _http_get(url, params=params)
         r.raise_for_status()
         data = r.json() or {}
 
@@ -4914,7 +5383,7 @@ def get_wbc_schedule_for_dates(start_date_ymd: str, end_date_ymd: str) -> dict:
         "hydrate": "team,linescore,decisions,venue",
     }
     try:
-        r = requests.get(url, params=params, timeout=30)
+        r = _http_get(url, params=params)
         r.raise_for_status()
         data = r.json() or {}
     except Exception:
@@ -5008,7 +5477,7 @@ def get_wbc_teams(year: int) -> dict:
 
     try:
         params = {"sportId": WBC_SPORT_ID, "season": year, "hydrate": "league,division"}
-        r = requests.get(f"{BASE}/teams", params=params, timeout=10)
+        r = _http_get(f"{BASE}/teams", params=params)
         r.raise_for_status()
         data = r.json()
     except Exception:
@@ -5042,7 +5511,7 @@ def get_wbc_standings(year: int) -> list:
 
     # Fetch all WBC games for the season
     try:
-        sr = requests.get(
+        sr = _http_get(
             f"{BASE}/schedule",
             params={
                 "sportId": WBC_SPORT_ID,
@@ -5050,7 +5519,6 @@ def get_wbc_standings(year: int) -> list:
                 "endDate": f"{year}-12-31",
                 "hydrate": "team(division),linescore",
             },
-            timeout=20,
         )
         sr.raise_for_status()
         sched = sr.json()
@@ -5114,7 +5582,7 @@ def get_wbc_standings(year: int) -> list:
 
     # Also include teams with 0 games from the standings API (to show full pools)
     try:
-        lr = requests.get(
+        lr = _http_get(
             f"{BASE}/standings",
             params={
                 "leagueId": "160",
@@ -5122,7 +5590,6 @@ def get_wbc_standings(year: int) -> list:
                 "standingsTypes": "regularSeason",
                 "hydrate": "team(division)",
             },
-            timeout=10,
         )
         lr.raise_for_status()
         for record in (lr.json().get("records") or []):
@@ -5171,10 +5638,9 @@ def get_player_stats(player_id: int, season: Optional[int] = None) -> List[dict]
         return cached
 
     url = f"{MLB_API_BASE}/people/{player_id}/stats"
-    resp = requests.get(
+    resp = _http_get(
         url,
         params={"stats": "season", "group": "hitting,pitching,fielding", "season": season},
-        timeout=10,
     )
     resp.raise_for_status()
     stats = (resp.json() or {}).get("stats", []) or []
@@ -5421,7 +5887,7 @@ def get_game_analytics(game_pk, sims: int = 600) -> dict:
 
     ttl_s = 20 if not is_final else 3600
     cache_key = (game_pk_int, sig)
-    cached = _analytics_cache_get(cache_key, ttl_s=ttl_s)
+    cached = _analytics_cache_get(cache_key)
     if cached is not None:
         return cached
 
@@ -5482,5 +5948,5 @@ def get_game_analytics(game_pk, sims: int = 600) -> dict:
         "debug": debug,
     }
 
-    _analytics_cache_set(cache_key, payload)
+    _analytics_cache_set(cache_key, payload, ttl_s=ttl_s)
     return payload
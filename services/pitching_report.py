@@ -1,11 +1,13 @@
 # services/pitching_report.py
 from __future__ import annotations
 
-import os
 import math
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
-import psycopg
+import numpy as np
+
+from services import db_pool
+from services.ttl_cache import get_cache
 
 
 # --- Fixed zone (MLB plate = 17 inches = ±8.5in = ±0.7083ft) ---
@@ -48,12 +50,26 @@ OUT_OF_ZONE: set = {11, 12, 13, 14}
 K_EVENTS = {"strikeout", "strikeout_double_play"}
 BB_EVENTS = {"walk", "intent_walk"}
 
-
-def _db_url() -> str:
-    url = os.environ.get("DATABASE_URL") or os.environ.get("DATABASE_URL_PG") or ""
-    if not url:
-        raise RuntimeError("Missing DATABASE_URL env var")
-    return url
+# One pitcher-season of pitches as NumPy columns, shared by the summary,
+# heatmap, scatter and game log endpoints.  The report page fires all of them
+# and re-requests the heatmap on every pitch type / L-R / game toggle; those
+# are all slices of the same season, so the season is queried once and
+# filtered in memory.  The TTL bounds how stale a live season can get.
+PITCH_CACHE_TTL_SECONDS = 5 * 60
+_pitch_cache = get_cache("pitching_report.pitches", max_entries=32,
+                         max_bytes=64 * 1024 * 1024, default_ttl=PITCH_CACHE_TTL_SECONDS)
+
+_FLOAT_COLS = (
+    "release_speed",
+    "release_spin_rate",
+    "pfx_x",
+    "pfx_z",
+    "plate_x",
+    "plate_z",
+    "estimated_woba_using_speedangle",
+    "stuff_plus",
+    "control_plus",
+)
 
 
 def _safe_float(x: Any) -> Optional[float]:
@@ -68,11 +84,11 @@ def _safe_float(x: Any) -> Optional[float]:
         return None
 
 
-def _mean(vals: List[Optional[float]]) -> Optional[float]:
-    vv = [v for v in vals if v is not None and math.isfinite(v)]
-    if not vv:
+def _mean(vals: np.ndarray) -> Optional[float]:
+    vv = vals[np.isfinite(vals)]
+    if not vv.size:
         return None
-    return float(sum(vv)) / float(len(vv))
+    return float(vv.mean())
 
 
 def _stand_lr(stand: Optional[str], p_throws: Optional[str]) -> Optional[str]:
@@ -97,85 +113,54 @@ def _stand_lr(stand: Optional[str], p_throws: Optional[str]) -> Optional[str]:
     return None
 
 
-def _bin_index(v: float, vmin: float, vmax: float, n: int) -> Optional[int]:
-    if v is None or not math.isfinite(v):
-        return None
-    if v < vmin or v > vmax:
-        return None
-    t = (v - vmin) / (vmax - vmin) if vmax != vmin else 0.0
-    i = int(t * n)
-    if i == n:
-        i = n - 1
-    if i < 0 or i >= n:
-        return None
-    return i
-
-
-def _zeros_grid() -> List[List[float]]:
-    return [[0.0 for _ in range(GRID_NX)] for __ in range(GRID_NZ)]
-
-
-def _hist2d(points: List[Tuple[float, float]]) -> List[List[float]]:
-    H = _zeros_grid()
-    for x, z in points:
-        ix = _bin_index(x, X_MIN, X_MAX, GRID_NX)
-        iz = _bin_index(z, Z_MIN, Z_MAX, GRID_NZ)
-        if ix is None or iz is None:
-            continue
-        H[iz][ix] += 1.0
+def _zone_num(v: Any) -> int:
+    """Statcast zone as an int; 0 (neither in nor out of zone) if missing."""
+    if v is None:
+        return 0
+    try:
+        return int(v)
+    except (ValueError, TypeError, OverflowError):
+        return 0
+
+
+def _hist2d(x: np.ndarray, z: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """(GRID_NZ, GRID_NX) counts (or summed weights) of points inside the grid."""
+    H, _, _ = np.histogram2d(
+        z, x,
+        bins=(GRID_NZ, GRID_NX),
+        range=((Z_MIN, Z_MAX), (X_MIN, X_MAX)),
+        weights=weights,
+    )
     return H
 
 
-def _gaussian_kernel_1d(sigma: float) -> List[float]:
+def _gaussian_kernel_1d(sigma: float) -> np.ndarray:
     r = max(1, int(math.ceil(3.0 * sigma)))
-    xs = list(range(-r, r + 1))
-    k = [math.exp(-(x * x) / (2.0 * sigma * sigma)) for x in xs]
-    s = sum(k) or 1.0
-    return [v / s for v in k]
+    xs = np.arange(-r, r + 1, dtype=float)
+    k = np.exp(-(xs * xs) / (2.0 * sigma * sigma))
+    return k / (k.sum() or 1.0)
 
 
-def _convolve_1d(arr: List[float], kernel: List[float]) -> List[float]:
+def _convolve_axis(grid: np.ndarray, kernel: np.ndarray, axis: int) -> np.ndarray:
+    """Convolve every line along `axis` with `kernel`, clamping at the edges."""
     r = (len(kernel) - 1) // 2
-    n = len(arr)
-    out = [0.0] * n
-    for i in range(n):
-        acc = 0.0
-        for j, w in enumerate(kernel):
-            ii = i + (j - r)
-            if ii < 0:
-                ii = 0
-            elif ii >= n:
-                ii = n - 1
-            acc += arr[ii] * w
-        out[i] = acc
-    return out
+    pad = [(0, 0)] * grid.ndim
+    pad[axis] = (r, r)
+    padded = np.pad(grid, pad, mode="edge")
+    return np.lib.stride_tricks.sliding_window_view(padded, len(kernel), axis=axis) @ kernel
 
 
-def _blur_grid(grid: List[List[float]], sigma: float = GAUSS_SIGMA) -> List[List[float]]:
-    if not grid:
+def _blur_grid(grid: np.ndarray, sigma: float = GAUSS_SIGMA) -> np.ndarray:
+    if not grid.size:
         return grid
     k = _gaussian_kernel_1d(sigma)
-
-    # blur X
-    tmp = []
-    for row in grid:
-        tmp.append(_convolve_1d(row, k))
-
-    # blur Z
-    nz = len(tmp)
-    nx = len(tmp[0]) if nz else 0
-    out = [[0.0 for _ in range(nx)] for _ in range(nz)]
-    for x in range(nx):
-        col = [tmp[z][x] for z in range(nz)]
-        colb = _convolve_1d(col, k)
-        for z in range(nz):
-            out[z][x] = colb[z]
-    return out
+    # blur X, then Z
+    return _convolve_axis(_convolve_axis(grid, k, axis=1), k, axis=0)
 
 
-def _grid_payload(grid: List[List[float]]) -> Dict[str, Any]:
+def _grid_payload(grid: np.ndarray) -> Dict[str, Any]:
     return {
-        "grid": grid,
+        "grid": grid.tolist(),
         "nx": GRID_NX,
         "nz": GRID_NZ,
         "x_min": X_MIN,
@@ -269,7 +254,7 @@ def _fetch_pitches(
     {fb_filter}
     """
 
-    with psycopg.connect(_db_url()) as conn:
+    with db_pool.connection() as conn:
         with conn.cursor() as cur:
             try:
                 cur.execute(sql_both, params)
@@ -285,6 +270,98 @@ def _fetch_pitches(
             return [dict(zip(cols, r)) for r in rows]
 
 
+# ----------------------------
+# Columnar pitch cache
+# ----------------------------
+def _columns(rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Turn `_fetch_pitches` rows into parallel arrays.
+
+    Numeric columns are float64 with NaN for missing values; text columns
+    are normalized the way the endpoints compare them, and the swing / zone /
+    PA classifications are precomputed as boolean masks.
+    """
+    cols: Dict[str, np.ndarray] = {
+        name: np.array([_safe_float(r.get(name)) for r in rows], dtype=float)
+        for name in _FLOAT_COLS
+    }
+
+    desc = [(r.get("description") or "").lower().strip() for r in rows]
+    events = [(r.get("events") or "").lower().strip() for r in rows]
+    zone = np.array([_zone_num(r.get("zone")) for r in rows], dtype=np.int16)
+
+    cols.update({
+        "game_pk": np.array([int(r["game_pk"]) if r.get("game_pk") is not None else -1
+                             for r in rows], dtype=np.int64),
+        "game_date": np.array([str(r["game_date"])[:10] if r.get("game_date") else None
+                               for r in rows], dtype=object),
+        "pitch_type": np.array([(r.get("pitch_type") or "").strip() for r in rows], dtype=object),
+        "pitch_name": np.array([r.get("pitch_name") for r in rows], dtype=object),
+        "stand": np.array([(r.get("stand") or "").upper() for r in rows], dtype=object),
+        "side": np.array([_stand_lr(r.get("stand"), r.get("p_throws")) or "" for r in rows],
+                         dtype=object),
+        "swing": np.array([d in SWING for d in desc], dtype=bool),
+        "whiff": np.array([d in WHIFF for d in desc], dtype=bool),
+        "in_zone": np.isin(zone, list(IN_ZONE)),
+        "out_of_zone": np.isin(zone, list(OUT_OF_ZONE)),
+        "pa": np.array([bool(e) for e in events], dtype=bool),
+        "k": np.array([e in K_EVENTS for e in events], dtype=bool),
+        "bb": np.array([e in BB_EVENTS for e in events], dtype=bool),
+    })
+    return cols
+
+
+def _take(cols: Dict[str, np.ndarray], mask: np.ndarray) -> Dict[str, np.ndarray]:
+    return {name: a[mask] for name, a in cols.items()}
+
+
+def _pitcher_columns(
+    pitcher_id: int,
+    season: int,
+    game_pk: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """A pitcher's season of pitches (optionally one game's) as columns."""
+    key = (int(pitcher_id), int(season))
+    cols = _pitch_cache.get(key)
+    if cols is None:
+        cols = _columns(_fetch_pitches(pitcher_id, season))
+        # object columns hold pointers to mostly-shared strings; count 64B each
+        size = sum(a.nbytes * (8 if a.dtype == object else 1) for a in cols.values())
+        _pitch_cache.set(key, cols, size=size)
+    if game_pk:
+        cols = _take(cols, cols["game_pk"] == int(game_pk))
+    return cols
+
+
+def _split_stats(cols: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Whiff / zone / chase rates for a slice of pitches."""
+    n = len(cols["swing"])
+    swings = int(cols["swing"].sum())
+    whiffs = int(cols["whiff"].sum())
+    in_zone = int(cols["in_zone"].sum())
+    ooz = int(cols["out_of_zone"].sum())
+    ooz_swings = int((cols["out_of_zone"] & cols["swing"]).sum())
+    return {
+        "whiff": (100.0 * whiffs / swings) if swings else None,
+        "zone_pct": (100.0 * in_zone / n) if n else None,
+        "chase_pct": (100.0 * ooz_swings / ooz) if ooz else None,
+    }
+
+
+def _pa_stats(cols: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    pa = int(cols["pa"].sum())
+    k = int(cols["k"].sum())
+    bb = int(cols["bb"].sum())
+    return {
+        "k_pct": (100.0 * k / pa) if pa else None,
+        "bb_pct": (100.0 * bb / pa) if pa else None,
+    }
+
+
+def _nullable(vals: np.ndarray) -> List[Optional[float]]:
+    return [v if v == v else None for v in vals.tolist()]
+
+
 # ----------------------------
 # PUBLIC: matches app.py imports
 # ----------------------------
@@ -297,7 +374,7 @@ def list_pitching_games(pitcher_id: int, season: int) -> List[Dict[str, Any]]:
     GROUP BY game_pk
     ORDER BY game_date DESC, game_pk DESC
     """
-    with psycopg.connect(_db_url()) as conn:
+    with db_pool.connection() as conn:
         with conn.cursor() as cur:
             cur.execute(sql, (int(pitcher_id), int(season)))
             rows = cur.fetchall()
@@ -319,101 +396,42 @@ def pitching_report_summary(
     season: int,
     game_pk: Optional[int] = None,
 ) -> Dict[str, Any]:
-    arr = _fetch_pitches(pitcher_id, season, game_pk=game_pk)
-    if not arr:
+    cols = _pitcher_columns(pitcher_id, season, game_pk=game_pk)
+    total = len(cols["pitch_type"])
+    if not total:
         return {"ok": False, "pitcher_id": int(pitcher_id), "season": int(season), "game_pk": game_pk}
 
-    by_pt: Dict[str, List[Dict[str, Any]]] = {}
-    for r in arr:
-        pt = (r.get("pitch_type") or "").strip() or "UNK"
-        by_pt.setdefault(pt, []).append(r)
-
-    total = len(arr)
+    pt_key = cols["pitch_type"].copy()
+    pt_key[pt_key == ""] = "UNK"
+    keys, first, group, counts = np.unique(
+        pt_key, return_index=True, return_inverse=True, return_counts=True)
+    # most-thrown first; ties keep the order the pitch types first appeared
+    order = sorted(np.argsort(first, kind="stable"), key=lambda g: -counts[g])
 
     # usage split vs LHH / RHH (switch-hitters mapped by pitcher handedness)
-    side_totals: Dict[str, int] = {"L": 0, "R": 0}
-    side_by_pt: Dict[str, Dict[str, int]] = {}
-    for r in arr:
-        pt0 = (r.get("pitch_type") or "").strip() or "UNK"
-        side0 = _stand_lr(r.get("stand"), r.get("p_throws"))
-        if side0 in ("L", "R"):
-            side_totals[side0] += 1
-            d = side_by_pt.setdefault(pt0, {"L": 0, "R": 0})
-            d[side0] += 1
+    is_l = cols["side"] == "L"
+    is_r = cols["side"] == "R"
+    ltot = int(is_l.sum())
+    rtot = int(is_r.sum())
+    side_totals: Dict[str, int] = {"L": ltot, "R": rtot}
 
     mix: List[Dict[str, Any]] = []
     shapes: List[Dict[str, Any]] = []
     pitches: List[Dict[str, Any]] = []
+    usage_lr: List[Dict[str, Any]] = []
 
-    # Aggregate counters for the top-level basic line
-    agg_swings = 0
-    agg_whiffs = 0
-    agg_in_zone = 0
-    agg_ooz = 0
-    agg_ooz_swings = 0
-    agg_xw: List[float] = []
-    agg_events: List[str] = []
-
-    for pt, rows in by_pt.items():
-        n = len(rows)
-        pitch_name = (rows[0].get("pitch_name") or pt) if rows else pt
+    for g in order:
+        pt = str(keys[g])
+        n = int(counts[g])
+        pitch_name = cols["pitch_name"][first[g]] or pt
+        in_pt = group == g
+        rows = _take(cols, in_pt)
 
         pitches.append({"pitch_type": pt, "pitch_name": pitch_name, "n": n})
 
-        velo = [_safe_float(x.get("release_speed")) for x in rows]
-        spin = [_safe_float(x.get("release_spin_rate")) for x in rows]
-        hb = [_safe_float(x.get("pfx_x")) for x in rows]  # feet
-        vb = [_safe_float(x.get("pfx_z")) for x in rows]  # feet (already induced / gravity-removed)
-        sp_vals = [_safe_float(x.get("stuff_plus")) for x in rows]
-        cp_vals = [_safe_float(x.get("control_plus")) for x in rows]
-
-        swings = 0
-        whiffs = 0
-        in_zone = 0
-        ooz = 0
-        ooz_swings = 0
-        xw_list: List[Optional[float]] = []
-
-        for x in rows:
-            desc = (x.get("description") or "").lower().strip()
-            zone_num = x.get("zone")
-            ev = (x.get("events") or "").lower().strip()
-
-            if desc in SWING:
-                swings += 1
-            if desc in WHIFF:
-                whiffs += 1
-
-            if zone_num is not None:
-                try:
-                    zn = int(zone_num)
-                    if zn in IN_ZONE:
-                        in_zone += 1
-                    elif zn in OUT_OF_ZONE:
-                        ooz += 1
-                        if desc in SWING:
-                            ooz_swings += 1
-                except (ValueError, TypeError):
-                    pass
-
-            xw = _safe_float(x.get("estimated_woba_using_speedangle"))
-            if xw is not None:
-                xw_list.append(xw)
-
-            if ev:
-                agg_events.append(ev)
-
-        # Aggregate into overall totals
-        agg_swings += swings
-        agg_whiffs += whiffs
-        agg_in_zone += in_zone
-        agg_ooz += ooz
-        agg_ooz_swings += ooz_swings
-        agg_xw.extend(xw_list)
-
-        # Only include stuff_plus/control_plus mean if we have data
-        sp_mean = _mean([v for v in sp_vals if v is not None])
-        cp_mean = _mean([v for v in cp_vals if v is not None])
+        hb = _mean(rows["pfx_x"])  # feet
+        vb = _mean(rows["pfx_z"])  # feet (already induced / gravity-removed)
+        split = _split_stats(rows)
 
         mix.append(
             {
@@ -421,16 +439,16 @@ def pitching_report_summary(
                 "pitch_name": pitch_name,
                 "n": n,
                 "usage": (100.0 * n / total) if total else 0.0,
-                "velo": _mean(velo),
-                "spin": _mean(spin),
-                "hb": (_mean(hb) * 12.0) if _mean(hb) is not None else None,  # inches
-                "ivb": (_mean(vb) * 12.0) if _mean(vb) is not None else None,  # inches (pfx_z already induced)
-                "xwoba": _mean(xw_list),
-                "whiff": (100.0 * whiffs / swings) if swings else None,
-                "zone_pct": (100.0 * in_zone / n) if n else None,
-                "chase_pct": (100.0 * ooz_swings / ooz) if ooz else None,
-                "stuff_plus": sp_mean,
-                "control_plus": cp_mean,
+                "velo": _mean(rows["release_speed"]),
+                "spin": _mean(rows["release_spin_rate"]),
+                "hb": (hb * 12.0) if hb is not None else None,  # inches
+                "ivb": (vb * 12.0) if vb is not None else None,  # inches (pfx_z already induced)
+                "xwoba": _mean(rows["estimated_woba_using_speedangle"]),
+                "whiff": split["whiff"],
+                "zone_pct": split["zone_pct"],
+                "chase_pct": split["chase_pct"],
+                "stuff_plus": _mean(rows["stuff_plus"]),
+                "control_plus": _mean(rows["control_plus"]),
             }
         )
 
@@ -440,41 +458,17 @@ def pitching_report_summary(
                 "pitch_type": pt,
                 "pitch_name": pitch_name,
                 "n": n,
-                "pfx_x": _mean(hb),  # feet
-                "pfx_z": _mean(vb),  # feet
+                "pfx_x": hb,  # feet
+                "pfx_z": vb,  # feet
             }
         )
 
-    # Build aggregate basic line
-    agg_pa = len(agg_events)
-    agg_k = sum(1 for e in agg_events if e in K_EVENTS)
-    agg_bb = sum(1 for e in agg_events if e in BB_EVENTS)
-    basic = {
-        "whiff_pct": (100.0 * agg_whiffs / agg_swings) if agg_swings else None,
-        "zone_pct": (100.0 * agg_in_zone / total) if total else None,
-        "chase_pct": (100.0 * agg_ooz_swings / agg_ooz) if agg_ooz else None,
-        "xwoba": _mean(agg_xw) if agg_xw else None,
-        "k_pct": (100.0 * agg_k / agg_pa) if agg_pa else None,
-        "bb_pct": (100.0 * agg_bb / agg_pa) if agg_pa else None,
-    }
-
-    pitches.sort(key=lambda x: x["n"], reverse=True)
-    mix.sort(key=lambda x: x["n"], reverse=True)
-    shapes.sort(key=lambda x: x["n"], reverse=True)
-
-    usage_lr: List[Dict[str, Any]] = []
-    ltot = int(side_totals.get("L") or 0)
-    rtot = int(side_totals.get("R") or 0)
-    for p in pitches:
-        pt0 = (p.get("pitch_type") or "").strip() or "UNK"
-        name0 = p.get("pitch_name") or pt0
-        d = side_by_pt.get(pt0) or {"L": 0, "R": 0}
-        lc = int(d.get("L") or 0)
-        rc = int(d.get("R") or 0)
+        lc = int((in_pt & is_l).sum())
+        rc = int((in_pt & is_r).sum())
         usage_lr.append(
             {
-                "pitch_type": pt0,
-                "pitch_name": name0,
+                "pitch_type": pt,
+                "pitch_name": pitch_name,
                 "l_count": lc,
                 "r_count": rc,
                 "l_usage": (100.0 * lc / ltot) if ltot else 0.0,
@@ -482,6 +476,16 @@ def pitching_report_summary(
             }
         )
 
+    # Aggregate basic line
+    split = _split_stats(cols)
+    basic = {
+        "whiff_pct": split["whiff"],
+        "zone_pct": split["zone_pct"],
+        "chase_pct": split["chase_pct"],
+        "xwoba": _mean(cols["estimated_woba_using_speedangle"]),
+        **_pa_stats(cols),
+    }
+
     return {
         "ok": True,
         "pitcher_id": int(pitcher_id),
@@ -506,8 +510,8 @@ def pitching_heatmap(
     metric: str = "density",
     game_pk: Optional[int] = None,
 ) -> Dict[str, Any]:
-    arr = _fetch_pitches(pitcher_id, season, game_pk=game_pk)
-    if not arr:
+    cols = _pitcher_columns(pitcher_id, season, game_pk=game_pk)
+    if not len(cols["pitch_type"]):
         return {"ok": False, "reason": "no_pitches"}
 
     pt = (pitch_type or "").strip() or ""
@@ -515,60 +519,28 @@ def pitching_heatmap(
     if side not in ("L", "R"):
         return {"ok": False, "reason": "bad_stand"}
 
-    pts: List[Tuple[float, float]] = []
-    xw_pts: List[Tuple[float, float, float]] = []
-
-    for r in arr:
-        if (r.get("pitch_type") or "").strip() != pt:
-            continue
-        s = _stand_lr(r.get("stand"), r.get("p_throws"))
-        if s != side:
-            continue
-
-        x = _safe_float(r.get("plate_x"))
-        z = _safe_float(r.get("plate_z"))
-        if x is None or z is None:
-            continue
-
-        pts.append((x, z))
-
-        xw = _safe_float(r.get("estimated_woba_using_speedangle"))
-        if xw is not None:
-            xw_pts.append((x, z, xw))
-
-    if not pts:
+    x = cols["plate_x"]
+    z = cols["plate_z"]
+    sel = (cols["pitch_type"] == pt) & (cols["side"] == side) & np.isfinite(x) & np.isfinite(z)
+    if not sel.any():
         return {"ok": False, "reason": "no_points"}
 
     if metric == "density":
-        H = _hist2d(pts)
+        H = _hist2d(x[sel], z[sel])
         Hb = _blur_grid(H, GAUSS_SIGMA)
         out = _grid_payload(Hb)
         out.update({"ok": True, "metric": "density", "pitch_type": pt, "stand_lr": side})
         return out
 
     # xwOBA heatmap: average xwOBA per cell
-    if not xw_pts:
+    xw = cols["estimated_woba_using_speedangle"]
+    sel &= np.isfinite(xw)
+    if not sel.any():
         return {"ok": False, "reason": "no_xwoba"}
 
-    sum_grid = _zeros_grid()
-    cnt_grid = _zeros_grid()
-
-    for x, z, xw in xw_pts:
-        ix = _bin_index(x, X_MIN, X_MAX, GRID_NX)
-        iz = _bin_index(z, Z_MIN, Z_MAX, GRID_NZ)
-        if ix is None or iz is None:
-            continue
-        sum_grid[iz][ix] += float(xw)
-        cnt_grid[iz][ix] += 1.0
-
-    avg_grid = _zeros_grid()
-    for iz in range(GRID_NZ):
-        for ix in range(GRID_NX):
-            c = cnt_grid[iz][ix]
-            if c > 0:
-                avg_grid[iz][ix] = sum_grid[iz][ix] / c
-            else:
-                avg_grid[iz][ix] = 0.0
+    sum_grid = _hist2d(x[sel], z[sel], weights=xw[sel])
+    cnt_grid = _hist2d(x[sel], z[sel])
+    avg_grid = np.divide(sum_grid, cnt_grid, out=np.zeros_like(sum_grid), where=cnt_grid > 0)
 
     avg_blur = _blur_grid(avg_grid, GAUSS_SIGMA)
     out = _grid_payload(avg_blur)
@@ -582,112 +554,57 @@ def pitching_scatter(
     game_pk: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """Return per-pitch location + movement data for scatter plots."""
-    arr = _fetch_pitches(pitcher_id, season, game_pk=game_pk)
-    out = []
-    for r in arr:
-        pt = (r.get("pitch_type") or "").strip()
-        if not pt:
-            continue
-        hb = _safe_float(r.get("pfx_x"))
-        vb = _safe_float(r.get("pfx_z"))
-        out.append({
+    cols = _pitcher_columns(pitcher_id, season, game_pk=game_pk)
+    cols = _take(cols, cols["pitch_type"] != "")
+    return [
+        {
             "pitch_type": pt,
-            "pitch_name": r.get("pitch_name") or pt,
-            "stand": (r.get("stand") or "").upper(),
-            "plate_x": _safe_float(r.get("plate_x")),
-            "plate_z": _safe_float(r.get("plate_z")),
-            "hb": (hb * 12.0) if hb is not None else None,
-            "ivb": (vb * 12.0) if vb is not None else None,
-        })
-    return out
+            "pitch_name": name or pt,
+            "stand": stand,
+            "plate_x": px,
+            "plate_z": pz,
+            "hb": hb,
+            "ivb": ivb,
+        }
+        for pt, name, stand, px, pz, hb, ivb in zip(
+            cols["pitch_type"].tolist(),
+            cols["pitch_name"].tolist(),
+            cols["stand"].tolist(),
+            _nullable(cols["plate_x"]),
+            _nullable(cols["plate_z"]),
+            _nullable(cols["pfx_x"] * 12.0),
+            _nullable(cols["pfx_z"] * 12.0),
+        )
+    ]
 
 
 def pitching_gamelog(pitcher_id: int, season: int) -> List[Dict[str, Any]]:
     """Return game-by-game pitching stats for the given pitcher/season."""
-    arr = _fetch_pitches(pitcher_id, season)
-    if not arr:
-        return []
-
-    # Group pitches by game_pk
-    games: Dict[int, List[Dict[str, Any]]] = {}
-    for r in arr:
-        gp = r.get("game_pk")
-        if gp is not None:
-            games.setdefault(int(gp), []).append(r)
+    cols = _pitcher_columns(pitcher_id, season)
 
     rows: List[Dict[str, Any]] = []
-    for gp, pitches in sorted(games.items(), reverse=True):
-        n = len(pitches)
+    for gp in np.unique(cols["game_pk"])[::-1].tolist():
+        if gp < 0:
+            continue
+        pitches = _take(cols, cols["game_pk"] == gp)
+        n = len(pitches["game_pk"])
 
         # Game date (take first non-null)
-        game_date: Optional[str] = None
-        for p in pitches:
-            gd = p.get("game_date")
-            if gd:
-                game_date = str(gd)[:10]
-                break
-
-        # Velo
-        velos = [_safe_float(p.get("release_speed")) for p in pitches]
-        avg_velo = _mean(velos)
-
-        # Stuff+ / Control+
-        sp_vals = [_safe_float(p.get("stuff_plus")) for p in pitches]
-        avg_stuff = _mean([v for v in sp_vals if v is not None])
-        cp_vals = [_safe_float(p.get("control_plus")) for p in pitches]
-        avg_control = _mean([v for v in cp_vals if v is not None])
-
-        # Whiff / Chase / Zone
-        swings = 0
-        whiffs = 0
-        in_zone = 0
-        ooz = 0
-        ooz_swings = 0
-
-        for p in pitches:
-            desc = (p.get("description") or "").lower().strip()
-            zone_num = p.get("zone")
-
-            if desc in SWING:
-                swings += 1
-            if desc in WHIFF:
-                whiffs += 1
-
-            if zone_num is not None:
-                try:
-                    zn = int(zone_num)
-                    if zn in IN_ZONE:
-                        in_zone += 1
-                    elif zn in OUT_OF_ZONE:
-                        ooz += 1
-                        if desc in SWING:
-                            ooz_swings += 1
-                except (ValueError, TypeError):
-                    pass
-
-        # PA-level stats from events
-        events = [str(p.get("events") or "").lower().strip() for p in pitches if p.get("events")]
-        pa = len(events)
-        k = sum(1 for e in events if e in K_EVENTS)
-        bb = sum(1 for e in events if e in BB_EVENTS)
-
-        # xwOBA
-        xw_vals = [_safe_float(p.get("estimated_woba_using_speedangle")) for p in pitches]
-        xwoba = _mean([v for v in xw_vals if v is not None])
+        game_date: Optional[str] = next((d for d in pitches["game_date"] if d), None)
 
+        split = _split_stats(pitches)
         rows.append({
             "game_pk": gp,
             "game_date": game_date,
             "pitches": n,
-            "avg_velo": avg_velo,
-            "avg_stuff_plus": avg_stuff,
-            "avg_control_plus": avg_control,
-            "whiff_pct": (100.0 * whiffs / swings) if swings else None,
-            "zone_pct": (100.0 * in_zone / n) if n else None,
-            "chase_pct": (100.0 * ooz_swings / ooz) if ooz else None,
-            "k_pct": (100.0 * k / pa) if pa else None,
-            "bb_pct": (100.0 * bb / pa) if pa else None,
-            "xwoba": xwoba,
+            "avg_velo": _mean(pitches["release_speed"]),
+            "avg_stuff_plus": _mean(pitches["stuff_plus"]),
+            "avg_control_plus": _mean(pitches["control_plus"]),
+            "whiff_pct": split["whiff"],
+            "zone_pct": split["zone_pct"],
+            "chase_pct": split["chase_pct"],
+            **_pa_stats(pitches),
+            "xwoba": _mean(pitches["estimated_woba_using_speedangle"]),
         })
 
     return rows
@@ -0,0 +1,116 @@
+# services/player_directory.py
+"""
+On-disk artifact for the all-players directory and its search index.
+
+Building the 1990-present directory means reading (or fetching) 36 seasons
+of players, normalizing and sorting them, then indexing them for
+autocomplete, and gunicorn recycles the worker every ~200 requests.  This
+module stores the finished result in one file that a cold worker maps in
+milliseconds:
+
+    MAGIC | header length (8 bytes LE) | JSON header | 64-byte aligned arrays
+
+The header holds `meta` (format version, build time, row count) and the
+dtype/shape/offset of every named array.  Lists of strings are stored as one
+NUL-separated UTF-8 blob (`pack_strings` / `unpack_strings`), which splits
+back into a list at C speed.
+
+The file holds plain arrays only; services/mlb_api.py decides what goes in
+it.  Written by scripts/build_player_directory.py at deploy and by workers
+after a live rebuild.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARTIFACT_PATH = os.environ.get(
+    "PLAYER_DIRECTORY_PATH", os.path.join(_ROOT, "data", "players_directory.bin"))
+
+FORMAT_VERSION = 1
+_MAGIC = b"BNPLDIR\n"
+_ALIGN = 64
+
+
+def pack_strings(values: List[str]) -> np.ndarray:
+    """One utf-8 blob for a list of strings, each NUL-terminated."""
+    text = "".join(f"{v}\0" for v in values)
+    if text.count("\0") != len(values):
+        raise ValueError("strings may not contain NUL")
+    return np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+
+
+def unpack_strings(blob: np.ndarray) -> List[str]:
+    return blob.tobytes().decode("utf-8").split("\0")[:-1]
+
+
+def save(arrays: Dict[str, np.ndarray], meta: Optional[Dict[str, Any]] = None,
+         path: Optional[str] = None) -> str:
+    """Write `arrays` (and `meta`) atomically to `path`; returns the path."""
+    path = path or ARTIFACT_PATH
+    arrays = {name: np.ascontiguousarray(a) for name, a in arrays.items()}
+
+    specs, offset = {}, 0
+    for name, a in arrays.items():
+        offset = -(-offset // _ALIGN) * _ALIGN
+        specs[name] = {"dtype": a.dtype.str, "shape": list(a.shape), "offset": offset}
+        offset += a.nbytes
+    header = json.dumps({
+        "meta": {"version": FORMAT_VERSION, "built_at": time.time(), **(meta or {})},
+        "arrays": specs,
+    }).encode("utf-8")
+    data_start = -(-(len(_MAGIC) + 8 + len(header)) // _ALIGN) * _ALIGN
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_MAGIC)
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+        for name, a in arrays.items():
+            f.seek(data_start + specs[name]["offset"])
+            f.write(a.tobytes())
+    os.replace(tmp, path)
+    return path
+
+
+def load(path: Optional[str] = None, max_age: Optional[float] = None
+         ) -> Optional[Tuple[Dict[str, Any], Dict[str, np.ndarray]]]:
+    """(meta, arrays) memory-mapped from `path`, or None if the file is
+    missing, from another format version, or older than `max_age` seconds."""
+    path = path or ARTIFACT_PATH
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError("not a player directory file")
+            header_len = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_len))
+        meta = header["meta"]
+        if meta.get("version") != FORMAT_VERSION:
+            return None
+        if max_age is not None and time.time() - float(meta.get("built_at", 0)) > max_age:
+            return None
+
+        data_start = -(-(len(_MAGIC) + 8 + header_len) // _ALIGN) * _ALIGN
+        buf = np.memmap(path, dtype=np.uint8, mode="r")
+        arrays = {}
+        for name, spec in header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            count = int(np.prod(spec["shape"], dtype=np.int64))
+            start = data_start + spec["offset"]
+            arrays[name] = buf[start:start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+        return meta, arrays
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning("Ignoring player directory file %s: %s", path, e)
+        return None
@@ -1,5 +1,5 @@
 # services/postseason.py
-import requests
+from services import http_client
 
 STATSAPI_BASE = "https://statsapi.mlb.com/api/v1"
 
@@ -10,9 +10,7 @@ def get_postseason_series(season: int) -> dict:
     """
     url = f"{STATSAPI_BASE}/schedule/postseason/series"
     params = {"season": str(season), "sportId": "1"}
-    r = requests.get(url, params=params, timeout=20)
-    r.raise_for_status()
-    return r.json()
+    return http_client.get_json(url, params=params, timeout=20)
 
 
 def build_playoff_bracket(series_json: dict) -> dict:
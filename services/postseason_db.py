@@ -1,6 +1,7 @@
 # services/postseason_db.py
 import os
 from collections import defaultdict
+from contextlib import contextmanager
 
 # Support psycopg3 or psycopg2
 try:
@@ -17,15 +18,25 @@ except Exception:
     psycopg2 = None
 
 
-def _get_conn():
-    db_url = os.environ.get("DATABASE_URL")
-    if not db_url:
-        raise RuntimeError("DATABASE_URL is not set")
-
+@contextmanager
+def _connect():
     if _PSYCOPG3:
-        return psycopg.connect(db_url)
+        # No URL: share the app pool (db_pool resolves and normalizes it)
+        from services import db_pool
+        with db_pool.connection() as conn:
+            yield conn
+        return
     if psycopg2:
-        return psycopg2.connect(db_url)
+        # db_pool needs psycopg v3, so resolve the URL the same way here
+        db_url = os.environ.get("DATABASE_URL") or os.environ.get("DATABASE_URL_PG")
+        if not db_url:
+            raise RuntimeError("DATABASE_URL is not set")
+        conn = psycopg2.connect(db_url)
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
 
     raise RuntimeError("Neither psycopg (v3) nor psycopg2 is installed")
 
@@ -65,8 +76,7 @@ def fetch_postseason_series_rows(season: int) -> list[dict]:
       t.wins DESC;
     """
 
-    conn = _get_conn()
-    try:
+    with _connect() as conn:
         if _PSYCOPG3:
             with conn.cursor() as cur:
                 cur.execute(sql, (season,))
@@ -79,8 +89,6 @@ def fetch_postseason_series_rows(season: int) -> list[dict]:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:  # type: ignore
                 cur.execute(sql, (season,))
                 return list(cur.fetchall())
-    finally:
-        conn.close()
 
 
 def build_playoff_picture(rows: list[dict]) -> dict:
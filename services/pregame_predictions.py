@@ -8,8 +8,12 @@ predictions for every batter vs the opposing starting pitcher.
 import hashlib
 import logging
 import threading
+
+import numpy as np
+
+from services import lineup_sim
 from services.mlb_api import get_game_feed, get_player_headshot_url
-from services.matchup_predict import predict_matchup
+from services.matchup_predict import predict_matchups_batch
 
 log = logging.getLogger(__name__)
 
@@ -420,25 +424,25 @@ def _compute_pregame_predictions(game_pk, lineup_data, season):
         total_exp_h = 0
         total_exp_bb = 0
 
-        for batter in lineup:
-            # Estimate inning based on lineup spot
-            est_inning = (batter["spot"] - 1) // 3 + 1
-
-            pred = predict_matchup(
-                batter_id=batter["id"],
-                pitcher_id=pitcher["id"],
-                stand=batter["stand"],
-                p_throws=pitcher["throws"],
-                venue=lineup_data["venue"],
-                season=season,
-                inning=est_inning,
-                outs=0,
-                runner_1b=0,
-                runner_2b=0,
-                runner_3b=0,
-                n_thru_order=1,
-            )
-
+        # One model call for the whole lineup.  Inning is estimated from
+        # lineup spot (spots 1-3 → 1st, 4-6 → 2nd, 7-9 → 3rd).
+        preds = predict_matchups_batch(
+            [{"batter_id": b["id"], "stand": b["stand"],
+              "inning": (b["spot"] - 1) // 3 + 1} for b in lineup],
+            context={
+                "pitcher_id": pitcher["id"],
+                "p_throws": pitcher["throws"],
+                "venue": lineup_data["venue"],
+                "season": season,
+                "outs": 0,
+                "runner_1b": 0,
+                "runner_2b": 0,
+                "runner_3b": 0,
+                "n_thru_order": 1,
+            },
+        )
+
+        for batter, pred in zip(lineup, preds):
             if pred.get("ok"):
                 probs = dict(pred["probs"])  # copy so we can adjust
                 summary = dict(pred["summary"])
@@ -552,6 +556,20 @@ def _compute_pregame_predictions(game_pk, lineup_data, season):
             "pitcher_statline": pitcher_statline,
         }
 
+    # Warm the recent-form cache for both lineups and starters with one
+    # query per role; the per-lineup predictions below then read from it
+    try:
+        from services.recent_form import get_batch_recent_form
+        batter_ids = [b["id"] for side in ("away_lineup", "home_lineup")
+                      for b in (lineup_data.get(side) or [])]
+        pitcher_ids = [p["id"] for p in (lineup_data.get("away_pitcher"), lineup_data.get("home_pitcher")) if p]
+        if batter_ids:
+            get_batch_recent_form(batter_ids, role="batter")
+        if pitcher_ids:
+            get_batch_recent_form(pitcher_ids, role="pitcher")
+    except Exception as e:
+        log.warning("Recent form prefetch failed: %s", e)
+
     # Away batters vs Home pitcher, Home batters vs Away pitcher
     result["away"] = _predict_lineup(
         lineup_data["away_lineup"],
@@ -591,349 +609,98 @@ def _compute_pregame_predictions(game_pk, lineup_data, season):
         log.warning("Simulation failed: %s", e)
         result["simulation"] = None
 
-    # NRFI / first-inning simulation
+    # NRFI / first-inning odds (exact Markov-chain solve)
     try:
-        nrfi = _simulate_first_inning(result)
+        nrfi = _solve_first_inning(result)
         result["nrfi"] = nrfi
     except Exception as e:
-        log.warning("NRFI simulation failed: %s", e)
+        log.warning("NRFI solve failed: %s", e)
         result["nrfi"] = None
 
     return result
 
 
-def _simulate_game(pregame_data, sims=2000):
+def _simulate_game(pregame_data, sims=50000):
     """
     Run Monte Carlo simulation using per-batter outcome probabilities.
 
-    Simulates full 9-inning games, cycling through each lineup.
+    Simulates full 9-inning games, cycling through each lineup.  All sims run
+    as one batch in the vectorized engine (services.lineup_sim).
     Returns win probabilities and expected score.
     """
-    import random
-
     away_batters = pregame_data.get("away", {}).get("batters", [])
     home_batters = pregame_data.get("home", {}).get("batters", [])
 
     if not away_batters or not home_batters:
         return None
 
-    # Build probability arrays for each batter
-    outcomes = ["1B", "2B", "3B", "HR", "BB", "HBP", "K", "OUT"]
-
-    def _build_probs(batters):
-        """Build normalized probability arrays for lineup."""
-        lineup = []
-        for b in batters:
-            probs = b.get("probs", {})
-            if not probs:
-                # Fallback: league-average hitter
-                probs = {"1B": 0.15, "2B": 0.045, "3B": 0.004, "HR": 0.033,
-                         "BB": 0.08, "HBP": 0.01, "K": 0.22, "OUT": 0.458}
-            p = [probs.get(o, 0) for o in outcomes]
-            total = sum(p)
-            if total > 0:
-                p = [x / total for x in p]
-            else:
-                p = [0.15, 0.045, 0.004, 0.033, 0.08, 0.01, 0.22, 0.458]
-            lineup.append(p)
-        return lineup
+    rng = np.random.default_rng()
+    away_runs, home_runs = lineup_sim.simulate_games(
+        lineup_sim.lineup_cdf(away_batters),
+        lineup_sim.lineup_cdf(home_batters),
+        sims,
+        rng,
+    )
 
-    away_probs = _build_probs(away_batters)
-    home_probs = _build_probs(home_batters)
-
-    away_wins = 0
-    home_wins = 0
-    away_total = 0.0
-    home_total = 0.0
-    away_runs_counts = {}
-    home_runs_counts = {}
-
-    for _ in range(sims):
-        away_runs, home_runs = _sim_one_game(away_probs, home_probs, outcomes)
-        away_total += away_runs
-        home_total += home_runs
-        away_runs_counts[away_runs] = away_runs_counts.get(away_runs, 0) + 1
-        home_runs_counts[home_runs] = home_runs_counts.get(home_runs, 0) + 1
-        if away_runs > home_runs:
-            away_wins += 1
-        elif home_runs > away_runs:
-            home_wins += 1
-        else:
-            # Tie: simulate extra innings (simplified coin flip weighted by quality)
-            if random.random() < 0.5:
-                away_wins += 1
-            else:
-                home_wins += 1
+    # Tie: simulate extra innings (simplified coin flip weighted by quality)
+    ties = away_runs == home_runs
+    away_tiebreak = ties & (rng.random(sims) < 0.5)
+    away_wins = int(np.count_nonzero(away_runs > home_runs) + np.count_nonzero(away_tiebreak))
+    home_wins = sims - away_wins
 
     # Build run frequency distributions (cap at 15)
-    max_r = min(15, max(
-        max(away_runs_counts.keys(), default=0),
-        max(home_runs_counts.keys(), default=0)
-    ))
-    away_dist = [round(away_runs_counts.get(i, 0) / sims, 4) for i in range(max_r + 1)]
-    home_dist = [round(home_runs_counts.get(i, 0) / sims, 4) for i in range(max_r + 1)]
+    max_r = min(15, int(max(away_runs.max(), home_runs.max())))
 
     return {
         "sims": sims,
         "awayWinPct": round(away_wins / sims, 4),
         "homeWinPct": round(home_wins / sims, 4),
         "expectedScore": {
-            "away": round(away_total / sims, 1),
-            "home": round(home_total / sims, 1),
+            "away": round(float(away_runs.mean()), 1),
+            "home": round(float(home_runs.mean()), 1),
         },
-        "awayRunDist": away_dist,
-        "homeRunDist": home_dist,
+        "awayRunDist": lineup_sim.run_distribution(away_runs, max_r),
+        "homeRunDist": lineup_sim.run_distribution(home_runs, max_r),
     }
 
 
-def _sim_one_game(away_probs, home_probs, outcomes):
-    """Simulate a single 9-inning game. Returns (away_runs, home_runs)."""
-    import random
-
-    def _sim_half(lineup_probs, batter_idx):
-        """Simulate one half-inning. Returns (runs_scored, new_batter_idx)."""
-        outs = 0
-        runners = 0  # bitmask: 1=1B, 2=2B, 4=3B
-        runs = 0
-        idx = batter_idx
-
-        while outs < 3:
-            probs = lineup_probs[idx % len(lineup_probs)]
-            idx += 1
-
-            # Sample outcome
-            r = random.random()
-            cumulative = 0
-            outcome = "OUT"
-            for i, p in enumerate(probs):
-                cumulative += p
-                if r < cumulative:
-                    outcome = outcomes[i]
-                    break
-
-            if outcome == "K" or outcome == "OUT":
-                outs += 1
-            elif outcome == "BB" or outcome == "HBP":
-                # Force walk advancement
-                if runners & 1:
-                    if runners & 2:
-                        if runners & 4:
-                            runs += 1  # bases loaded, score from 3rd
-                        runners |= 4
-                    runners |= 2
-                runners |= 1
-            elif outcome == "1B":
-                # Runner on 3B scores, 2B scores (80%), 1B to 2B
-                if runners & 4:
-                    runs += 1
-                    runners &= ~4
-                if runners & 2:
-                    if random.random() < 0.80:
-                        runs += 1
-                        runners &= ~2
-                    else:
-                        runners |= 4
-                        runners &= ~2
-                if runners & 1:
-                    runners |= 2
-                runners |= 1
-            elif outcome == "2B":
-                # All runners score except runner on 1B goes to 3B (60% scores)
-                if runners & 4:
-                    runs += 1
-                    runners &= ~4
-                if runners & 2:
-                    runs += 1
-                    runners &= ~2
-                if runners & 1:
-                    if random.random() < 0.60:
-                        runs += 1
-                    else:
-                        runners |= 4
-                    runners &= ~1
-                runners |= 2
-            elif outcome == "3B":
-                # All runners score
-                runs += bin(runners).count('1')
-                runners = 4
-            elif outcome == "HR":
-                runs += bin(runners).count('1') + 1
-                runners = 0
-
-        return runs, idx
-
-    away_runs = 0
-    home_runs = 0
-    away_idx = 0
-    home_idx = 0
-
-    for inning in range(1, 10):
-        r, away_idx = _sim_half(away_probs, away_idx)
-        away_runs += r
-
-        # Bottom of 9th: skip if home team already ahead
-        if inning == 9 and home_runs > away_runs:
-            break
-        r, home_idx = _sim_half(home_probs, home_idx)
-        home_runs += r
-
-        # Walk-off
-        if inning >= 9 and home_runs > away_runs:
-            break
-
-    return away_runs, home_runs
-
-
-def _simulate_first_inning(pregame_data, sims=5000):
+def _solve_first_inning(pregame_data):
     """
-    Monte Carlo simulation of just the first inning.
+    Exact first-inning odds from the half-inning Markov chain.
 
     Returns NRFI probability, per-half scoring probs, and expected 1st-inning runs.
     """
-    import random
-
     away_batters = pregame_data.get("away", {}).get("batters", [])
     home_batters = pregame_data.get("home", {}).get("batters", [])
 
     if not away_batters or not home_batters:
         return None
 
-    outcomes = ["1B", "2B", "3B", "HR", "BB", "HBP", "K", "OUT"]
-
-    def _build_probs(batters):
-        lineup = []
-        for b in batters:
-            probs = b.get("probs", {})
-            if not probs:
-                probs = {"1B": 0.15, "2B": 0.045, "3B": 0.004, "HR": 0.033,
-                         "BB": 0.08, "HBP": 0.01, "K": 0.22, "OUT": 0.458}
-            p = [probs.get(o, 0) for o in outcomes]
-            total = sum(p)
-            if total > 0:
-                p = [x / total for x in p]
-            else:
-                p = [0.15, 0.045, 0.004, 0.033, 0.08, 0.01, 0.22, 0.458]
-            lineup.append(p)
-        return lineup
+    # Run distributions (cap at 6)
+    max_r = 6
+    away_dist, away_exp = lineup_sim.half_inning_runs(lineup_sim.lineup_probs(away_batters), max_runs=max_r)
+    home_dist, home_exp = lineup_sim.half_inning_runs(lineup_sim.lineup_probs(home_batters), max_runs=max_r)
 
-    def _sim_half(lineup_probs, batter_idx):
-        """Simulate one half-inning. Returns runs scored."""
-        outs = 0
-        runners = 0
-        runs = 0
-        idx = batter_idx
-
-        while outs < 3:
-            probs = lineup_probs[idx % len(lineup_probs)]
-            idx += 1
-
-            r = random.random()
-            cumulative = 0
-            outcome = "OUT"
-            for i, p in enumerate(probs):
-                cumulative += p
-                if r < cumulative:
-                    outcome = outcomes[i]
-                    break
-
-            if outcome == "K" or outcome == "OUT":
-                outs += 1
-            elif outcome == "BB" or outcome == "HBP":
-                if runners & 1:
-                    if runners & 2:
-                        if runners & 4:
-                            runs += 1
-                        runners |= 4
-                    runners |= 2
-                runners |= 1
-            elif outcome == "1B":
-                if runners & 4:
-                    runs += 1
-                    runners &= ~4
-                if runners & 2:
-                    if random.random() < 0.80:
-                        runs += 1
-                        runners &= ~2
-                    else:
-                        runners |= 4
-                        runners &= ~2
-                if runners & 1:
-                    runners |= 2
-                runners |= 1
-            elif outcome == "2B":
-                if runners & 4:
-                    runs += 1
-                    runners &= ~4
-                if runners & 2:
-                    runs += 1
-                    runners &= ~2
-                if runners & 1:
-                    if random.random() < 0.60:
-                        runs += 1
-                    else:
-                        runners |= 4
-                    runners &= ~1
-                runners |= 2
-            elif outcome == "3B":
-                runs += bin(runners).count('1')
-                runners = 4
-            elif outcome == "HR":
-                runs += bin(runners).count('1') + 1
-                runners = 0
-
-        return runs
-
-    away_probs = _build_probs(away_batters)
-    home_probs = _build_probs(home_batters)
-
-    nrfi_count = 0
-    away_scores = 0  # count of sims where away scored in 1st
-    home_scores = 0
-    away_total_runs = 0.0
-    home_total_runs = 0.0
-    # Track run distributions for the 1st inning
-    away_run_counts = {}
-    home_run_counts = {}
-
-    for _ in range(sims):
-        away_r = _sim_half(away_probs, 0)
-        home_r = _sim_half(home_probs, 0)
-
-        away_total_runs += away_r
-        home_total_runs += home_r
-        away_run_counts[away_r] = away_run_counts.get(away_r, 0) + 1
-        home_run_counts[home_r] = home_run_counts.get(home_r, 0) + 1
-
-        if away_r > 0:
-            away_scores += 1
-        if home_r > 0:
-            home_scores += 1
-        if away_r == 0 and home_r == 0:
-            nrfi_count += 1
-
-    nrfi_pct = round(nrfi_count / sims, 4)
+    away_clean = float(away_dist[0])
+    home_clean = float(home_dist[0])
+    nrfi_pct = round(away_clean * home_clean, 4)
     yrfi_pct = round(1 - nrfi_pct, 4)
 
-    # Build run distributions (cap at 6)
-    max_r = 6
-    away_dist = [round(away_run_counts.get(i, 0) / sims, 4) for i in range(max_r + 1)]
-    home_dist = [round(home_run_counts.get(i, 0) / sims, 4) for i in range(max_r + 1)]
-
     # Pitcher names for display
     away_pitcher = pregame_data.get("away", {}).get("pitcher") or {}
     home_pitcher = pregame_data.get("home", {}).get("pitcher") or {}
 
     return {
-        "sims": sims,
+        "method": "exact",
         "nrfi_pct": nrfi_pct,
         "yrfi_pct": yrfi_pct,
-        "away_score_pct": round(away_scores / sims, 4),
-        "home_score_pct": round(home_scores / sims, 4),
-        "away_exp_runs": round(away_total_runs / sims, 2),
-        "home_exp_runs": round(home_total_runs / sims, 2),
-        "total_exp_runs": round((away_total_runs + home_total_runs) / sims, 2),
-        "away_run_dist": away_dist,
-        "home_run_dist": home_dist,
+        "away_score_pct": round(1 - away_clean, 4),
+        "home_score_pct": round(1 - home_clean, 4),
+        "away_exp_runs": round(away_exp, 2),
+        "home_exp_runs": round(home_exp, 2),
+        "total_exp_runs": round(away_exp + home_exp, 2),
+        "away_run_dist": [round(float(x), 4) for x in away_dist],
+        "home_run_dist": [round(float(x), 4) for x in home_dist],
         "away_pitcher_name": away_pitcher.get("name", ""),
         "home_pitcher_name": home_pitcher.get("name", ""),
     }
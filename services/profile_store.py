@@ -13,9 +13,11 @@ is missing/empty, so local development and cold deploys still work.
 
 import os
 import logging
+import threading
 
 import pandas as pd
-import psycopg
+
+from services import db_pool
 
 log = logging.getLogger(__name__)
 
@@ -30,10 +32,12 @@ def load_profile(table, parquet_path=None):
     Returns an empty DataFrame if neither source is available, so callers
     keep their existing league-average fallbacks.
     """
-    url = _db_url()
-    if url:
+    if _db_url():
         try:
-            with psycopg.connect(url, connect_timeout=10) as conn:
+            # Whole-table load at startup: no statement timeout.  No URL
+            # argument, so this shares the app pool (db_pool normalizes
+            # postgres:// to postgresql:// and keys pools on the result).
+            with db_pool.connection(statement_timeout_ms=0) as conn:
                 with conn.cursor() as cur:
                     cur.execute(f'SELECT * FROM "{table}"')
                     cols = [d[0] for d in cur.description]
@@ -55,3 +59,89 @@ def load_profile(table, parquet_path=None):
             log.warning("Parquet load of %s failed: %s", parquet_path, e)
 
     return pd.DataFrame()
+
+
+class ProfileIndex:
+    """Profile rows pre-grouped by (key columns, season) for O(1) lookups.
+
+    Feature builders used to boolean-mask the whole profile DataFrame on
+    every call (`df[(df.batter == id) & (df.vs_hand == h) & (df.season == s)]`).
+    This groups the rows once at load time:
+
+      * single-row profiles (one row per key per season, e.g. profile_batter)
+        store a dict record, read with `.get(col)` like a pandas row;
+      * multi-row profiles (e.g. one row per pitch type in
+        profile_pitcher_arsenal) pass `multi=True` and store the group's
+        DataFrame slice, so existing weighted-average code keeps working.
+
+    Keys are tuples of the key-column values, e.g. (batter_id, "ALL").
+    """
+
+    def __init__(self, df, keys, season_col="season", multi=False):
+        self.df = df if df is not None else pd.DataFrame()
+        self._keys = list(keys)
+        self._multi = multi
+        self._index = {}
+        if df is None or df.empty:
+            return
+
+        if multi:
+            for group_key, group in df.groupby(self._keys + [season_col], sort=False):
+                *key, season = group_key
+                self._index.setdefault(_norm_key(key), {})[int(season)] = group
+        else:
+            # First row per (key, season) wins, matching the old `.iloc[0]`
+            for rec in df.to_dict("records"):
+                key = _norm_key(rec[c] for c in self._keys)
+                self._index.setdefault(key, {}).setdefault(int(rec[season_col]), rec)
+
+    def __bool__(self):
+        return bool(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def seasons(self, key):
+        """Seasons available for a key, most recent first."""
+        return sorted(self._index.get(key, {}), reverse=True)
+
+    def get(self, key, season):
+        """Rows for exactly this key and season, or None."""
+        return self._index.get(key, {}).get(season)
+
+    def latest(self, key):
+        """Rows for the most recent season on file for this key, or None."""
+        by_season = self._index.get(key)
+        if not by_season:
+            return None
+        return by_season[max(by_season)]
+
+    def get_or_latest(self, key, season):
+        """Rows for `season`, falling back to the most recent season on file."""
+        rows = self.get(key, season)
+        return rows if rows is not None else self.latest(key)
+
+
+_INDEXES = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def load_profile_index(table, parquet_path, keys, multi=False):
+    """load_profile + ProfileIndex, built once per process per index shape.
+
+    Services that read the same profile table with the same keys
+    (matchup_predict and game_simulation both use profile_pitcher_arsenal)
+    share one copy; a different `keys`/`multi` gets its own index.
+    """
+    cache_key = (table, tuple(keys), bool(multi))
+    with _INDEX_LOCK:
+        idx = _INDEXES.get(cache_key)
+        if idx is None:
+            idx = ProfileIndex(load_profile(table, parquet_path), keys, multi=multi)
+            _INDEXES[cache_key] = idx
+        return idx
+
+
+def _norm_key(values):
+    """Tuple key with NumPy scalars unwrapped so plain-int lookups match."""
+    return tuple(v.item() if hasattr(v, "item") else v for v in values)
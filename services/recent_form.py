@@ -2,26 +2,20 @@
 Recent form service — computes rolling 14-day stats for batters and pitchers.
 
 Used at prediction time to capture hot/cold streaks.
-Queries PostgreSQL directly for the most recent data.
+Reads the nightly materialized player_recent_form table when it covers the
+requested date, else aggregates statcast_pitches in PostgreSQL directly.
 """
 
-import os
 import logging
 from datetime import date, timedelta
 from functools import lru_cache
 
-import psycopg
+from services import db_pool
+from services.ttl_cache import get_cache
 
 log = logging.getLogger(__name__)
 
 
-def _db_url():
-    url = os.environ.get("DATABASE_URL") or os.environ.get("DATABASE_URL_PG") or ""
-    if not url:
-        raise RuntimeError("Missing DATABASE_URL env var")
-    return url
-
-
 # League-average fallbacks for recent form features
 LEAGUE_AVG_BATTER_R14 = {
     "bat_r14_k_pct": 0.225,
@@ -49,10 +43,8 @@ MIN_PITCHES = 40
 RELIABLE_PA = 25
 
 
-def _query_batter_form(batter_id, start_date, end_date):
-    """Query rolling batter stats from statcast_pitches."""
-    sql = """
-    SELECT
+# Aggregates shared by the single-player and batch queries
+_BATTER_AGG = """
         COUNT(*) FILTER (WHERE events IS NOT NULL AND events != '') AS pa,
         COUNT(*) AS pitches,
         SUM(CASE WHEN events IN ('strikeout','strikeout_double_play') THEN 1 ELSE 0 END) AS ks,
@@ -76,26 +68,9 @@ def _query_batter_form(batter_id, start_date, end_date):
             'grounded_into_double_play','double_play','fielders_choice',
             'fielders_choice_out','force_out','field_error','sac_fly'
         ) THEN 1 ELSE 0 END) AS bip
-    FROM statcast_pitches
-    WHERE batter = %s
-      AND game_date BETWEEN %s AND %s
-      AND game_type = 'R'
-    """
-    with psycopg.connect(_db_url(), connect_timeout=5) as conn:
-        conn.execute("SET statement_timeout = '3000'")  # 3s query timeout
-        with conn.cursor() as cur:
-            cur.execute(sql, (batter_id, start_date, end_date))
-            row = cur.fetchone()
-            if not row:
-                return None
-            cols = [d[0] for d in cur.description]
-            return dict(zip(cols, row))
-
+"""
 
-def _query_pitcher_form(pitcher_id, start_date, end_date):
-    """Query rolling pitcher stats from statcast_pitches."""
-    sql = """
-    SELECT
+_PITCHER_AGG = """
         COUNT(*) FILTER (WHERE events IS NOT NULL AND events != '') AS pa,
         COUNT(*) AS pitches,
         SUM(CASE WHEN events IN ('strikeout','strikeout_double_play') THEN 1 ELSE 0 END) AS ks,
@@ -113,20 +88,84 @@ def _query_pitcher_form(pitcher_id, start_date, end_date):
             'foul','foul_bunt','hit_into_play'
         ) THEN 1 ELSE 0 END) AS chases,
         AVG(estimated_woba_using_speedangle) AS xwoba
+"""
+
+
+def _query_form_batch(role, player_ids, start_date, end_date):
+    """One GROUP BY over statcast_pitches for many players.
+
+    Returns {player_id: raw aggregate row}; players with no pitches in the
+    window are absent.
+    """
+    col, agg = ("batter", _BATTER_AGG) if role == "batter" else ("pitcher", _PITCHER_AGG)
+    sql = f"""
+    SELECT {col} AS player_id, {agg}
     FROM statcast_pitches
-    WHERE pitcher = %s
+    WHERE {col} = ANY(%s)
       AND game_date BETWEEN %s AND %s
       AND game_type = 'R'
+    GROUP BY {col}
     """
-    with psycopg.connect(_db_url(), connect_timeout=5) as conn:
-        conn.execute("SET statement_timeout = '3000'")  # 3s query timeout
+    with db_pool.connection(statement_timeout_ms=5000) as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, (pitcher_id, start_date, end_date))
-            row = cur.fetchone()
-            if not row:
-                return None
+            cur.execute(sql, (list(player_ids), start_date, end_date))
             cols = [d[0] for d in cur.description]
-            return dict(zip(cols, row))
+            out = {}
+            for row in cur.fetchall():
+                raw = dict(zip(cols, row))
+                out[int(raw.pop("player_id"))] = raw
+            return out
+
+
+# Materialized rolling form, maintained nightly by
+# scripts/game_prediction/build_recent_form_table.py
+FORM_TABLE = "player_recent_form"
+FORM_BUILDS_TABLE = "player_recent_form_builds"
+
+_built_dates = get_cache("recent_form.materialized", max_entries=16, default_ttl=10 * 60)
+
+
+def _is_materialized(as_of, window_days):
+    """Whether the nightly job has built rows for (as_of, window_days)."""
+    key = (str(as_of), window_days)
+    built = _built_dates.get(key)
+    if built is None:
+        try:
+            with db_pool.connection(statement_timeout_ms=2000) as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"SELECT 1 FROM {FORM_BUILDS_TABLE} WHERE as_of_date = %s AND window_days = %s",
+                        (as_of, window_days),
+                    )
+                    built = cur.fetchone() is not None
+        except Exception as e:
+            log.debug("Materialized form check failed: %s", e)
+            built = False
+        _built_dates.set(key, built)
+    return built
+
+
+def _read_materialized(role, player_ids, as_of, window_days):
+    """Indexed read of prebuilt rows: {player_id: raw aggregate row}.
+
+    Players absent from a built date threw no pitches in the window.
+    """
+    sql = f"""
+    SELECT player_id, pitches, pa, ks, bbs, swings, whiffs, chase_opps, chases,
+           xwoba, barrels, bip
+    FROM {FORM_TABLE}
+    WHERE role = %s AND as_of_date = %s AND window_days = %s
+      AND player_id = ANY(%s)
+    """
+    with db_pool.connection(statement_timeout_ms=3000) as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, (role, as_of, window_days, list(player_ids)))
+            cols = [d[0] for d in cur.description]
+            out = {}
+            for row in cur.fetchall():
+                raw = dict(zip(cols, row))
+                out[int(raw.pop("player_id"))] = raw
+            return out
 
 
 def _safe_div(a, b):
@@ -180,30 +219,19 @@ def _set_cache(cache_key, val):
             _recent_form_cache.pop(k, None)
 
 
-def get_batter_recent_form(batter_id, reference_date=None, window_days=14):
-    """
-    Get rolling 14-day batter stats.
-    Returns dict with bat_r14_* keys, falling back to league avg if insufficient data.
-    """
+def _window(reference_date, window_days):
+    """(ref_date, start, end) for a window ending the day before ref_date."""
     if reference_date is None:
         reference_date = date.today()
     elif isinstance(reference_date, str):
         reference_date = date.fromisoformat(reference_date)
-
-    cache_key = ("bat", batter_id, str(reference_date))
-    cached = _cached_form(cache_key)
-    if cached is not None:
-        return cached
-
     end_date = reference_date - timedelta(days=1)  # exclude today (game in progress)
     start_date = end_date - timedelta(days=window_days - 1)
+    return reference_date, start_date, end_date
 
-    try:
-        raw = _query_batter_form(batter_id, start_date, end_date)
-    except Exception as e:
-        log.warning("Failed to query batter recent form for %s: %s", batter_id, e)
-        return dict(LEAGUE_AVG_BATTER_R14)
 
+def _batter_result(raw):
+    """bat_r14_* features from a raw aggregate row (league avg if too few pitches)."""
     if not raw or (raw.get("pitches") or 0) < MIN_PITCHES:
         return dict(LEAGUE_AVG_BATTER_R14)
 
@@ -217,34 +245,11 @@ def get_batter_recent_form(batter_id, reference_date=None, window_days=14):
         "bat_r14_chase_rate": _safe_div(raw["chases"], raw["chase_opps"]) if raw.get("chase_opps") else LEAGUE_AVG_BATTER_R14["bat_r14_chase_rate"],
     }
     result["_pa"] = pa  # expose sample size for caller-side regression
-    _set_cache(cache_key, result)
     return result
 
 
-def get_pitcher_recent_form(pitcher_id, reference_date=None, window_days=14):
-    """
-    Get rolling 14-day pitcher stats.
-    Returns dict with p_r14_* keys, falling back to league avg if insufficient data.
-    """
-    if reference_date is None:
-        reference_date = date.today()
-    elif isinstance(reference_date, str):
-        reference_date = date.fromisoformat(reference_date)
-
-    cache_key = ("pit", pitcher_id, str(reference_date))
-    cached = _cached_form(cache_key)
-    if cached is not None:
-        return cached
-
-    end_date = reference_date - timedelta(days=1)
-    start_date = end_date - timedelta(days=window_days - 1)
-
-    try:
-        raw = _query_pitcher_form(pitcher_id, start_date, end_date)
-    except Exception as e:
-        log.warning("Failed to query pitcher recent form for %s: %s", pitcher_id, e)
-        return dict(LEAGUE_AVG_PITCHER_R14)
-
+def _pitcher_result(raw):
+    """p_r14_* features from a raw aggregate row (league avg if too few pitches)."""
     if not raw or (raw.get("pitches") or 0) < MIN_PITCHES:
         return dict(LEAGUE_AVG_PITCHER_R14)
 
@@ -257,19 +262,69 @@ def get_pitcher_recent_form(pitcher_id, reference_date=None, window_days=14):
         "p_r14_chase_rate": _safe_div(raw["chases"], raw["chase_opps"]) if raw.get("chase_opps") else LEAGUE_AVG_PITCHER_R14["p_r14_chase_rate"],
     }
     result["_pa"] = pa  # expose sample size for caller-side regression
-    _set_cache(cache_key, result)
     return result
 
 
+def get_batter_recent_form(batter_id, reference_date=None, window_days=14):
+    """
+    Get rolling 14-day batter stats.
+    Returns dict with bat_r14_* keys, falling back to league avg if insufficient data.
+    """
+    form = get_batch_recent_form([batter_id], "batter", reference_date, window_days)
+    return form.get(batter_id) or dict(LEAGUE_AVG_BATTER_R14)
+
+
+def get_pitcher_recent_form(pitcher_id, reference_date=None, window_days=14):
+    """
+    Get rolling 14-day pitcher stats.
+    Returns dict with p_r14_* keys, falling back to league avg if insufficient data.
+    """
+    form = get_batch_recent_form([pitcher_id], "pitcher", reference_date, window_days)
+    return form.get(pitcher_id) or dict(LEAGUE_AVG_PITCHER_R14)
+
+
 def get_batch_recent_form(player_ids, role="batter", reference_date=None, window_days=14):
     """
     Batch query recent form for multiple players.
     Returns dict: {player_id: {feature_dict}}.
+
+    Cached players are served from the cache; everyone else comes from the
+    materialized table (or, if tonight's build is missing, one GROUP BY over
+    statcast_pitches), and every result (including league-average fallbacks
+    for thin samples) is cached.
     """
+    reference_date, start_date, end_date = _window(reference_date, window_days)
+    prefix, to_result, league_avg = (
+        ("bat", _batter_result, LEAGUE_AVG_BATTER_R14) if role == "batter"
+        else ("pit", _pitcher_result, LEAGUE_AVG_PITCHER_R14)
+    )
+
     results = {}
+    missing = []
     for pid in player_ids:
-        if role == "batter":
-            results[pid] = get_batter_recent_form(pid, reference_date, window_days)
+        if pid is None or pid in results:
+            continue
+        cached = _cached_form((prefix, pid, str(reference_date)))
+        if cached is not None:
+            results[pid] = cached
         else:
-            results[pid] = get_pitcher_recent_form(pid, reference_date, window_days)
+            missing.append(pid)
+            results[pid] = None
+
+    if missing:
+        try:
+            ids = [int(pid) for pid in missing]
+            if _is_materialized(reference_date, window_days):
+                raw_by_id = _read_materialized(role, ids, reference_date, window_days)
+            else:
+                raw_by_id = _query_form_batch(role, ids, start_date, end_date)
+        except Exception as e:
+            log.warning("Failed to batch query %s recent form (%d players): %s", role, len(missing), e)
+            for pid in missing:
+                results[pid] = dict(league_avg)
+            return results
+        for pid in missing:
+            result = to_result(raw_by_id.get(int(pid)))
+            _set_cache((prefix, pid, str(reference_date)), result)
+            results[pid] = result
     return results
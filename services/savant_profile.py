@@ -1,15 +1,5 @@
 # services/savant_profile.py
-import os
-import psycopg
-
-
-def _db_url() -> str:
-    url = os.getenv("DATABASE_URL")
-    if not url:
-        raise RuntimeError("DATABASE_URL is not set")
-    if url.startswith("postgres://"):
-        url = url.replace("postgres://", "postgresql://", 1)
-    return url
+from services import db_pool
 
 
 def _as_float(x, default=None):
@@ -102,7 +92,7 @@ def get_player_savant_profile(player_id: int, season: int, min_pa: int = 1) -> d
     LIMIT 1;
     """
 
-    with psycopg.connect(_db_url()) as conn:
+    with db_pool.connection() as conn:
         with conn.cursor() as cur:
             cur.execute(sql, (season, min_pa, player_id))
             row = cur.fetchone()
@@ -1,5 +1,6 @@
 # services/spray_db.py
 import os
+from contextlib import contextmanager
 from datetime import date
 
 # Support psycopg3 or psycopg2 (matches your other DB helpers)
@@ -27,12 +28,21 @@ def _db_url() -> str:
     return url
 
 
-def _get_conn():
+@contextmanager
+def _connect():
     url = _db_url()
     if _PSYCOPG3 and psycopg is not None:
-        return psycopg.connect(url)
+        from services import db_pool
+        with db_pool.connection(url) as conn:
+            yield conn
+        return
     if psycopg2 is not None:
-        return psycopg2.connect(url)
+        conn = psycopg2.connect(url)
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
     raise RuntimeError("Neither psycopg3 nor psycopg2 is installed")
 
 
@@ -94,8 +104,7 @@ def fetch_player_spray(player_id: int, season: int | None = None, limit: int = 1
     """
     params_no_date = [player_id, limit]
 
-    conn = _get_conn()
-    try:
+    with _connect() as conn:
         if _PSYCOPG3:
             cur = conn.cursor()
         else:
@@ -143,8 +152,3 @@ def fetch_player_spray(player_id: int, season: int | None = None, limit: int = 1
             })
 
         return out
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
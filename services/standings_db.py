@@ -1,18 +1,8 @@
 # services/standings_db.py
 from __future__ import annotations
-import os
 import urllib.request
 import json
-import psycopg
-
-
-def _db_url() -> str:
-    url = os.getenv("DATABASE_URL")
-    if not url:
-        raise RuntimeError("DATABASE_URL is not set")
-    if url.startswith("postgres://"):
-        url = url.replace("postgres://", "postgresql://", 1)
-    return url
+from services import db_pool
 
 
 def fetch_standings_ranked(season: int) -> list[dict]:
@@ -41,7 +31,7 @@ def fetch_standings_ranked(season: int) -> list[dict]:
     ORDER BY s.league, s.division, s.division_rank NULLS LAST, s.pct DESC;
     """
 
-    with psycopg.connect(_db_url()) as conn:
+    with db_pool.connection() as conn:
         with conn.cursor() as cur:
             cur.execute(sql, (season,))
             cols = [d.name for d in cur.description]
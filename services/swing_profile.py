@@ -3,17 +3,7 @@
 Swing Profile service — computes bat path / batted ball metrics
 from statcast_pitches for a given batter + season.
 """
-import os
-import psycopg
-
-
-def _db_url() -> str:
-    url = os.getenv("DATABASE_URL")
-    if not url:
-        raise RuntimeError("DATABASE_URL is not set")
-    if url.startswith("postgres://"):
-        url = url.replace("postgres://", "postgresql://", 1)
-    return url
+from services import db_pool
 
 
 def get_swing_profile(player_id: int, season: int) -> dict:
@@ -71,7 +61,7 @@ def get_swing_profile(player_id: int, season: int) -> dict:
     """
 
     try:
-        with psycopg.connect(_db_url()) as conn:
+        with db_pool.connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(sql, (player_id, season))
                 rows = cur.fetchall()
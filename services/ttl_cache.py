@@ -0,0 +1,207 @@
+# services/ttl_cache.py
+"""
+Bounded, instrumented in-memory caches shared by the service modules.
+
+Every module-level cache in the app used to be a plain dict that only ever
+grew: stale entries were ignored but never dropped, so a worker that served
+a day of live games held every feed it had ever fetched.  `TTLCache` keeps
+the same get/set shape but
+
+- expires entries on their own TTL (set per entry, with a per-cache default)
+- evicts least-recently-used entries past `max_entries` or `max_bytes`
+- counts hits, misses, expirations and evictions
+
+Caches are registered by name so `cache_stats()` (served at
+/api/cache-stats) can report on all of them at once.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+# Returned by `get` when the key is absent; lets callers cache None values.
+MISSING = object()
+
+
+def approx_size(value: Any) -> int:
+    """Rough in-memory footprint of a cached value, in bytes.
+
+    JSON-shaped payloads (the MLB feeds) are measured by their serialized
+    length, which tracks their real size closely and is cheap in C.  Anything
+    else (DataFrames, arrays) uses its own byte count or sys.getsizeof.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            return int(memory_usage(deep=True).sum())
+        except Exception:
+            pass
+    try:
+        return len(json.dumps(value, default=str))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry TTLs and hit/miss counters.
+
+    Args:
+        name: registry name, shown in `cache_stats()`.
+        max_entries: LRU bound on the number of entries.
+        max_bytes: optional bound on the summed `approx_size` of values.
+        default_ttl: seconds an entry lives when `set` is given no ttl;
+            None means entries only leave through eviction.
+        size_fn: override for `approx_size`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 512,
+        max_bytes: Optional[int] = None,
+        default_ttl: Optional[float] = 300,
+        size_fn: Optional[Callable[[Any], int]] = None,
+    ):
+        self.name = name
+        self.max_entries = int(max_entries)
+        self.max_bytes = int(max_bytes) if max_bytes else None
+        self.default_ttl = default_ttl
+        self._size_fn = size_fn or approx_size
+        # key -> (value, expires_at or None, size)
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.time()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            value, expires_at, _ = item
+            if expires_at is not None and now >= expires_at:
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None,
+            size: Optional[int] = None) -> None:
+        """Store `value`; `ttl` overrides the cache default for this entry.
+
+        `size` lets callers that already know the payload size (e.g. the
+        response body length) skip the estimate.
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = (time.time() + float(ttl)) if ttl is not None else None
+        if size is None:
+            size = self._size_fn(value) if self.max_bytes else 0
+        with self._lock:
+            if key in self._data:
+                self._drop(key)
+            self._data[key] = (value, expires_at, int(size))
+            self._bytes += int(size)
+            self._evict()
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            self._drop(key)
+            return item[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            item = self._data.get(key)
+            return item is not None and (item[1] is None or time.time() < item[1])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "default_ttl": self.default_ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+            }
+
+    # -- internals (caller holds the lock) --
+
+    def _drop(self, key: Hashable) -> None:
+        _, _, size = self._data.pop(key)
+        self._bytes -= size
+
+    def _evict(self) -> None:
+        # Expired entries go first so live data is not pushed out by stale data
+        if len(self._data) > self.max_entries or self._over_bytes():
+            now = time.time()
+            for key in [k for k, (_, exp, _) in self._data.items()
+                        if exp is not None and now >= exp]:
+                self._drop(key)
+                self.expirations += 1
+        while self._data and (len(self._data) > self.max_entries or self._over_bytes()):
+            key = next(iter(self._data))
+            self._drop(key)
+            self.evictions += 1
+
+    def _over_bytes(self) -> bool:
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+
+# ----------------------------
+# Registry
+# ----------------------------
+_REGISTRY: Dict[str, TTLCache] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_cache(name: str, **kwargs) -> TTLCache:
+    """Return the cache registered as `name`, creating it on first use.
+
+    Keyword arguments are passed to `TTLCache` and only apply on creation.
+    """
+    with _REGISTRY_LOCK:
+        cache = _REGISTRY.get(name)
+        if cache is None:
+            cache = TTLCache(name, **kwargs)
+            _REGISTRY[name] = cache
+        return cache
+
+
+def cache_stats() -> List[Dict[str, Any]]:
+    """Stats for every registered cache, sorted by name."""
+    with _REGISTRY_LOCK:
+        caches = list(_REGISTRY.values())
+    return sorted((c.stats() for c in caches), key=lambda s: s["name"])
@@ -3,7 +3,8 @@ Umpire strike zone service.
 
 Loads per-umpire strike zone models and provides:
 - P(called strike) predictions for a given umpire + pitch location
-- Zone heatmap grids (per-umpire vs league average)
+- Zone heatmap grids (per-umpire vs league average), LRU-cached and
+  optionally pre-rendered to disk for the default view
 - Umpire profile data (tendencies from umpire_metrics.parquet)
 - Umpire list with key metrics
 - Per-game umpire report (all called pitches, correct/incorrect, ABS challenges)
@@ -16,11 +17,14 @@ import os
 import json
 import logging
 import math
+from functools import lru_cache
 
 import joblib
 import numpy as np
 import pandas as pd
-import requests
+
+from services import db_pool, http_client
+from services.ttl_cache import get_cache
 
 log = logging.getLogger(__name__)
 
@@ -28,6 +32,7 @@ _ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _MODEL_DIR = os.path.join(_ROOT, "models", "umpire_zone_models")
 _REGISTRY_PATH = os.path.join(_MODEL_DIR, "registry.json")
 _DATA_DIR = os.path.join(_ROOT, "data")
+_HEATMAP_DIR = os.path.join(_MODEL_DIR, "heatmaps")
 
 # Lazy-loaded globals
 _loaded = False
@@ -47,6 +52,14 @@ AVG_SZ_TOP = 3.4
 AVG_SZ_BOT = 1.6
 ZONE_X_HALF = 0.83
 
+# Heatmap view pre-rendered by prerender_heatmaps(), one slice per stand
+DEFAULT_PITCH_TYPE = "FF"
+PRERENDER_STANDS = ("R", "L")
+
+# (umpire_id, stand, pitch_type, balls, strikes) -> float16 P(strike) grid;
+# models only change on deploy, so entries only leave through LRU eviction
+_heatmap_cache = get_cache("umpire_zone.heatmap", max_entries=512, default_ttl=None)
+
 
 def _safe_float(val):
     """Convert to float, return None if NaN/None/invalid."""
@@ -62,14 +75,11 @@ def _safe_float(val):
 def _load_from_db(table_name: str):
     """Try loading data from a DB cache table. Returns DataFrame or None."""
     import os as _os
-    db_url = _os.environ.get("DATABASE_URL", "")
-    if not db_url:
+    if not _os.environ.get("DATABASE_URL", ""):
         return None
-    if db_url.startswith("postgres://"):
-        db_url = db_url.replace("postgres://", "postgresql://", 1)
     try:
-        import psycopg, json as _json
-        with psycopg.connect(db_url, connect_timeout=5) as conn:
+        import json as _json
+        with db_pool.connection(statement_timeout_ms=0) as conn:
             with conn.cursor() as cur:
                 cur.execute(f"SELECT season, data FROM {table_name}")
                 rows = cur.fetchall()
@@ -222,6 +232,116 @@ def predict_called_strike(hp_umpire_id, plate_x, plate_z, sz_top, sz_bot,
         return {"ok": False, "error": str(e)}
 
 
+_GRID_XS = np.linspace(GRID_X_MIN, GRID_X_MAX, GRID_SIZE)
+_GRID_ZS = np.linspace(GRID_Z_MIN, GRID_Z_MAX, GRID_SIZE)
+
+
+@lru_cache(maxsize=64)
+def _grid_features(stand, pitch_type, balls, strikes):
+    """Feature matrix for every heatmap grid point at one (stand, pitch type,
+    count); read-only, shared by every umpire's model."""
+    _load()
+
+    xx, zz = np.meshgrid(_GRID_XS, _GRID_ZS)
+    x = xx.ravel()
+    z = zz.ravel()
+    n_points = x.size
+    sz_range = AVG_SZ_TOP - AVG_SZ_BOT
+    grid_data = {
+        "plate_x": x,
+        "plate_z_norm": (z - AVG_SZ_BOT) / sz_range,
+        "dist_from_edge_x": np.abs(x) - ZONE_X_HALF,
+        "dist_from_edge_z_top": z - AVG_SZ_TOP,
+        "dist_from_edge_z_bot": AVG_SZ_BOT - z,
+        "pitch_type": pitch_type,
+        "stand": stand,
+        "balls": balls,
+        "strikes": strikes,
+    }
+
+    # Constant columns: categoricals straight from codes (-1 = unseen value,
+    # same as pd.Categorical), everything else broadcast
+    cat_categories = _registry.get("cat_categories", {})
+    cat_features = set(_registry.get("cat_features", []))
+    for col in ("pitch_type", "stand", "balls", "strikes"):
+        value = grid_data[col]
+        if col in cat_features and col in cat_categories:
+            categories = list(cat_categories[col])
+            code = categories.index(value) if value in categories else -1
+            grid_data[col] = pd.Categorical.from_codes(
+                np.full(n_points, code, dtype=np.int8), categories=categories)
+        else:
+            grid_data[col] = np.full(n_points, value)
+
+    features = _registry.get("features", list(grid_data.keys()))
+    return pd.DataFrame(grid_data)[features]
+
+
+def _predict_grid(model, stand, pitch_type, balls, strikes):
+    X_grid = _grid_features(stand, pitch_type, balls, strikes)
+    probs = model.predict_proba(X_grid)[:, 1].reshape(GRID_SIZE, GRID_SIZE)
+    return probs.astype(np.float16)
+
+
+def _is_individual(umpire_id):
+    return str(umpire_id) in _registry.get("umpires", {})
+
+
+def _model_path(umpire_id):
+    if umpire_id is None:
+        return os.path.join(_MODEL_DIR, "_league_avg.joblib")
+    return os.path.join(_MODEL_DIR, f"{umpire_id}.joblib")
+
+
+def _prerendered_path(umpire_id):
+    name = "_league_avg" if umpire_id is None else str(umpire_id)
+    return os.path.join(_HEATMAP_DIR, f"{name}.npy")
+
+
+def _load_prerendered(umpire_id, stand):
+    """Default-view grid written by prerender_heatmaps, if it is at least as
+    new as the model it was rendered from."""
+    path = _prerendered_path(umpire_id)
+    try:
+        if os.path.getmtime(path) < os.path.getmtime(_model_path(umpire_id)):
+            return None
+        grids = np.load(path)
+        return grids[PRERENDER_STANDS.index(stand)]
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _heatmap_grid(umpire_id, stand, pitch_type, balls, strikes):
+    """float16 P(called strike) grid for an umpire (None = league average).
+
+    Served from the LRU cache, then the pre-rendered default view, then by
+    running the model.  Umpires without their own model share the league
+    grid.
+    """
+    if umpire_id is not None and not _is_individual(umpire_id):
+        umpire_id = None
+    key = (umpire_id, stand, pitch_type, balls, strikes)
+    grid = _heatmap_cache.get(key)
+    if grid is not None:
+        return grid
+
+    if pitch_type == DEFAULT_PITCH_TYPE and balls == 0 and strikes == 0 \
+            and stand in PRERENDER_STANDS:
+        grid = _load_prerendered(umpire_id, stand)
+    if grid is None:
+        model = _league_model if umpire_id is None else _get_model(umpire_id)
+        if model is None:
+            return None
+        grid = _predict_grid(model, stand, pitch_type, balls, strikes)
+
+    _heatmap_cache.set(key, grid)
+    return grid
+
+
+def _grid_to_lists(grid):
+    return np.round(grid.astype(np.float64), 4).tolist()
+
+
 def umpire_zone_heatmap(hp_umpire_id, stand="R", pitch_type=None,
                         balls=None, strikes=None):
     """Generate a heatmap grid of P(called strike) for an umpire.
@@ -231,82 +351,37 @@ def umpire_zone_heatmap(hp_umpire_id, stand="R", pitch_type=None,
     """
     _load()
 
-    ump_model = _get_model(hp_umpire_id)
-    if ump_model is None:
-        return {"ok": False, "error": "No model available"}
-
-    # Build meshgrid
-    xs = np.linspace(GRID_X_MIN, GRID_X_MAX, GRID_SIZE)
-    zs = np.linspace(GRID_Z_MIN, GRID_Z_MAX, GRID_SIZE)
-    xx, zz = np.meshgrid(xs, zs)
-    n_points = xx.size
-
     # Default values
-    pt = pitch_type or "FF"
+    pt = pitch_type or DEFAULT_PITCH_TYPE
     b = balls if balls is not None else 0
     s = strikes if strikes is not None else 0
 
-    # Build feature grid
-    sz_range = AVG_SZ_TOP - AVG_SZ_BOT
-    grid_data = {
-        "plate_x": xx.ravel(),
-        "plate_z_norm": (zz.ravel() - AVG_SZ_BOT) / sz_range,
-        "dist_from_edge_x": np.abs(xx.ravel()) - ZONE_X_HALF,
-        "dist_from_edge_z_top": zz.ravel() - AVG_SZ_TOP,
-        "dist_from_edge_z_bot": AVG_SZ_BOT - zz.ravel(),
-        "pitch_type": [pt] * n_points,
-        "stand": [stand] * n_points,
-        "balls": [b] * n_points,
-        "strikes": [s] * n_points,
-    }
-    grid_df = pd.DataFrame(grid_data)
-
-    # Apply categorical encoding
-    cat_categories = _registry.get("cat_categories", {})
-    for col in _registry.get("cat_features", []):
-        if col in cat_categories:
-            grid_df[col] = pd.Categorical(
-                grid_df[col], categories=cat_categories[col]
-            )
-
-    features = _registry.get("features", list(grid_data.keys()))
-    X_grid = grid_df[features]
-
     try:
-        # Umpire-specific predictions
-        ump_probs = ump_model.predict_proba(X_grid)[:, 1].reshape(GRID_SIZE, GRID_SIZE)
-
-        # League-average predictions
-        league_probs = None
-        if _league_model is not None:
-            league_probs = _league_model.predict_proba(X_grid)[:, 1].reshape(
-                GRID_SIZE, GRID_SIZE
-            )
+        # Cache and pre-rendered grids first; a model is only loaded on a
+        # miss, and None means neither this umpire nor the league has one
+        ump_probs = _heatmap_grid(hp_umpire_id, stand, pt, b, s)
+        if ump_probs is None:
+            return {"ok": False, "error": "No model available"}
+        league_probs = _heatmap_grid(None, stand, pt, b, s)
 
         result = {
             "ok": True,
-            "grid_x": xs.tolist(),
-            "grid_z": zs.tolist(),
-            "p_strike": [[round(float(v), 4) for v in row] for row in ump_probs],
+            "grid_x": _GRID_XS.tolist(),
+            "grid_z": _GRID_ZS.tolist(),
+            "p_strike": _grid_to_lists(ump_probs),
             "stand": stand,
             "pitch_type": pt,
             "balls": b,
             "strikes": s,
             "sz_top": AVG_SZ_TOP,
             "sz_bot": AVG_SZ_BOT,
-            "model_type": ("individual"
-                           if str(hp_umpire_id) in _registry.get("umpires", {})
-                           else "league_avg"),
+            "model_type": "individual" if _is_individual(hp_umpire_id) else "league_avg",
         }
 
         if league_probs is not None:
-            result["p_strike_league_avg"] = [
-                [round(float(v), 4) for v in row] for row in league_probs
-            ]
-            diff = ump_probs - league_probs
-            result["p_strike_diff"] = [
-                [round(float(v), 4) for v in row] for row in diff
-            ]
+            result["p_strike_league_avg"] = _grid_to_lists(league_probs)
+            diff = ump_probs.astype(np.float32) - league_probs.astype(np.float32)
+            result["p_strike_diff"] = _grid_to_lists(diff)
 
         return result
 
@@ -315,6 +390,45 @@ def umpire_zone_heatmap(hp_umpire_id, stand="R", pitch_type=None,
         return {"ok": False, "error": str(e)}
 
 
+def prerender_heatmaps(out_dir=None):
+    """Render the default heatmap view (PRERENDER_STANDS, four-seamer, 0-0)
+    for the league model and every individual umpire model.
+
+    Writes one float16 (len(PRERENDER_STANDS), GRID_SIZE, GRID_SIZE) .npy per
+    model; returns the number of files written.
+    """
+    _load()
+    out_dir = out_dir or _HEATMAP_DIR
+    os.makedirs(out_dir, exist_ok=True)
+
+    targets = [None] + sorted(_registry.get("umpires", {}))
+    written = 0
+    for umpire_id in targets:
+        if umpire_id is None:
+            model = _league_model
+        else:
+            umpire_id = int(umpire_id)
+            model = _get_model(umpire_id)
+            # Drop each umpire model once rendered; the app loads its own
+            _umpire_models.pop(umpire_id, None)
+            if model is _league_model:
+                continue  # model file missing; the app falls back too
+        if model is None:
+            continue
+        try:
+            grids = np.stack([
+                _predict_grid(model, stand, DEFAULT_PITCH_TYPE, 0, 0)
+                for stand in PRERENDER_STANDS
+            ])
+        except Exception as e:
+            log.warning("Could not pre-render heatmap for umpire %s: %s", umpire_id, e)
+            continue
+        path = os.path.join(out_dir, os.path.basename(_prerendered_path(umpire_id)))
+        np.save(path, grids)
+        written += 1
+    return written
+
+
 def umpire_profile(hp_umpire_id, season=None):
     """Return umpire profile data including tendencies and model info.
 
@@ -512,10 +626,7 @@ def umpire_list(season=None):
 def umpire_bio(hp_umpire_id):
     """Fetch umpire bio from MLB API."""
     try:
-        resp = requests.get(
-            f"https://statsapi.mlb.com/api/v1/people/{hp_umpire_id}",
-            timeout=10,
-        )
+        resp = http_client.get(f"https://statsapi.mlb.com/api/v1/people/{hp_umpire_id}")
         if resp.status_code != 200:
             return {"ok": False, "error": "MLB API error"}
         people = resp.json().get("people", [])
@@ -604,7 +715,7 @@ def umpire_tendency_heatmap(hp_umpire_id, season=None, stand=None):
     for game_pk in game_pks:
         try:
             url = f"https://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live"
-            resp = requests.get(url, timeout=15)
+            resp = http_client.get(url)
             if resp.status_code != 200:
                 continue
             feed = resp.json()
@@ -5,18 +5,15 @@ from __future__ import annotations
 import json
 import math
 import logging
-import os
 import requests as _requests
 from datetime import datetime, timezone
 
+from services import db_pool
+from services.ttl_cache import get_cache
 from services.venue_meta import get_venue_meta
 
-import psycopg as _psycopg
-
 log = logging.getLogger(__name__)
 
-_DB_URL = lambda: os.environ.get("DATABASE_URL") or os.environ.get("DATABASE_URL_PG") or ""
-
 _ROOF_TABLE_CREATED = False
 
 def _ensure_roof_table(cur) -> None:
@@ -34,7 +31,7 @@ def _ensure_roof_table(cur) -> None:
 def load_roof_overrides() -> dict:
     """Load roof overrides from PostgreSQL; returns {str(game_pk): bool}."""
     try:
-        with _psycopg.connect(_DB_URL(), connect_timeout=10) as conn:
+        with db_pool.connection() as conn:
             with conn.cursor() as cur:
                 _ensure_roof_table(cur)
                 cur.execute("SELECT game_pk, roof_open FROM roof_overrides")
@@ -47,7 +44,7 @@ def load_roof_overrides() -> dict:
 def save_roof_overrides(overrides: dict) -> None:
     """Save roof overrides to PostgreSQL."""
     try:
-        with _psycopg.connect(_DB_URL(), connect_timeout=10) as conn:
+        with db_pool.connection() as conn:
             with conn.cursor() as cur:
                 _ensure_roof_table(cur)
                 cur.execute("DELETE FROM roof_overrides")
@@ -60,8 +57,9 @@ def save_roof_overrides(overrides: dict) -> None:
         log.error("Failed to save roof overrides: %s", e)
 
 
-# Module-level cache: (venue_id, date_str, hour) → result dict
-_cache: dict = {}
+# Module-level cache: (venue_id, date_str, hour) → result dict.
+# Forecasts drift through the day, so entries are refreshed every half hour.
+_cache = get_cache("weather", max_entries=256, default_ttl=60 * 30)
 
 # WMO weather code → human condition label
 _WMO = {
@@ -374,8 +372,9 @@ def fetch_game_weather(venue_id, game_datetime_str, game_pk=None):
 
     # Include game_pk in cache key for retractable stadiums so roof overrides are respected
     cache_key = (venue_id, date_str, hour, game_pk if is_retractable else None)
-    if cache_key in _cache:
-        return _cache[cache_key]
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     # Call Open-Meteo API
     try:
@@ -425,7 +424,7 @@ def fetch_game_weather(venue_id, game_datetime_str, game_pk=None):
             "bearing":     venue.get("bearing", 180),
             "impact":      impact,
         }
-        _cache[cache_key] = result
+        _cache.set(cache_key, result)
         return result
 
     except Exception as e:
@@ -0,0 +1,50 @@
+import numpy as np
+
+from services import matchup_predict, recent_form
+
+
+class _FakeModel:
+    def predict_proba(self, X):
+        n = len(matchup_predict.CLASSES)
+        return np.full((len(X), n), 1.0 / n)
+
+
+def _patch_model(monkeypatch):
+    monkeypatch.setattr(matchup_predict, "_model", _FakeModel())
+    monkeypatch.setattr(matchup_predict, "_meta",
+                        {"numeric_features": ["x"], "categorical_features": []})
+    monkeypatch.setattr(matchup_predict, "_assemble_features",
+                        lambda ctx, pitcher_cache: ({"x": 1.0}, []))
+    monkeypatch.setattr(matchup_predict, "_get_pitch_usage", lambda *a: [])
+
+    calls = []
+
+    def fake_batch(player_ids, role="batter", **kw):
+        calls.append((role, list(player_ids)))
+        return {pid: {"role": role} for pid in player_ids}
+
+    monkeypatch.setattr(recent_form, "get_batch_recent_form", fake_batch)
+    return calls
+
+
+def test_batch_prefetches_recent_form_with_pitcher_in_context(monkeypatch):
+    calls = _patch_model(monkeypatch)
+
+    results = matchup_predict.predict_matchups_batch(
+        [{"batter_id": 1}, {"batter_id": 2}, {"batter_id": 3}],
+        context={"pitcher_id": 99},
+    )
+
+    assert all(r["ok"] for r in results)
+    assert calls == [("batter", [1, 2, 3]), ("pitcher", [99, 99, 99])]
+
+
+def test_batch_prefetches_recent_form_with_batter_in_context(monkeypatch):
+    calls = _patch_model(monkeypatch)
+
+    matchup_predict.predict_matchups_batch(
+        [{"pitcher_id": 10}, {"pitcher_id": 11, "pit_r14": {"k": 1}}],
+        context={"batter_id": 5},
+    )
+
+    assert calls == [("batter", [5, 5]), ("pitcher", [10])]